@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Compare per-call, prepared, targeted and batched SHACL validation of example suites.
+
+Validates every example of the selected entities against the merged shapes
+graph passed straight to ``pyshacl.validate`` (shapes harvested on every
+call, data graph copied before RDFS inference), through a
+:class:`~fega_tools.rdf_utils.ShaclValidator` (shapes harvested once,
+inference in place), through one that prunes the shapes to the types of
+each example (targeted) and through its batched mode (several examples per
+pyshacl run), and reports the per-file cost of each and whether every file
+gets the same outcome.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from fega_tools.io import collect_candidate_json
+    from fega_tools.jsonld_utils import find_repo_root
+    from fega_tools.logging_utils import configure_logging
+    from fega_tools.rdf_utils import DEFAULT_SHACL_BATCH_SIZE, ShaclValidator
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_common import CATEGORIES, DEFAULT_ROOT, find_entity_dirs, positive_int
+
+    from validate_rdf_shacl import load_shapes, validate_file_shacl, validate_files_shacl
+except ModuleNotFoundError as exc:
+    msg = (
+        "ERROR: The helper package 'fega_tools' is not importable.\n"
+        "Make sure you have installed the repo in editable mode first. Run this from the repository root:\n"
+        "    pip install -e ."
+    )
+    raise ModuleNotFoundError(msg) from exc
+
+
+LOGGER = logging.getLogger(Path(__file__).stem)
+
+DEFAULT_ENTITY = "dataset"
+
+
+def _outcome(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Order-independent part of a result (violation order varies between runs)."""
+    return (
+        result["status"],
+        result["conforms"],
+        result["n_violations"],
+        sorted(result.get("errors", [])),
+    )
+
+
+def _best_of(
+    repeat: int,
+    validate: Callable[[], List[Dict[str, Any]]],
+) -> Tuple[float, List[Tuple[Any, ...]]]:
+    """Return ``(fastest seconds, outcomes)`` over *repeat* runs of *validate*."""
+    best = float("inf")
+    outcomes: List[Tuple[Any, ...]] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outcomes = [_outcome(result) for result in validate()]
+        best = min(best, time.perf_counter() - started)
+    return best, outcomes
+
+
+def benchmark_files(
+    files: Sequence[Path],
+    merged_shapes: Any,
+    registry: SchemaRegistry,
+    repeat: int,
+    batch_size: int = DEFAULT_SHACL_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """Time per-call, prepared, targeted and batched SHACL validation of *files*."""
+    started = time.perf_counter()
+    unpruned = ShaclValidator(merged_shapes, prune=False)
+    prepare_seconds = time.perf_counter() - started
+    validator = ShaclValidator(merged_shapes)
+    # Warm up lazy imports and the context materializer outside the timings.
+    validate_file_shacl(files[0], validator, registry)
+
+    per_call_seconds, per_call_outcomes = _best_of(
+        repeat, lambda: [validate_file_shacl(path, merged_shapes, registry) for path in files]
+    )
+    prepared_seconds, prepared_outcomes = _best_of(
+        repeat, lambda: [validate_file_shacl(path, unpruned, registry) for path in files]
+    )
+    targeted_seconds, targeted_outcomes = _best_of(
+        repeat, lambda: [validate_file_shacl(path, validator, registry) for path in files]
+    )
+    validations = validator.validations
+    batched_seconds, batched_outcomes = _best_of(
+        repeat, lambda: validate_files_shacl(files, validator, registry, batch_size=batch_size)
+    )
+
+    def per_file(seconds: float) -> float:
+        return round(seconds / len(files), 4)
+
+    def speedup(seconds: float) -> Optional[float]:
+        return round(per_call_seconds / seconds, 2) if seconds > 0 else None
+
+    return {
+        "files": len(files),
+        "shapes": validator.n_shapes,
+        "shape_subsets": validator.stats()["shape_subsets"],
+        "prepare_seconds": round(prepare_seconds, 4),
+        "batch_size": batch_size,
+        "batched_runs": (validator.validations - validations) // repeat,
+        "per_call_seconds_per_file": per_file(per_call_seconds),
+        "prepared_seconds_per_file": per_file(prepared_seconds),
+        "targeted_seconds_per_file": per_file(targeted_seconds),
+        "batched_seconds_per_file": per_file(batched_seconds),
+        "speedup": speedup(prepared_seconds),
+        "targeted_speedup": speedup(targeted_seconds),
+        "batched_speedup": speedup(batched_seconds),
+        "identical_results": (
+            per_call_outcomes == prepared_outcomes == targeted_outcomes == batched_outcomes
+        ),
+    }
+
+
+def make_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="benchmark_shacl",
+        description=(
+            "Time SHACL validation of example suites with the shapes graph prepared "
+            "per call, once per run, pruned per example types, and with batched data graphs."
+        ),
+        epilog=(
+            "Examples:\n"
+            "  benchmark_shacl --shapes standards/rdf/healthdcat-ap/release-6.0.0/shacl/non-public-shapes-v6.ttl\n"
+            "  benchmark_shacl --all-entities --repeat 5 --shapes standards/rdf/healthdcat-ap"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help=f"Entity schema root (default: {DEFAULT_ROOT})",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--entity",
+        default=DEFAULT_ENTITY,
+        help=f"Entity directory name to benchmark (default: {DEFAULT_ENTITY}).",
+    )
+    target.add_argument(
+        "--all-entities",
+        action="store_true",
+        help="Benchmark the examples of every entity under --root.",
+    )
+    parser.add_argument(
+        "--shapes",
+        "-s",
+        nargs="+",
+        type=Path,
+        required=True,
+        help="SHACL shape files or directories (TTL, RDF/XML, JSON-LD, etc.).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=3,
+        help="Passes per strategy; the fastest is reported (default: 3).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=DEFAULT_SHACL_BATCH_SIZE,
+        help=f"Examples per SHACL run for the batched strategy (default: {DEFAULT_SHACL_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--verbosity",
+        "-v",
+        action="count",
+        default=0,
+        help="Increase log verbosity: -v for INFO, -vv for DEBUG.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmark and print the result as one JSON object."""
+    parser = make_arg_parser()
+    args = parser.parse_args(argv)
+    configure_logging(args.verbosity)
+
+    repo_root = find_repo_root(args.root.resolve())
+    registry = SchemaRegistry.from_repo(repo_root)
+    entity_dirs = find_entity_dirs(
+        args.root, None if args.all_entities else args.entity, require_schema=True
+    )
+    example_dirs = [
+        entity_dir / "examples" / category
+        for entity_dir in entity_dirs
+        for category in CATEGORIES
+        if (entity_dir / "examples" / category).is_dir()
+    ]
+    files = collect_candidate_json(example_dirs)
+    if not files:
+        LOGGER.error("No examples found under %s", args.root)
+        sys.exit(2)
+    try:
+        _shape_files, _shape_graphs, merged_shapes, _expected_types = load_shapes(args.shapes)
+    except (FileNotFoundError, RuntimeError) as exc:
+        LOGGER.error(str(exc))
+        sys.exit(2)
+
+    result = benchmark_files(files, merged_shapes, registry, args.repeat, args.batch_size)
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.exit(0 if result["identical_results"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Compare batched and per-term JSON-LD term-mapping probes.
+
+Runs ``validate_context_term_mappings`` on the schema properties of each
+selected entity, once with the single-node batched probe and once expanding
+every term separately, and reports timings and whether both agree.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    from fega_tools.jsonld_coverage import collect_schema_property_paths, load_json_object
+    from fega_tools.jsonld_utils import (
+        find_repo_root,
+        materialize_context,
+        validate_context_term_mappings,
+    )
+    from fega_tools.logging_utils import configure_logging
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_common import DEFAULT_ROOT, find_entity_dirs, positive_int
+except ModuleNotFoundError as exc:
+    msg = (
+        "ERROR: The helper package 'fega_tools' is not importable.\n"
+        "Make sure you have installed the repo in editable mode first. Run this from the repository root:\n"
+        "    pip install -e ."
+    )
+    raise ModuleNotFoundError(msg) from exc
+
+
+LOGGER = logging.getLogger(Path(__file__).stem)
+
+DEFAULT_ENTITY = "biomaterial"
+
+
+def _best_of(
+    repeat: int,
+    context: Any,
+    terms: Set[str],
+    batched: bool,
+) -> Tuple[float, List[str]]:
+    """Return ``(fastest seconds, errors)`` over *repeat* runs."""
+    best = float("inf")
+    errors: List[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        errors = validate_context_term_mappings(context, terms, batched=batched)
+        best = min(best, time.perf_counter() - started)
+    return best, errors
+
+
+def benchmark_entity(
+    entity_dir: Path,
+    registry: SchemaRegistry,
+    repo_root: Path,
+    repeat: int,
+) -> Dict[str, Any]:
+    """Time both probe strategies on one entity's schema properties."""
+    schema_path = entity_dir / "schema.json"
+    schema = load_json_object(schema_path, registry)
+    terms = set(collect_schema_property_paths(schema, schema_path.resolve(), registry, repo_root))
+    context = materialize_context(schema["@context"], schema_path, registry)
+
+    per_term_seconds, per_term_errors = _best_of(repeat, context, terms, batched=False)
+    batched_seconds, batched_errors = _best_of(repeat, context, terms, batched=True)
+    return {
+        "entity": entity_dir.name,
+        "terms": len(terms),
+        "per_term_seconds": round(per_term_seconds, 4),
+        "batched_seconds": round(batched_seconds, 4),
+        "speedup": round(per_term_seconds / batched_seconds, 1) if batched_seconds > 0 else None,
+        "identical_errors": per_term_errors == batched_errors,
+        "errors": len(batched_errors),
+    }
+
+
+def make_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="benchmark_term_mappings",
+        description=(
+            "Time batched against per-term JSON-LD term-mapping probes on "
+            "entity schema properties."
+        ),
+        epilog=(
+            "Examples:\n"
+            "  benchmark_term_mappings\n"
+            "  benchmark_term_mappings --all-entities --repeat 5"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help=f"Entity schema root (default: {DEFAULT_ROOT})",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--entity",
+        default=DEFAULT_ENTITY,
+        help=f"Entity directory name to benchmark (default: {DEFAULT_ENTITY}).",
+    )
+    target.add_argument(
+        "--all-entities",
+        action="store_true",
+        help="Benchmark every entity under --root.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=3,
+        help="Runs per strategy; the fastest is reported (default: 3).",
+    )
+    parser.add_argument(
+        "--verbosity",
+        "-v",
+        action="count",
+        default=0,
+        help="Increase log verbosity: -v for INFO, -vv for DEBUG.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmark and print one JSON object per entity."""
+    parser = make_arg_parser()
+    args = parser.parse_args(argv)
+    configure_logging(args.verbosity)
+
+    repo_root = find_repo_root(args.root.resolve())
+    registry = SchemaRegistry.from_repo(repo_root)
+    entity_dirs = find_entity_dirs(
+        args.root, None if args.all_entities else args.entity, require_schema=True
+    )
+    if not entity_dirs:
+        LOGGER.error("No entity schema directories found under %s", args.root)
+        sys.exit(2)
+
+    all_identical = True
+    for entity_dir in entity_dirs:
+        result = benchmark_entity(entity_dir, registry, repo_root, args.repeat)
+        all_identical = all_identical and result["identical_errors"]
+        sys.stdout.write(json.dumps(result) + "\n")
+    sys.exit(0 if all_identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""Run several FEGA example checks in one process over shared inputs.
+
+The separate validation scripts each walk ``schemas/entities``, build their own
+schema registry, reload the examples and rematerialize the same contexts. This
+runner builds those inputs once and passes them to every selected check:
+
+* one :class:`~fega_tools.schema_registry.SchemaRegistry`, so schema files
+  are parsed and ``@context`` documents materialized once for all checks;
+* one validation engine (Biovalidator client or local engine) for the
+  example suite and the frame round-trips;
+* the SHACL shapes, parsed and merged once;
+* parsed examples, shared through the process-wide document cache.
+
+Each check writes the same summary file as its own script, and the exit
+status is the worst status of all checks.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import json
+import logging
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    from fega_tools.biovalidator import DEFAULT_VALIDATOR_URL, add_client_arguments
+    from fega_tools.depgraph import DependencyGraph
+    from fega_tools.incremental import (
+        IncrementalRun,
+        add_incremental_arguments,
+        git_changed_paths,
+        load_previous_summary,
+    )
+    from fega_tools.jsonld_utils import find_repo_root
+    from fega_tools.local_validator import add_engine_arguments, engine_from_args
+    from fega_tools.logging_utils import configure_logging
+    from fega_tools.rdf_utils import add_rdf_store_arguments, rdf_store_from_args
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_cache import add_cache_arguments, cache_from_args
+    from fega_tools.validation_common import (
+        DEFAULT_ROOT,
+        DOCUMENT_CACHE,
+        positive_int,
+        write_json_summary,
+    )
+
+    import validate_examples
+    import validate_jsonld_contexts
+    import validate_jsonld_coverage
+    import validate_jsonld_frames
+    import validate_rdf_shacl
+    from fega_tools.jsonld_coverage import validate_jsonld_coverage as run_coverage
+except ModuleNotFoundError as exc:
+    msg = (
+        "ERROR: The helper package 'fega_tools' is not importable.\n"
+        "Make sure you have installed the repo in editable mode first. Run this from the repository root:\n"
+        "    pip install -e ."
+    )
+    raise ModuleNotFoundError(msg) from exc
+
+
+LOGGER = logging.getLogger(Path(__file__).stem)
+
+CHECKS = ("examples", "contexts", "coverage", "shacl", "frames")
+VALIDATOR_CHECKS = ("examples", "frames")
+
+CHECK_MODULES = {
+    "examples": validate_examples,
+    "contexts": validate_jsonld_contexts,
+    "coverage": validate_jsonld_coverage,
+    "shacl": validate_rdf_shacl,
+    "frames": validate_jsonld_frames,
+}
+
+
+# ---------------------------------------------------------------------------
+# Check stages
+# ---------------------------------------------------------------------------
+
+
+def _run_examples(args: argparse.Namespace, shared: Dict[str, Any]) -> Dict[str, Any]:
+    return validate_examples.validate_examples(
+        args.root,
+        args.entity,
+        shared["engine"],
+        jobs=args.jobs,
+        cache=shared["cache"],
+        incremental=shared["incremental"].get("examples"),
+    )
+
+
+def _run_contexts(args: argparse.Namespace, shared: Dict[str, Any]) -> Dict[str, Any]:
+    return validate_jsonld_contexts.validate_jsonld_contexts(
+        args.root,
+        args.entity,
+        registry=shared["registry"],
+        incremental=shared["incremental"].get("contexts"),
+    )
+
+
+def _run_coverage(args: argparse.Namespace, shared: Dict[str, Any]) -> Dict[str, Any]:
+    summary = run_coverage(
+        args.root,
+        args.entity,
+        repo_root=shared["repo_root"],
+        workers=args.workers,
+        registry=shared["registry"],
+        incremental=shared["incremental"].get("coverage"),
+    )
+    summary["timestamp"] = _dt.datetime.now(tz=_dt.timezone.utc).isoformat(
+        timespec="seconds"
+    )
+    return summary
+
+
+def _run_shacl(args: argparse.Namespace, shared: Dict[str, Any]) -> Dict[str, Any]:
+    entity = args.shacl_entity or args.entity
+    return validate_rdf_shacl.validate_rdf_shacl(
+        args.root,
+        entity,
+        args.shapes,
+        all_entities=entity is None,
+        include_shacl_reports=args.shacl_report,
+        registry=shared["registry"],
+        shapes=shared["shapes"],
+        incremental=shared["incremental"].get("shacl"),
+        batch_size=args.shacl_batch_size,
+        rdf_store=shared["rdf_store"],
+    )
+
+
+def _run_frames(args: argparse.Namespace, shared: Dict[str, Any]) -> Dict[str, Any]:
+    return validate_jsonld_frames.validate_jsonld_frames(
+        args.root,
+        args.entity,
+        shared["engine"],
+        workers=args.workers,
+        jobs=args.jobs,
+        registry=shared["registry"],
+        incremental=shared["incremental"].get("frames"),
+    )
+
+
+CHECK_RUNNERS: Dict[str, Callable[[argparse.Namespace, Dict[str, Any]], Dict[str, Any]]] = {
+    "examples": _run_examples,
+    "contexts": _run_contexts,
+    "coverage": _run_coverage,
+    "shacl": _run_shacl,
+    "frames": _run_frames,
+}
+
+
+def _check_status(check: str, summary: Optional[Dict[str, Any]]) -> int:
+    """Return the exit status the check's own script would use."""
+    if summary is None:
+        return 2
+    if check == "coverage" and summary["script_errors"]:
+        return 2
+    return 0 if summary["passed"] else 1
+
+
+def run_checks(
+    checks: Sequence[str],
+    args: argparse.Namespace,
+    shared: Dict[str, Any],
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Run *checks* in order over the *shared* inputs.
+
+    Returns one summary per check; a check that cannot run (missing inputs,
+    unreachable validator) is logged and mapped to None.
+    """
+    summaries: Dict[str, Optional[Dict[str, Any]]] = {}
+    for check in checks:
+        LOGGER.info("Running %s check", check)
+        started = time.perf_counter()
+        try:
+            summary = CHECK_RUNNERS[check](args, shared)
+        except (FileNotFoundError, RuntimeError, ValueError) as exc:
+            LOGGER.error("%s check: %s", check, exc)
+            summaries[check] = None
+            continue
+        CHECK_MODULES[check].log_results(summary)
+        LOGGER.info(
+            "%s check %s in %.2f s",
+            check,
+            "passed" if summary["passed"] else "failed",
+            time.perf_counter() - started,
+        )
+        summaries[check] = summary
+    return summaries
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def make_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="fega-check",
+        description=(
+            "Run the FEGA example checks in one process, sharing the schema registry, "
+            "materialized contexts, parsed examples, SHACL shapes and validator between them.\n"
+            "Each check writes its usual summary file."
+        ),
+        epilog=(
+            "Examples:\n"
+            "  fega-check --summary-dir .\n"
+            "  fega-check --checks contexts coverage --entity cohort -v\n"
+            "  fega-check --engine local --shacl-entity dataset --shapes "
+            "standards/rdf/healthdcat-ap/release-6.0.0/shacl/non-public-shapes-v6.ttl"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        choices=CHECKS,
+        help=(
+            f"Checks to run, in this order: {', '.join(CHECKS)} "
+            "(default: all; 'shacl' only when --shapes is given)."
+        ),
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help=f"Entity schema root (default: {DEFAULT_ROOT})",
+    )
+    parser.add_argument(
+        "--entity",
+        help="Check one entity by directory name, e.g. 'cohort' (default: all entities).",
+    )
+    parser.add_argument(
+        "--url",
+        "-u",
+        dest="validator_url",
+        default=DEFAULT_VALIDATOR_URL,
+        help=f"Biovalidator /validate endpoint (default: {DEFAULT_VALIDATOR_URL})",
+    )
+    add_engine_arguments(parser)
+    add_client_arguments(parser)
+    add_cache_arguments(parser)
+    add_incremental_arguments(parser)
+    parser.add_argument(
+        "--shapes",
+        "-s",
+        nargs="+",
+        type=Path,
+        help="SHACL shape files or directories for the 'shacl' check.",
+    )
+    parser.add_argument(
+        "--shacl-entity",
+        help="Entity for the 'shacl' check only, e.g. 'dataset' (default: --entity, or all entities).",
+    )
+    parser.add_argument(
+        "--shacl-report",
+        action="store_true",
+        help="Include raw pySHACL validation reports in the SHACL summary.",
+    )
+    parser.add_argument(
+        "--shacl-batch-size",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help="Validate up to N examples in one SHACL run (default: 1). Not combinable with --shacl-report.",
+    )
+    add_rdf_store_arguments(parser)
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=positive_int,
+        default=1,
+        help="Processes for the coverage and frame checks (default: 1).",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=1,
+        help="Number of validation requests kept in flight (default: 1).",
+    )
+    parser.add_argument(
+        "--summary-dir",
+        type=Path,
+        help="Optional directory where each check writes its summary file.",
+    )
+    parser.add_argument(
+        "--print-summary",
+        action="store_true",
+        default=False,
+        help="Print all summaries to stdout as one JSON object keyed by check (default: off).",
+    )
+    parser.add_argument(
+        "--verbosity",
+        "-v",
+        action="count",
+        default=0,
+        help="Increase log verbosity: -v for INFO, -vv for DEBUG.",
+    )
+    return parser
+
+
+def _selected_checks(parser: argparse.ArgumentParser, args: argparse.Namespace) -> List[str]:
+    """Return the requested checks in pipeline order."""
+    if args.checks is None:
+        return [check for check in CHECKS if check != "shacl" or args.shapes]
+    if "shacl" in args.checks and not args.shapes:
+        parser.error("the 'shacl' check requires --shapes")
+    return [check for check in CHECKS if check in args.checks]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the selected checks and exit with the worst check status."""
+    parser = make_arg_parser()
+    args = parser.parse_args(argv)
+    checks = _selected_checks(parser, args)
+    if args.shacl_batch_size > 1 and args.shacl_report:
+        parser.error("--shacl-report needs per-file SHACL runs; drop --shacl-batch-size")
+    if args.changed_since and args.summary_dir is None:
+        parser.error("--changed-since needs --summary-dir to find the previous summaries")
+    configure_logging(args.verbosity)
+    if "frames" in checks:
+        validate_jsonld_frames._suppress_third_party_debug()
+
+    repo_root = find_repo_root(args.root.resolve())
+    registry = SchemaRegistry.from_repo(repo_root)
+    shared: Dict[str, Any] = {
+        "repo_root": repo_root,
+        "registry": registry,
+        "engine": None,
+        "cache": None,
+        "shapes": None,
+        "rdf_store": None,
+        "incremental": {},
+    }
+    if args.changed_since:
+        try:
+            changed = git_changed_paths(repo_root, args.changed_since)
+        except RuntimeError as exc:
+            LOGGER.error(str(exc))
+            sys.exit(2)
+        LOGGER.info("%d file(s) changed since %s", len(changed), args.changed_since)
+        graph = DependencyGraph(repo_root, registry).load()
+        shared["incremental"] = {
+            check: IncrementalRun(
+                changed,
+                registry,
+                load_previous_summary(args.summary_dir, CHECK_MODULES[check].SUMMARY_FILENAME),
+                rev=args.changed_since,
+                graph=graph,
+            )
+            for check in checks
+        }
+
+    with ExitStack() as stack:
+        if any(check in VALIDATOR_CHECKS for check in checks):
+            shared["engine"] = stack.enter_context(
+                engine_from_args(
+                    args,
+                    repo_root,
+                    registry,
+                    pool_size=max(args.jobs, args.workers),
+                )
+            )
+            if "examples" in checks:
+                shared["cache"] = cache_from_args(args, registry)
+        if "shacl" in checks:
+            try:
+                shared["shapes"] = validate_rdf_shacl.load_shapes(args.shapes)
+                shared["rdf_store"] = rdf_store_from_args(args)
+            except (FileNotFoundError, RuntimeError, ValueError) as exc:
+                LOGGER.error(str(exc))
+                sys.exit(2)
+        summaries = run_checks(checks, args, shared)
+        if shared["cache"] is not None:
+            shared["cache"].prune()
+
+    LOGGER.debug("Schema registry usage: %s", registry.stats())
+    LOGGER.debug("Document cache usage: %s", DOCUMENT_CACHE.stats())
+
+    if args.summary_dir:
+        for check, summary in summaries.items():
+            if summary is not None:
+                write_json_summary(summary, args.summary_dir, CHECK_MODULES[check].SUMMARY_FILENAME)
+
+    if args.print_summary:
+        json.dump(summaries, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    sys.exit(max((_check_status(check, summary) for check, summary in summaries.items()), default=0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Query the dependency graph of FEGA schemas, contexts, frames and examples.
+
+Answers "what does a change here affect?" from the persisted reverse index in
+``build/dependency_graph.json`` instead of re-reading the repository. Nodes
+are files or JSON Pointers inside them (``file#/pointer``). With
+``--changed-since REV`` the query starts from every JSON Pointer that changed
+since the git revision, so editing one ``$defs`` entry only reports what uses
+that entry. ``--uses`` reverses the question: what the given nodes depend on.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+try:
+    from fega_tools.depgraph import (
+        DEFAULT_GRAPH_PATH,
+        DependencyGraph,
+        Node,
+        changed_pointers,
+        format_node,
+        parse_node,
+    )
+    from fega_tools.incremental import git_changed_paths, git_file_at
+    from fega_tools.jsonld_utils import find_repo_root
+    from fega_tools.logging_utils import configure_logging
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_common import DEFAULT_ROOT
+except ModuleNotFoundError as exc:
+    msg = (
+        "ERROR: The helper package 'fega_tools' is not importable.\n"
+        "Make sure you have installed the repo in editable mode first. Run this from the repository root:\n"
+        "    pip install -e ."
+    )
+    raise ModuleNotFoundError(msg) from exc
+
+
+LOGGER = logging.getLogger(Path(__file__).stem)
+
+
+# ---------------------------------------------------------------------------
+# Query nodes
+# ---------------------------------------------------------------------------
+
+def nodes_from_arguments(graph: DependencyGraph, values: Iterable[str]) -> List[Node]:
+    """Turn ``file[#/pointer]`` arguments into graph nodes."""
+    nodes = []
+    for value in values:
+        path, pointer = parse_node(value)
+        rel = graph.relative(Path(path))
+        if rel not in graph.files:
+            LOGGER.warning("'%s' is not indexed by the dependency graph", path)
+        nodes.append((rel, pointer))
+    return nodes
+
+
+def changed_nodes(graph: DependencyGraph, repo_root: Path, rev: str) -> List[Node]:
+    """Return the JSON Pointers of every indexed document changed since *rev*.
+
+    Added, removed and unparsable documents count as changed as a whole;
+    files the graph does not know about (such as Python code) are skipped.
+    """
+    nodes: List[Node] = []
+    for path in sorted(git_changed_paths(repo_root, rev)):
+        rel = graph.relative(path)
+        if rel not in graph.files and rel not in graph.reverse:
+            continue
+        old_content = git_file_at(repo_root, rev, path)
+        try:
+            old = json.loads(old_content) if old_content is not None else None
+            new = json.loads(path.read_bytes()) if path.is_file() else None
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            old = new = None
+        if old is None or new is None:
+            nodes.append((rel, ""))
+        else:
+            nodes.extend((rel, pointer) for pointer in changed_pointers(old, new))
+    return nodes
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def _entity(rel: str) -> Optional[str]:
+    prefix = DEFAULT_ROOT.as_posix() + "/"
+    if not rel.startswith(prefix):
+        return None
+    name, sep, _rest = rel[len(prefix):].partition("/")
+    return name if sep else None
+
+
+def describe(
+    graph: DependencyGraph,
+    query: Sequence[Node],
+    found: Set[Node],
+    direction: str,
+) -> Dict[str, Any]:
+    """Summarize a query result as nodes, files, entities and examples."""
+    files = sorted({path for path, _pointer in found})
+    # A changed entity or example is affected by its own change.
+    touched = files if direction == "dependencies" else sorted(set(files) | {path for path, _ in query})
+    return {
+        "direction": direction,
+        "query": [format_node(node) for node in query],
+        "nodes": sorted(format_node(node) for node in found),
+        "files": files,
+        "entities": sorted({entity for entity in map(_entity, touched) if entity}),
+        "examples": [path for path in touched if "/examples/" in path],
+        "graph": graph.stats(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def make_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="query_dependencies",
+        description=(
+            "List the schemas, contexts, frames, entities and examples affected by a change.\n"
+            "Nodes are files or JSON Pointers inside them: FILE[#/json/pointer]."
+        ),
+        epilog=(
+            "Examples:\n"
+            "  query_dependencies 'schemas/common/schema.json#/$defs/ontologyTerm'\n"
+            "  query_dependencies --changed-since origin/main\n"
+            "  query_dependencies --uses schemas/entities/cohort/frame.jsonld"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "nodes",
+        nargs="*",
+        metavar="FILE[#POINTER]",
+        help="Files or JSON Pointers to start from.",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Also start from every JSON Pointer changed since git revision REV.",
+    )
+    parser.add_argument(
+        "--uses",
+        action="store_true",
+        help="List what the nodes depend on instead of what depends on them.",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=Path("."),
+        help="Any path inside the repository (default: current directory).",
+    )
+    parser.add_argument(
+        "--graph",
+        type=Path,
+        help=f"Dependency graph snapshot (default: <repo>/{DEFAULT_GRAPH_PATH.as_posix()}).",
+    )
+    parser.add_argument(
+        "--verbosity",
+        "-v",
+        action="count",
+        default=0,
+        help="Increase log verbosity: -v for INFO, -vv for DEBUG.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the query and print the result as JSON."""
+    parser = make_arg_parser()
+    args = parser.parse_args(argv)
+    if not args.nodes and not args.changed_since:
+        parser.error("give at least one FILE[#POINTER] or --changed-since")
+    configure_logging(args.verbosity)
+
+    repo_root = find_repo_root(args.root.resolve())
+    graph = DependencyGraph(repo_root, SchemaRegistry.from_repo(repo_root), args.graph).load()
+    try:
+        query = nodes_from_arguments(graph, args.nodes)
+        if args.changed_since:
+            query.extend(changed_nodes(graph, repo_root, args.changed_since))
+    except (ValueError, RuntimeError) as exc:
+        LOGGER.error(str(exc))
+        sys.exit(2)
+
+    direction = "dependencies" if args.uses else "dependents"
+    found = graph.dependencies(query) if args.uses else graph.dependents(query)
+    LOGGER.info("%d node(s) in %d file(s) for %d query node(s)", len(found), len({p for p, _ in found}), len(query))
+
+    json.dump(describe(graph, query, found, direction), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Validate FEGA example suites against a running Biovalidator endpoint."""
+"""Validate FEGA example suites against Biovalidator or the in-process JSON Schema engine."""
 from __future__ import annotations
 
 import argparse
@@ -7,20 +7,41 @@ import datetime as _dt
 import json
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, List, Sequence
 
 import requests
 
 try:
     from fega_tools.biovalidator import (
         DEFAULT_VALIDATOR_URL,
-        assert_validator_reachable,
+        add_client_arguments,
         classify_response,
-        post_to_validator,
+    )
+    from fega_tools.incremental import (
+        IncrementalRun,
+        add_incremental_arguments,
+        incremental_from_args,
     )
     from fega_tools.io import collect_candidate_json
+    from fega_tools.jsonld_utils import find_repo_root
+    from fega_tools.local_validator import (
+        LocalSchemaError,
+        LocalValidator,
+        ValidationEngine,
+        add_engine_arguments,
+        engine_from_args,
+    )
     from fega_tools.logging_utils import configure_logging
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_cache import (
+        ValidationCache,
+        add_cache_arguments,
+        cache_from_args,
+    )
     from fega_tools.validation_common import (
         BIVALIDATOR_COUNT_KEYS as COUNT_KEYS,
         CATEGORIES,
@@ -36,6 +57,7 @@ try:
         find_entity_dirs,
         find_example_coverage_gaps,
         load_wrapped_example,
+        positive_int,
         write_json_summary,
     )
 except ModuleNotFoundError as exc:
@@ -60,7 +82,11 @@ except ModuleNotFoundError:
 SUMMARY_FILENAME = "summary.json"
 
 
-def validate_file(path: Path, validator_url: str) -> Dict[str, Any]:
+def validate_file(
+    path: Path,
+    client: ValidationEngine,
+    cache: ValidationCache | None = None,
+) -> Dict[str, Any]:
     """Validate one example file and return a result record."""
     result: Dict[str, Any] = {"file": str(path)}
 
@@ -70,23 +96,66 @@ def validate_file(path: Path, validator_url: str) -> Dict[str, Any]:
         result.update({"status": SCRIPT_ERROR_STATUS, "errors": [str(exc)]})
         return result
 
+    cache_key = cache.key_for(document, client.url) if cache is not None else None
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        result.update({"status": cached["status"], "cached": True})
+        if cached["status"] != VALID_STATUS:
+            result["errors"] = cached["errors"]
+        return result
+
+    started = time.perf_counter()
     try:
-        response = post_to_validator(document, validator_url)
-    except requests.RequestException as exc:
-        result.update({"status": REQUEST_ERROR_STATUS, "errors": [str(exc)]})
+        response = client.validate(document)
+    except LocalSchemaError as exc:
+        result.update({"status": SCRIPT_ERROR_STATUS, "errors": [str(exc)]})
         return result
-    except (json.JSONDecodeError, ValueError) as exc:
+    except json.JSONDecodeError as exc:
+        # Checked before RequestException: requests' JSON errors are both.
         result.update({"status": UNKNOWN_STATUS, "errors": [f"Malformed validator response: {exc}"]})
         return result
+    except requests.RequestException as exc:
+        result.update({"status": REQUEST_ERROR_STATUS, "errors": [str(exc)]})
+        return result
+    finally:
+        result["request_seconds"] = round(time.perf_counter() - started, 6)
 
     status = classify_response(response)
     result["status"] = status
     if status != VALID_STATUS:
         result["errors"] = response if isinstance(response, list) else [response]
+    if cache is not None:
+        cache.put(cache_key, status, result.get("errors", []))
 
     return result
 
 
+def validate_files(
+    paths: Sequence[Path],
+    client: ValidationEngine,
+    jobs: int = 1,
+    cache: ValidationCache | None = None,
+) -> List[Dict[str, Any]]:
+    """Validate example files, keeping up to *jobs* requests in flight.
+
+    Results are returned in the same order as *paths* regardless of the order
+    in which Biovalidator answers, so summaries stay deterministic.
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        return [validate_file(path, client, cache) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(
+            executor.map(partial(validate_file, client=client, cache=cache), paths)
+        )
+
+
+def category_files(entity_dir: Path, category: str) -> List[Path]:
+    """Return the example files of one entity category."""
+    category_dir = entity_dir / "examples" / category
+    return collect_candidate_json([category_dir]) if category_dir.is_dir() else []
+
+
 def category_passed(summary: Dict[str, Any], expectation: str) -> bool:
     """Apply the strict pass/fail rules for valid and invalid example suites."""
     total_files = summary["total_files"]
@@ -120,16 +189,24 @@ def expected_status_for(expectation: str) -> str:
 def summarize_category(
     entity_dir: Path,
     category: str,
-    validator_url: str,
+    client: ValidationEngine,
     coverage_gaps: Sequence[Dict[str, Any]],
+    results_by_path: Dict[str, Dict[str, Any]] | None = None,
 ) -> Dict[str, Any]:
-    """Validate one entity's examples for a category and summarize the result."""
+    """Validate one entity's examples for a category and summarize the result.
+
+    When *results_by_path* is given, files already validated by a concurrent
+    run are taken from it instead of being posted again.
+    """
     category_dir = entity_dir / "examples" / category
-    files = collect_candidate_json([category_dir]) if category_dir.is_dir() else []
+    files = category_files(entity_dir, category)
     expected_status = expected_status_for(category)
     results = []
     for path in files:
-        result = validate_file(path, validator_url)
+        if results_by_path is not None and str(path) in results_by_path:
+            result = results_by_path[str(path)]
+        else:
+            result = validate_file(path, client)
         results.append(result)
         outcome = "passed" if result["status"] == expected_status else "failed"
         LOGGER.debug("Validated '%s' [expected: %s] -> %s", path.name, category, outcome)
@@ -172,8 +249,9 @@ def summarize_category(
 
 def summarize_entity(
     entity_dir: Path,
-    validator_url: str,
+    client: ValidationEngine,
     coverage_gaps: Sequence[Dict[str, Any]],
+    results_by_path: Dict[str, Dict[str, Any]] | None = None,
 ) -> Dict[str, Any]:
     """Validate and summarize all example categories for one entity."""
     return {
@@ -182,8 +260,9 @@ def summarize_entity(
             category: summarize_category(
                 entity_dir,
                 category,
-                validator_url,
+                client,
                 coverage_gaps,
+                results_by_path,
             )
             for category in CATEGORIES
         },
@@ -216,13 +295,43 @@ def summarize_totals(entity_summaries: Sequence[Dict[str, Any]]) -> Dict[str, An
     return totals
 
 
+def summarize_timing(
+    results: Sequence[Dict[str, Any]],
+    jobs: int,
+    wall_clock_seconds: float,
+) -> Dict[str, Any]:
+    """Compare wall-clock time with the summed Biovalidator request time."""
+    request_seconds = sum(result.get("request_seconds", 0.0) for result in results)
+    return {
+        "jobs": jobs,
+        "requests": sum(1 for result in results if "request_seconds" in result),
+        "wall_clock_seconds": round(wall_clock_seconds, 3),
+        "request_seconds": round(request_seconds, 3),
+        "effective_concurrency": (
+            round(request_seconds / wall_clock_seconds, 2) if wall_clock_seconds > 0 else 0.0
+        ),
+    }
+
+
 def validate_examples(
     root: Path,
     entity: str | None,
-    validator_url: str,
+    client: ValidationEngine,
+    jobs: int = 1,
+    cache: ValidationCache | None = None,
+    incremental: IncrementalRun | None = None,
 ) -> Dict[str, Any]:
-    """Validate valid and invalid example suites under an entity root."""
-    assert_validator_reachable(validator_url)
+    """Validate valid and invalid example suites under an entity root.
+
+    With ``jobs > 1`` every example of the selected entities is submitted to a
+    bounded thread pool up front, so up to *jobs* Biovalidator requests stay in
+    flight across entity and category boundaries. With *incremental*, files
+    no change can affect keep their stored result.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be a positive integer")
+
+    client.assert_reachable()
 
     entity_dirs = find_entity_dirs(root, entity)
     if not entity_dirs:
@@ -241,8 +350,26 @@ def validate_examples(
             "; ".join(details),
         )
 
+    paths = [
+        path
+        for entity_dir in entity_dirs
+        for category in CATEGORIES
+        for path in category_files(entity_dir, category)
+    ]
+    reused: Dict[str, Dict[str, Any]] = {}
+    if incremental is not None:
+        for path in paths:
+            result = incremental.reusable_result(path)
+            if result is not None:
+                reused[str(path)] = result
+        paths = [path for path in paths if str(path) not in reused]
+    started = time.perf_counter()
+    results = validate_files(paths, client, jobs, cache)
+    timing = summarize_timing(results, jobs, time.perf_counter() - started)
+    results_by_path = {**reused, **{result["file"]: result for result in results}}
+
     file_summaries = [
-        summarize_entity(entity_dir, validator_url, coverage_gaps)
+        summarize_entity(entity_dir, client, coverage_gaps, results_by_path)
         for entity_dir in entity_dirs
     ]
     totals = summarize_totals(file_summaries)
@@ -257,7 +384,7 @@ def validate_examples(
 
     return {
         "timestamp": _dt.datetime.now(tz=_dt.timezone.utc).isoformat(timespec="seconds"),
-        "validator_url": validator_url,
+        "validator_url": client.url,
         "root": str(root),
         "passed": valid_examples_passed and invalid_examples_passed,
         "entity": entity,
@@ -270,11 +397,15 @@ def validate_examples(
         "input_paths": input_paths,
         "category_totals": category_totals,
         "coverage_gaps": coverage_gaps,
+        "timing": timing,
+        "cache": cache.stats() if cache is not None else None,
+        "local_engine": client.stats() if isinstance(client, LocalValidator) else None,
+        "incremental": incremental.stats() if incremental is not None else None,
         "files": file_summaries,
     }
 
 
-def _log_results(summary: Dict[str, Any]) -> None:
+def log_results(summary: Dict[str, Any]) -> None:
     """Emit INFO-level result lines for the validation run."""
     cat = summary["category_totals"]
     valid_passed = cat["valid"]["validation_passed"]
@@ -285,6 +416,30 @@ def _log_results(summary: Dict[str, Any]) -> None:
     LOGGER.info("%d / %d valid files passed validation", valid_passed, valid_total)
     LOGGER.info("%d / %d invalid files passed validation", invalid_passed, invalid_total)
 
+    timing = summary.get("timing")
+    if timing:
+        LOGGER.info(
+            "%d request(s) with %d job(s): %.2fs wall clock, %.2fs summed request time",
+            timing["requests"],
+            timing["jobs"],
+            timing["wall_clock_seconds"],
+            timing["request_seconds"],
+        )
+
+    cache = summary.get("cache")
+    if cache:
+        LOGGER.info(
+            "Validation cache: %d hit(s), %d miss(es), %d stored",
+            cache["hits"],
+            cache["misses"],
+            cache["stores"],
+        )
+
+    local_engine = summary.get("local_engine")
+    if local_engine:
+        for keyword, count in local_engine["deferred_checks"].items():
+            LOGGER.info("%d '%s' check(s) deferred to Biovalidator", count, keyword)
+
     if summary["passed"]:
         LOGGER.info("Tests %spassed%s", _BOLD_GREEN, _ANSI_RESET)
     else:
@@ -295,11 +450,13 @@ def make_arg_parser() -> argparse.ArgumentParser:
     """Build the command-line parser for the validation runner."""
     parser = argparse.ArgumentParser(
         prog="validate_examples",
-        description="Validate FEGA valid/invalid examples using a Biovalidator endpoint.",
+        description="Validate FEGA valid/invalid examples using a Biovalidator endpoint or the local engine.",
         epilog=(
             "Examples:\n"
             "  validate_examples --entity cohort\n"
-            "  validate_examples --root schemas/entities --summary-dir ."
+            "  validate_examples --root schemas/entities --summary-dir .\n"
+            "  validate_examples --root schemas/entities --jobs 8 -v\n"
+            "  validate_examples --engine local"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -320,6 +477,17 @@ def make_arg_parser() -> argparse.ArgumentParser:
         default=DEFAULT_VALIDATOR_URL,
         help=f"Biovalidator /validate endpoint (default: {DEFAULT_VALIDATOR_URL})",
     )
+    add_engine_arguments(parser)
+    add_client_arguments(parser)
+    add_cache_arguments(parser)
+    add_incremental_arguments(parser)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=1,
+        help="Number of Biovalidator requests kept in flight (default: 1).",
+    )
     parser.add_argument(
         "--summary-dir",
         type=Path,
@@ -348,12 +516,26 @@ def main(argv: Sequence[str] | None = None) -> None:
     configure_logging(args.verbosity)
 
     try:
-        summary = validate_examples(args.root, args.entity, args.validator_url)
+        repo_root = find_repo_root(args.root.resolve())
+        id_to_path_map = SchemaRegistry.from_repo(repo_root)
+        cache = cache_from_args(args, id_to_path_map)
+        incremental = incremental_from_args(args, repo_root, id_to_path_map, SUMMARY_FILENAME)
+        with engine_from_args(args, repo_root, id_to_path_map, pool_size=args.jobs) as client:
+            summary = validate_examples(
+                args.root,
+                args.entity,
+                client,
+                jobs=args.jobs,
+                cache=cache,
+                incremental=incremental,
+            )
+        if cache is not None:
+            cache.prune()
     except (FileNotFoundError, RuntimeError) as exc:
         LOGGER.error(str(exc))
         sys.exit(2)
 
-    _log_results(summary)
+    log_results(summary)
 
     if args.summary_dir:
         write_json_summary(summary, args.summary_dir, SUMMARY_FILENAME)
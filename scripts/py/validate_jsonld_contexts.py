@@ -19,13 +19,19 @@ import rdflib
 from rdflib.namespace import RDF
 
 try:
+    from fega_tools.incremental import (
+        IncrementalRun,
+        add_incremental_arguments,
+        incremental_from_args,
+    )
     from fega_tools.io import collect_candidate_json
     from fega_tools.logging_utils import configure_logging
     from fega_tools.jsonld_utils import (
         find_repo_root,
-        build_id_to_path_map,
         materialize_context,
+        replace_context,
     )
+    from fega_tools.schema_registry import SchemaRegistry
     from fega_tools.validation_common import (
         BIVALIDATOR_COUNT_KEYS as COUNT_KEYS,
         DEFAULT_ROOT,
@@ -137,13 +143,11 @@ def validate_file_jsonld(
         )
         return result
 
-    # Step 7: RDF parse – replace @context with materialized version.
-    data_copy: Dict[str, Any] = json.loads(json.dumps(data))
-    data_copy["@context"] = materialized_ctx
-
+    # Step 7: RDF parse – replace @context with materialized version. rdflib
+    # reads the Python objects directly, without serializing them to JSON.
     try:
         graph = rdflib.Graph()
-        graph.parse(data=json.dumps(data_copy), format="json-ld", base=schema_ref)
+        graph.parse(data=replace_context(data, materialized_ctx), format="json-ld", base=schema_ref)
     except Exception as exc:  # noqa: BLE001 – rdflib raises diverse exceptions
         result.update({"status": INVALID_STATUS, "errors": [f"RDF parse failed: {exc}"]})
         return result
@@ -193,6 +197,7 @@ def summarize_entity(
     entity_dir: Path,
     id_to_path_map: Dict[str, Path],
     coverage_gaps: Sequence[Dict[str, Any]],
+    incremental: Optional[IncrementalRun] = None,
 ) -> Dict[str, Any]:
     """Validate and summarise valid examples for one entity."""
     valid_dir = entity_dir / "examples" / "valid"
@@ -202,7 +207,9 @@ def summarize_entity(
 
     results: List[Dict[str, Any]] = []
     for path in files:
-        file_result = validate_file_jsonld(path, id_to_path_map)
+        file_result = incremental.reusable_result(path) if incremental is not None else None
+        if file_result is None:
+            file_result = validate_file_jsonld(path, id_to_path_map)
         results.append(file_result)
         outcome = "passed" if file_result["status"] == VALID_STATUS else "failed"
         LOGGER.debug("Validated '%s' -> %s", path.name, outcome)
@@ -259,6 +266,8 @@ def validate_jsonld_contexts(
     root: Path,
     entity: Optional[str],
     repo_root: Optional[Path] = None,
+    registry: Optional[SchemaRegistry] = None,
+    incremental: Optional[IncrementalRun] = None,
 ) -> Dict[str, Any]:
     """Run JSON-LD context smoke tests for all valid examples under *root*.
 
@@ -268,11 +277,15 @@ def validate_jsonld_contexts(
     entity:     Restrict to one entity directory by name.
     repo_root:  Repository root used to resolve local schema paths. When
                 *None*, auto-detected by walking up from *root*.
+    registry:   Schema registry shared with other checks. When *None*, one
+                is built for *repo_root*.
+    incremental: Reuse stored results of files no change can affect.
     """
-    if repo_root is None:
-        repo_root = find_repo_root(root.resolve())
-
-    id_to_path_map = build_id_to_path_map(repo_root)
+    if registry is None:
+        if repo_root is None:
+            repo_root = find_repo_root(root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
+    id_to_path_map = registry
     LOGGER.debug("Loaded %d entries in schema/context map", len(id_to_path_map))
 
     entity_dirs = find_entity_dirs(root, entity)
@@ -293,7 +306,7 @@ def validate_jsonld_contexts(
         )
 
     entity_summaries = [
-        summarize_entity(entity_dir, id_to_path_map, coverage_gaps)
+        summarize_entity(entity_dir, id_to_path_map, coverage_gaps, incremental)
         for entity_dir in entity_dirs
     ]
 
@@ -313,6 +326,8 @@ def validate_jsonld_contexts(
         "valid_examples_passed": overall_passed,
         "input_paths": input_paths,
         "coverage_gaps": coverage_gaps,
+        "context_materialization": id_to_path_map.contexts.stats(),
+        "incremental": incremental.stats() if incremental is not None else None,
         "files": entity_summaries,
     }
 
@@ -321,7 +336,7 @@ def validate_jsonld_contexts(
 # Logging / output
 # ---------------------------------------------------------------------------
 
-def _log_results(summary: Dict[str, Any]) -> None:
+def log_results(summary: Dict[str, Any]) -> None:
     """Emit INFO-level result lines for the validation run."""
     passed_count = summary["validation_passed"]
     total_count = summary["total_valid_files"]
@@ -367,6 +382,7 @@ def make_arg_parser() -> argparse.ArgumentParser:
         type=Path,
         help=f"Optional directory where {SUMMARY_FILENAME} is written.",
     )
+    add_incremental_arguments(parser)
     parser.add_argument(
         "--print-summary",
         action="store_true",
@@ -390,12 +406,19 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     configure_logging(args.verbosity)
 
     try:
-        summary = validate_jsonld_contexts(args.root, args.entity)
+        repo_root = find_repo_root(args.root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
+        summary = validate_jsonld_contexts(
+            args.root,
+            args.entity,
+            registry=registry,
+            incremental=incremental_from_args(args, repo_root, registry, SUMMARY_FILENAME),
+        )
     except (FileNotFoundError, RuntimeError) as exc:
         LOGGER.error(str(exc))
         sys.exit(2)
 
-    _log_results(summary)
+    log_results(summary)
 
     if args.summary_dir:
         write_json_summary(summary, args.summary_dir, SUMMARY_FILENAME)
@@ -11,10 +11,14 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Sequence
 
 try:
+    from fega_tools.incremental import add_incremental_arguments, incremental_from_args
     from fega_tools.jsonld_coverage import validate_jsonld_coverage
+    from fega_tools.jsonld_utils import find_repo_root
     from fega_tools.logging_utils import configure_logging
+    from fega_tools.schema_registry import SchemaRegistry
     from fega_tools.validation_common import (
         DEFAULT_ROOT,
+        positive_int,
         write_json_summary,
     )
 except ModuleNotFoundError as exc:
@@ -91,7 +95,7 @@ def _log_entity_failures(summary: Dict[str, Any]) -> None:
             LOGGER.error("%s script error: %s", entity, error)
 
 
-def _log_results(summary: Dict[str, Any]) -> None:
+def log_results(summary: Dict[str, Any]) -> None:
     """Emit a concise suite-level summary."""
     LOGGER.info(
         "%d / %d entities passed JSON-LD coverage checks",
@@ -124,6 +128,7 @@ def make_arg_parser() -> argparse.ArgumentParser:
         epilog=(
             "Examples:\n"
             "  validate_jsonld_coverage --entity cohort\n"
+            "  validate_jsonld_coverage --workers 4\n"
             "  validate_jsonld_coverage --root schemas/entities --summary-dir ."
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -138,11 +143,22 @@ def make_arg_parser() -> argparse.ArgumentParser:
         "--entity",
         help="Validate one entity by directory name, e.g. 'cohort'.",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=positive_int,
+        default=1,
+        help=(
+            "Number of worker processes for entity checks and term-mapping "
+            "probes (default: 1, run serially)."
+        ),
+    )
     parser.add_argument(
         "--summary-dir",
         type=Path,
         help=f"Optional directory where {SUMMARY_FILENAME} is written.",
     )
+    add_incremental_arguments(parser)
     parser.add_argument(
         "--print-summary",
         action="store_true",
@@ -166,7 +182,16 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     configure_logging(args.verbosity)
 
     try:
-        summary = validate_jsonld_coverage(args.root, args.entity)
+        repo_root = find_repo_root(args.root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
+        summary = validate_jsonld_coverage(
+            args.root,
+            args.entity,
+            repo_root=repo_root,
+            workers=args.workers,
+            registry=registry,
+            incremental=incremental_from_args(args, repo_root, registry, SUMMARY_FILENAME),
+        )
     except (FileNotFoundError, RuntimeError) as exc:
         LOGGER.error(str(exc))
         sys.exit(2)
@@ -175,7 +200,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         timespec="seconds"
     )
 
-    _log_results(summary)
+    log_results(summary)
 
     if args.summary_dir:
         write_json_summary(summary, args.summary_dir, SUMMARY_FILENAME)
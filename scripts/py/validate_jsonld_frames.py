@@ -8,10 +8,12 @@ frames it back into schema-shaped JSON-LD, and validates that result.
 
 The RDF/N-Quads route checks meaning, not formatting. JSON-LD, flattened
 JSON-LD, framed JSON-LD, and RDF/N-Quads can all describe the same graph in
-different syntaxes. The script canonicalizes the original and framed data as
-N-Quads (triplets) so it can detect semantic information loss even when the JSON layout
-changes. JSON Schema validation then checks that the final JSON has the shape
-our metadata model expects.
+different syntaxes. The script converts the original and framed data to RDF
+quads (triplets) and compares the graphs, so it can detect semantic information
+loss even when the JSON layout changes. Cheap graph invariants settle most
+comparisons; canonical URDNA2015 N-Quads are only computed when blank nodes
+leave them undecided, or to describe a difference. JSON Schema validation then
+checks that the final JSON has the shape our metadata model expects.
 
 Each input is checked through two routes:
 
@@ -30,10 +32,14 @@ import argparse
 import datetime as _dt
 import json
 import logging
+import os
 import sys
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
 
 import requests
 
@@ -47,23 +53,33 @@ except ImportError as exc:
 try:
     from fega_tools.biovalidator import (
         DEFAULT_VALIDATOR_URL,
-        assert_validator_reachable,
+        BiovalidatorClient,
+        add_client_arguments,
         classify_response,
-        post_to_validator,
+        client_from_args,
+    )
+    from fega_tools.incremental import (
+        IncrementalRun,
+        add_incremental_arguments,
+        incremental_from_args,
     )
     from fega_tools.io import collect_candidate_json
     from fega_tools.logging_utils import configure_logging
     from fega_tools.jsonld_utils import (
-        build_id_to_path_map,
         find_invalid_context_type_mappings,
         find_undefined_terms,
         find_repo_root,
+        load_json_file,
         make_local_document_loader,
         materialize_context,
     )
+    from fega_tools.pyld_cache import PyLDContextCache
+    from fega_tools.rdf_compare import RDFComparator, RDFDataset
+    from fega_tools.schema_registry import SchemaRegistry
     from fega_tools.validation_common import (
         BIVALIDATOR_COUNT_KEYS as COUNT_KEYS,
         DEFAULT_ROOT,
+        DOCUMENT_CACHE,
         INVALID_STATUS,
         REQUEST_ERROR_STATUS,
         SCRIPT_ERROR_STATUS,
@@ -72,6 +88,8 @@ try:
         add_counts as add_validation_counts,
         empty_counts as make_empty_counts,
         find_entity_dirs,
+        load_json_document,
+        positive_int,
         write_json_summary,
     )
 except ModuleNotFoundError as exc:
@@ -120,12 +138,6 @@ def find_frame_gaps(entity_dirs: Sequence[Path]) -> List[str]:
     ]
 
 
-def _load_json(path: Path) -> Any:
-    """Load a JSON file and return the parsed value."""
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _clone_json(value: Any) -> Any:
     """Make a JSON-safe deep copy."""
     return json.loads(json.dumps(value))
@@ -144,7 +156,7 @@ def resolve_file_entity(
         raise ValueError(f"Input file must be JSON: {path}")
 
     try:
-        document = _load_json(resolved_path)
+        document = load_json_document(resolved_path)
     except (OSError, json.JSONDecodeError) as exc:
         raise ValueError(f"Cannot load input file '{path}': {exc}") from exc
 
@@ -277,37 +289,26 @@ def _value_as_strings(value: Any) -> List[str]:
     return []
 
 
-def _expand_node_identifier(value: str, context: Any) -> Optional[str]:
-    """Expand a compact or absolute JSON-LD node identifier to an absolute IRI."""
-    try:
-        expanded = jsonld.expand(
-            {
-                "@context": context,
-                "@id": value,
-                "https://example.org/jsonld-frame-probe": "probe",
-            }
-        )
-    except Exception:  # noqa: BLE001 - PyLD exposes several exception types
-        return None
-    for node in expanded:
-        if isinstance(node, dict) and isinstance(node.get("@id"), str):
-            return node["@id"]
-    return None
-
-
 def _select_primary_entity(
     framed: Dict[str, Any],
     original_id: Optional[str],
     original_types: Sequence[str],
     context: Any,
+    pyld_cache: Optional[PyLDContextCache] = None,
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    """Pick the one framed entity that matches the original @id or type."""
+    """Pick the one framed entity that matches the original @id or type.
+
+    Node identifiers are compared after JSON-LD expansion, memoized in
+    *pyld_cache* (a private cache is used when none is given).
+    """
+    if pyld_cache is None:
+        pyld_cache = PyLDContextCache()
     candidates = _extract_candidates(framed)
     if not candidates:
         return None, "Framed output did not contain any candidate entities"
 
     if original_id:
-        original_expanded_id = _expand_node_identifier(original_id, context)
+        original_expanded_id = pyld_cache.expand_node_identifier(original_id, context)
         if original_expanded_id is None:
             return None, f"Could not expand original @id '{original_id}'"
         matches = [
@@ -317,7 +318,7 @@ def _select_primary_entity(
             in {
                 expanded_id
                 for candidate_id in _value_as_strings(item.get("@id"))
-                for expanded_id in [_expand_node_identifier(candidate_id, context)]
+                for expanded_id in [pyld_cache.expand_node_identifier(candidate_id, context)]
                 if expanded_id is not None
             }
         ]
@@ -343,19 +344,17 @@ def _select_primary_entity(
     return None, f"Multiple framed entities matched expected @type values {sorted(expected_types)}"
 
 
-def _canonicalize_jsonld(
+def _rdf_dataset(
     data: Dict[str, Any],
     inline_context: Any,
-    document_loader: Any,
-) -> str:
-    """Normalize JSON-LD into canonical N-Quads for RDF comparison."""
-    return jsonld.normalize(
-        _data_with_context(data, inline_context),
-        {
-            "algorithm": "URDNA2015",
-            "format": "application/n-quads",
-            "documentLoader": document_loader,
-        },
+    pyld_cache: PyLDContextCache,
+) -> RDFDataset:
+    """Convert JSON-LD into an RDF dataset for semantic comparison."""
+    return RDFDataset(
+        jsonld.to_rdf(
+            _data_with_context(data, inline_context),
+            pyld_cache.options(produceGeneralizedRdf=False),
+        )
     )
 
 
@@ -526,8 +525,9 @@ def _route_active(state: Dict[str, Any], route: str) -> bool:
 def _prepare_input(
     spec: Dict[str, Path],
     id_to_path_map: Dict[str, Path],
-    document_loader: Any,
+    pyld_cache: PyLDContextCache,
     debug_snapshots: bool,
+    rdf_comparator: RDFComparator,
 ) -> Dict[str, Any]:
     """Load and validate one file (input) for later batch stages."""
     path = spec["path"]
@@ -537,11 +537,12 @@ def _prepare_input(
         "ready": True,
         "result": {"file": str(path), "frame": str(frame_path)},
         "routes": {route: {"result": None} for route in ROUTES},
-        "document_loader": document_loader,
+        "pyld_cache": pyld_cache,
+        "rdf_comparator": rdf_comparator,
     }
 
     try:
-        document = _load_json(path)
+        document = load_json_document(path)
     except (OSError, json.JSONDecodeError) as exc:
         _set_file_failure(state, SCRIPT_ERROR_STATUS, "load_file", [str(exc)])
         return state
@@ -612,16 +613,20 @@ def _prepare_input(
         return state
 
     try:
-        frame_doc = _load_json(frame_path)
+        frame_doc = load_json_file(frame_path, id_to_path_map)
         if not isinstance(frame_doc, dict):
             raise ValueError("Frame must be a JSON object")
         frame_context = frame_doc.get("@context")
         frame_inline = dict(frame_doc)
         if frame_context is not None:
-            frame_inline["@context"] = materialize_context(
-                frame_context,
-                frame_path,
-                id_to_path_map,
+            # PyLD copies the frame context into its output and edits it in
+            # place, so it gets a private copy of the shared materialization.
+            frame_inline["@context"] = _clone_json(
+                materialize_context(
+                    frame_context,
+                    frame_path,
+                    id_to_path_map,
+                )
             )
     except (FileNotFoundError, ValueError, OSError, json.JSONDecodeError) as exc:
         _set_file_failure(
@@ -661,10 +666,7 @@ def _frame_route(
         framed = jsonld.frame(
             route_state["framed_input"],
             state["frame_inline"],
-            options={
-                "documentLoader": state["document_loader"],
-                "omitDefault": True,
-            },
+            options=state["pyld_cache"].options(omitDefault=True),
         )
     except Exception as exc:  # noqa: BLE001 - PyLD raises diverse exceptions
         _set_route_failure(
@@ -689,6 +691,7 @@ def _frame_route(
         state["original_id"],
         state["original_types"],
         state["inline_context"],
+        state["pyld_cache"],
     )
     if primary is None:
         _set_route_failure(
@@ -720,13 +723,16 @@ def _frame_route(
     )
 
 
-def _validate_route_output(
+def _check_route_output(
     state: Dict[str, Any],
     route: str,
-    validator_url: str,
     debug_snapshots: bool,
 ) -> None:
-    """Check semantic equality, sanitize, and schema-validate one route."""
+    """Check semantic equality and build the Biovalidator request of one route.
+
+    On success the request is stored as ``validator_request`` in the route
+    state; the route stays active until its response is recorded.
+    """
     if not _route_active(state, route):
         return
 
@@ -743,11 +749,22 @@ def _validate_route_output(
     )
 
     try:
-        framed_canonical = _canonicalize_jsonld(
+        framed_rdf = _rdf_dataset(
             semantic_data,
             state["inline_context"],
-            state["document_loader"],
+            state["pyld_cache"],
         )
+        # Cheap invariants decide most comparisons; URDNA2015 only breaks ties.
+        equivalent = state["rdf_comparator"].equivalent(state["original_rdf"], framed_rdf)
+        if debug_snapshots:
+            _debug_snapshot(
+                True,
+                state["path"],
+                "canonical framed RDF/N-Quads",
+                framed_rdf.canonical(),
+                route=route,
+                raw=True,
+            )
     except Exception as exc:  # noqa: BLE001
         _set_route_failure(
             state,
@@ -758,24 +775,16 @@ def _validate_route_output(
         )
         return
 
-    route_state["framed_canonical"] = framed_canonical
-    _debug_snapshot(
-        debug_snapshots,
-        state["path"],
-        "canonical framed RDF/N-Quads",
-        framed_canonical,
-        route=route,
-        raw=True,
-    )
-    if framed_canonical != state["original_canonical"]:
+    route_state["framed_rdf"] = framed_rdf
+    if not equivalent:
         _set_route_failure(
             state,
             route,
             INVALID_STATUS,
             "rdf_equivalence",
             _summarize_nquads_difference(
-                state["original_canonical"],
-                framed_canonical,
+                state["original_rdf"].canonical(),
+                framed_rdf.canonical(),
             ),
         )
         return
@@ -799,27 +808,47 @@ def _validate_route_output(
         route=route,
     )
 
+
+def _send_validation_request(
+    client: BiovalidatorClient,
+    wrapper: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Send one Biovalidator request without touching pipeline state.
+
+    Returns ``{"response": ...}`` or ``{"failure": (status, stage, errors)}``,
+    so requests can run on an I/O thread pool while results are recorded by
+    the caller.
+    """
     try:
-        validator_response = post_to_validator(wrapper, validator_url)
+        return {"response": client.validate(wrapper)}
     except requests.RequestException as exc:
-        _set_route_failure(
-            state,
-            route,
-            REQUEST_ERROR_STATUS,
-            "schema_validation_request",
-            [str(exc)],
-        )
-        return
+        return {
+            "failure": (REQUEST_ERROR_STATUS, "schema_validation_request", [str(exc)])
+        }
     except (json.JSONDecodeError, ValueError) as exc:
-        _set_route_failure(
-            state,
-            route,
-            UNKNOWN_STATUS,
-            "schema_validation_response",
-            [f"Malformed Biovalidator response: {exc}"],
-        )
+        return {
+            "failure": (
+                UNKNOWN_STATUS,
+                "schema_validation_response",
+                [f"Malformed Biovalidator response: {exc}"],
+            )
+        }
+
+
+def _record_validation_outcome(
+    state: Dict[str, Any],
+    route: str,
+    outcome: Dict[str, Any],
+    debug_snapshots: bool,
+) -> None:
+    """Store the classified Biovalidator outcome as the route result."""
+    if "failure" in outcome:
+        status, stage, errors = outcome["failure"]
+        _set_route_failure(state, route, status, stage, errors)
         return
 
+    route_state = state["routes"][route]
+    validator_response = outcome["response"]
     route_state["validator_response"] = validator_response
     _debug_snapshot(
         debug_snapshots,
@@ -834,7 +863,7 @@ def _validate_route_output(
             "route": route,
             "status": VALID_STATUS,
             "failed_stage": None,
-            "canonical_nquads": len(state["original_canonical"].splitlines()),
+            "canonical_nquads": state["canonical_nquads"],
         }
         return
 
@@ -852,6 +881,20 @@ def _validate_route_output(
     )
 
 
+def _validate_route_output(
+    state: Dict[str, Any],
+    route: str,
+    client: BiovalidatorClient,
+    debug_snapshots: bool,
+) -> None:
+    """Check semantic equality, sanitize, and schema-validate one route."""
+    _check_route_output(state, route, debug_snapshots)
+    if not _route_active(state, route):
+        return
+    outcome = _send_validation_request(client, state["routes"][route]["validator_request"])
+    _record_validation_outcome(state, route, outcome, debug_snapshots)
+
+
 def _aggregate_route_status(route_results: Sequence[Dict[str, Any]]) -> str:
     """Collapse per-route statuses into one file-level status."""
     statuses = [result.get("status") for result in route_results]
@@ -897,7 +940,7 @@ def _finalize_file_result(
         {
             "status": status,
             "routes": route_results,
-            "canonical_nquads": len(state["original_canonical"].splitlines()),
+            "canonical_nquads": state["canonical_nquads"],
         }
     )
     if status != VALID_STATUS:
@@ -921,37 +964,38 @@ def _finalize_file_result(
     return state["result"]
 
 
-def _run_pipeline(
-    specs: Sequence[Dict[str, Path]],
-    id_to_path_map: Dict[str, Path],
-    validator_url: str,
-    debug_snapshots: bool,
-) -> List[Dict[str, Any]]:
-    """Run all files through ten real, suite-level transformation phases."""
-    total_files = len(specs)
-    document_loader = make_local_document_loader(id_to_path_map)
+def _no_step_log(step: int, message: str) -> None:
+    """Drop suite-level progress lines (used inside worker processes)."""
 
-    _log_step(1, f"Loading and validatiing {total_files} file(s) (inputs)")
-    states = [
-        _prepare_input(
-            spec,
-            id_to_path_map,
-            document_loader,
-            debug_snapshots,
-        )
-        for spec in specs
-    ]
 
-    _log_step(2, f"Converting {total_files} original JSON-LD file(s) into standardized RDF representation")
+def _transform_states(
+    states: Sequence[Dict[str, Any]],
+    pyld_cache: PyLDContextCache,
+    debug_snapshots: bool,
+    log_step: Callable[[int, str], None] = _log_step,
+) -> None:
+    """Run the CPU-bound phases 2-8 over prepared pipeline states."""
+    total_files = len(states)
+
+    log_step(2, f"Converting {total_files} original JSON-LD file(s) into standardized RDF representation")
     for state in states:
         if not state.get("ready", False):
             continue
         try:
-            state["original_canonical"] = _canonicalize_jsonld(
+            state["original_rdf"] = _rdf_dataset(
                 state["data"],
                 state["inline_context"],
-                document_loader,
+                pyld_cache,
             )
+            state["canonical_nquads"] = len(state["original_rdf"])
+            if debug_snapshots:
+                _debug_snapshot(
+                    True,
+                    state["path"],
+                    "canonical original RDF/N-Quads",
+                    state["original_rdf"].canonical(),
+                    raw=True,
+                )
         except Exception as exc:  # noqa: BLE001
             _set_file_failure(
                 state,
@@ -960,22 +1004,15 @@ def _run_pipeline(
                 [str(exc)],
             )
             continue
-        _debug_snapshot(
-            debug_snapshots,
-            state["path"],
-            "canonical original RDF/N-Quads",
-            state["original_canonical"],
-            raw=True,
-        )
 
-    _log_step(3, f"Flattening {total_files} file(s) through direct JSON-LD")
+    log_step(3, f"Flattening {total_files} file(s) through direct JSON-LD")
     for state in states:
         if not _route_active(state, ROUTE_FLATTENED):
             continue
         try:
             flattened = jsonld.flatten(
                 state["data_with_context"],
-                options={"documentLoader": document_loader},
+                options=pyld_cache.options(),
             )
             state["routes"][ROUTE_FLATTENED]["flat_nodes"] = _as_graph_nodes(
                 flattened
@@ -997,7 +1034,7 @@ def _run_pipeline(
             route=ROUTE_FLATTENED,
         )
 
-    _log_step(4, f"Adding noise to {total_files} direct-route graph(s)")
+    log_step(4, f"Adding noise to {total_files} direct-route graph(s)")
     for state in states:
         if not _route_active(state, ROUTE_FLATTENED):
             continue
@@ -1015,21 +1052,18 @@ def _run_pipeline(
             route=ROUTE_FLATTENED,
         )
 
-    _log_step(5, f"Framing and checking {total_files} direct-route graph(s)")
+    log_step(5, f"Framing and checking {total_files} direct-route graph(s)")
     for state in states:
         _frame_route(state, ROUTE_FLATTENED, debug_snapshots)
 
-    _log_step(6, f"Generating RDF/N-Quads for {total_files} file(s)")
+    log_step(6, f"Generating RDF/N-Quads for {total_files} file(s)")
     for state in states:
         if not _route_active(state, ROUTE_RDF_GRAPH):
             continue
         try:
             nquads = jsonld.to_rdf(
                 state["data_with_context"],
-                options={
-                    "format": "application/n-quads",
-                    "documentLoader": document_loader,
-                },
+                options=pyld_cache.options(format="application/n-quads"),
             )
             state["routes"][ROUTE_RDF_GRAPH]["nquads"] = nquads
         except Exception as exc:  # noqa: BLE001
@@ -1050,7 +1084,7 @@ def _run_pipeline(
             raw=True,
         )
 
-    _log_step(7, f"Reconstructing and flattening {total_files} RDF graph(s)")
+    log_step(7, f"Reconstructing and flattening {total_files} RDF graph(s)")
     for state in states:
         if not _route_active(state, ROUTE_RDF_GRAPH):
             continue
@@ -1065,7 +1099,7 @@ def _run_pipeline(
             )
             flattened = jsonld.flatten(
                 reconstructed,
-                options={"documentLoader": document_loader},
+                options=pyld_cache.options(),
             )
             route_state["reconstructed"] = reconstructed
             route_state["flat_nodes"] = _as_graph_nodes(flattened)
@@ -1093,7 +1127,7 @@ def _run_pipeline(
             route=ROUTE_RDF_GRAPH,
         )
 
-    _log_step(
+    log_step(
         8,
         f"Adding noise, framing, and checking {total_files} RDF-route graph(s)",
     )
@@ -1115,6 +1149,36 @@ def _run_pipeline(
         )
         _frame_route(state, ROUTE_RDF_GRAPH, debug_snapshots)
 
+
+def _run_pipeline(
+    specs: Sequence[Dict[str, Path]],
+    id_to_path_map: Dict[str, Path],
+    client: BiovalidatorClient,
+    debug_snapshots: bool,
+    pyld_cache: PyLDContextCache,
+    rdf_comparator: RDFComparator,
+) -> List[Dict[str, Any]]:
+    """Run all files through ten real, suite-level transformation phases.
+
+    Every PyLD call shares *pyld_cache*, so documents are loaded locally
+    and node identifier expansions are memoized for the whole run.
+    """
+    total_files = len(specs)
+
+    _log_step(1, f"Loading and validatiing {total_files} file(s) (inputs)")
+    states = [
+        _prepare_input(
+            spec,
+            id_to_path_map,
+            pyld_cache,
+            debug_snapshots,
+            rdf_comparator,
+        )
+        for spec in specs
+    ]
+
+    _transform_states(states, pyld_cache, debug_snapshots)
+
     _log_step(
         9,
         f"Checking RDF equivalence and validating {total_files} file(s) across 2 route(s)",
@@ -1124,7 +1188,7 @@ def _run_pipeline(
             _validate_route_output(
                 state,
                 route,
-                validator_url,
+                client,
                 debug_snapshots,
             )
 
@@ -1135,6 +1199,211 @@ def _run_pipeline(
     ]
 
 
+def _run_file_phases(
+    spec: Dict[str, Path],
+    id_to_path_map: Dict[str, Path],
+    pyld_cache: PyLDContextCache,
+    debug_snapshots: bool,
+    rdf_comparator: RDFComparator,
+) -> Dict[str, Any]:
+    """Run phases 1-8 and the RDF check of phase 9 for one file."""
+    state = _prepare_input(spec, id_to_path_map, pyld_cache, debug_snapshots, rdf_comparator)
+    _transform_states([state], pyld_cache, debug_snapshots, log_step=_no_step_log)
+    for route in ROUTES:
+        _check_route_output(state, route, debug_snapshots)
+    return state
+
+
+def _stream_pipeline(
+    specs: Sequence[Dict[str, Path]],
+    id_to_path_map: Dict[str, Path],
+    client: BiovalidatorClient,
+    debug_snapshots: bool,
+    pyld_cache: PyLDContextCache,
+    rdf_comparator: RDFComparator,
+) -> Iterator[Dict[str, Any]]:
+    """Yield file results one at a time, each file running all ten phases.
+
+    Unlike :func:`_run_pipeline`, no state is kept across files: documents,
+    RDF datasets and framed graphs are dropped as soon as the file's
+    result record is final, so peak memory does not grow with the input.
+    """
+    total_files = len(specs)
+    _log_step(1, f"Streaming {total_files} file(s) through steps 1-10 one file at a time")
+    for index, spec in enumerate(specs, start=1):
+        state = _run_file_phases(
+            spec, id_to_path_map, pyld_cache, debug_snapshots, rdf_comparator
+        )
+        for route in ROUTES:
+            if _route_active(state, route):
+                outcome = _send_validation_request(
+                    client, state["routes"][route]["validator_request"]
+                )
+                _record_validation_outcome(state, route, outcome, debug_snapshots)
+        result = _finalize_file_result(state, debug_snapshots)
+        # Do not keep the heavy state (or the parsed input) alive while the
+        # generator is suspended.
+        del state
+        DOCUMENT_CACHE.discard(spec["path"])
+        LOGGER.debug("Streamed %d/%d: %s -> %s", index, total_files, result["file"], result["status"])
+        yield result
+
+
+# ---------------------------------------------------------------------------
+# Worker-pool pipeline (--workers)
+# ---------------------------------------------------------------------------
+
+_WORKER_REGISTRY: Optional[SchemaRegistry] = None
+_WORKER_PYLD_CACHE: Optional[PyLDContextCache] = None
+_WORKER_RDF_COMPARATOR: Optional[RDFComparator] = None
+
+
+def _init_frame_worker(id_to_path_map: Dict[str, Path], log_level: int) -> None:
+    """Give each worker process its own registry, document loader, caches and comparator."""
+    global _WORKER_REGISTRY, _WORKER_PYLD_CACHE, _WORKER_RDF_COMPARATOR
+    if not logging.getLogger().handlers:
+        # Spawned (not forked) workers start without the parent's logging setup.
+        configure_logging(0)
+    logging.getLogger().setLevel(log_level)
+    _suppress_third_party_debug()
+    _WORKER_REGISTRY = SchemaRegistry(id_to_path_map)
+    _WORKER_PYLD_CACHE = PyLDContextCache(make_local_document_loader(_WORKER_REGISTRY))
+    _WORKER_RDF_COMPARATOR = RDFComparator()
+
+
+def _portable_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only what the parent needs to send requests and finalize a file."""
+    portable = {
+        key: state[key]
+        for key in ("path", "ready", "result", "canonical_nquads")
+        if key in state
+    }
+    portable["routes"] = {
+        route: {
+            key: value
+            for key, value in route_state.items()
+            if key in ("result", "validator_request")
+        }
+        for route, route_state in state["routes"].items()
+    }
+    return portable
+
+
+def _frame_file_in_worker(
+    spec: Dict[str, Path],
+    debug_snapshots: bool,
+) -> Tuple[Dict[str, Any], int, Dict[str, Dict[str, int]]]:
+    """Run :func:`_run_file_phases` for one file in a worker process.
+
+    Returns the trimmed state, the worker pid and the worker's cache counters.
+    """
+    assert (
+        _WORKER_REGISTRY is not None
+        and _WORKER_PYLD_CACHE is not None
+        and _WORKER_RDF_COMPARATOR is not None
+    ), "worker was started without _init_frame_worker"
+    state = _run_file_phases(
+        spec,
+        _WORKER_REGISTRY,
+        _WORKER_PYLD_CACHE,
+        debug_snapshots,
+        _WORKER_RDF_COMPARATOR,
+    )
+    counters = {
+        "context_materialization": _WORKER_REGISTRY.contexts.stats(),
+        "pyld_context_cache": _WORKER_PYLD_CACHE.stats(),
+        "rdf_comparison": _WORKER_RDF_COMPARATOR.stats(),
+    }
+    return _portable_state(state), os.getpid(), counters
+
+
+def _sum_counters(counter_sets: Sequence[Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, int]]:
+    """Add per-process cache counters into one block per cache."""
+    totals: Dict[str, Dict[str, int]] = {}
+    for counters in counter_sets:
+        for name, values in counters.items():
+            block = totals.setdefault(name, {})
+            for key, value in values.items():
+                block[key] = block.get(key, 0) + value
+    return totals
+
+
+def _run_pipeline_in_pool(
+    specs: Sequence[Dict[str, Path]],
+    id_to_path_map: Dict[str, Path],
+    client: BiovalidatorClient,
+    debug_snapshots: bool,
+    workers: int,
+    jobs: int,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, int]]]:
+    """Run the pipeline with files sharded across worker processes.
+
+    Each worker runs the CPU-bound phases of one file at a time with its own
+    document loader and PyLD cache. As soon as a file comes back, its
+    Biovalidator requests go to a separate pool of *jobs* I/O threads, so
+    HTTP round-trips overlap with framing in the workers. Results are
+    recorded and finalized in input order, matching the serial pipeline.
+
+    Returns the file results and the cache counters summed over workers.
+    """
+    total_files = len(specs)
+    states: List[Optional[Dict[str, Any]]] = [None] * total_files
+    worker_counters: Dict[int, Dict[str, Dict[str, int]]] = {}
+    requests_by_route: Dict[Tuple[int, str], Future] = {}
+
+    _log_step(
+        1,
+        f"Loading, transforming and checking {total_files} file(s) "
+        f"(steps 1-8) on {workers} worker process(es)",
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_frame_worker,
+        initargs=(dict(id_to_path_map), logging.getLogger().getEffectiveLevel()),
+    ) as executor, ThreadPoolExecutor(max_workers=jobs) as io_pool:
+        futures = {
+            executor.submit(_frame_file_in_worker, spec, debug_snapshots): index
+            for index, spec in enumerate(specs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            state, pid, counters = future.result()
+            states[index] = state
+            # Counters grow monotonically, so the latest snapshot per worker wins.
+            worker_counters[pid] = counters
+            for route in ROUTES:
+                if _route_active(state, route):
+                    requests_by_route[(index, route)] = io_pool.submit(
+                        _send_validation_request,
+                        client,
+                        state["routes"][route]["validator_request"],
+                    )
+
+        _log_step(
+            9,
+            f"Validating {total_files} file(s) across 2 route(s) "
+            f"with {jobs} request thread(s)",
+        )
+        for index, state in enumerate(states):
+            for route in ROUTES:
+                request = requests_by_route.get((index, route))
+                if request is not None:
+                    _record_validation_outcome(
+                        state,
+                        route,
+                        request.result(),
+                        debug_snapshots,
+                    )
+
+    _log_step(10, f"Summarizing {total_files} file result(s)")
+    results = [
+        _finalize_file_result(state, debug_snapshots)
+        for state in states
+        if state is not None
+    ]
+    return results, _sum_counters(list(worker_counters.values()))
+
+
 # ---------------------------------------------------------------------------
 # Summarization
 # ---------------------------------------------------------------------------
@@ -1209,18 +1478,44 @@ def summarize_totals(entity_summaries: Sequence[Dict[str, Any]]) -> Dict[str, in
 def validate_jsonld_frames(
     root: Path,
     entity: Optional[str],
-    validator_url: str,
+    client: BiovalidatorClient,
     repo_root: Optional[Path] = None,
     input_file: Optional[Path] = None,
     debug_snapshots: bool = False,
+    workers: int = 1,
+    jobs: Optional[int] = None,
+    stream: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    registry: Optional[SchemaRegistry] = None,
+    incremental: Optional[IncrementalRun] = None,
 ) -> Dict[str, Any]:
-    """Run frame round-trip tests for a suite, entity, or single file."""
-    assert_validator_reachable(validator_url)
-
-    if repo_root is None:
-        repo_root = find_repo_root(root.resolve())
-
-    id_to_path_map = build_id_to_path_map(repo_root)
+    """Run frame round-trip tests for a suite, entity, or single file.
+
+    With ``workers > 1`` files are sharded across that many processes and
+    Biovalidator requests run on *jobs* threads (default: *workers*). With
+    *stream* files run through all phases one at a time, keeping only their
+    result records. Either way the summary is the same as for a serial run.
+
+    *on_result* is called with every final file result, in input order; in
+    streaming mode as soon as each file is done. A *registry* shared with
+    other checks is used instead of building a new one.
+
+    With *incremental*, files that neither they nor their frame changed for
+    keep their stored result; in streaming mode those are reported first.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if jobs is not None and jobs < 1:
+        raise ValueError("jobs must be a positive integer")
+    if stream and workers > 1:
+        raise ValueError("streaming mode runs in one process; use workers=1")
+    client.assert_reachable()
+
+    if registry is None:
+        if repo_root is None:
+            repo_root = find_repo_root(root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
+    id_to_path_map = registry
     LOGGER.debug("Loaded %d entries in schema/context map", len(id_to_path_map))
 
     entity_dirs, specs, frame_gaps = _discover_inputs(
@@ -1232,13 +1527,64 @@ def validate_jsonld_frames(
     for gap in frame_gaps:
         LOGGER.error("Missing frame.jsonld for entity '%s'", gap)
 
-    results = _run_pipeline(
-        specs,
-        id_to_path_map,
-        validator_url,
-        debug_snapshots,
-    )
-    results_by_path = {result["file"]: result for result in results}
+    reused: Dict[str, Dict[str, Any]] = {}
+    if incremental is not None:
+        for spec in specs:
+            result = incremental.reusable_result(spec["path"], (spec["frame_path"],))
+            if result is not None:
+                reused[str(spec["path"])] = result
+    fresh_specs = [spec for spec in specs if str(spec["path"]) not in reused]
+
+    if workers > 1 and len(fresh_specs) > 1:
+        results, cache_counters = _run_pipeline_in_pool(
+            fresh_specs,
+            id_to_path_map,
+            client,
+            debug_snapshots,
+            workers,
+            jobs or workers,
+        )
+        cache_counters = _sum_counters(
+            [{"context_materialization": id_to_path_map.contexts.stats()}, cache_counters]
+        )
+    else:
+        pyld_cache = PyLDContextCache(make_local_document_loader(id_to_path_map))
+        rdf_comparator = RDFComparator()
+        if stream:
+            results = []
+            if on_result is not None:
+                for result in reused.values():
+                    on_result(result)
+            for result in _stream_pipeline(
+                fresh_specs,
+                id_to_path_map,
+                client,
+                debug_snapshots,
+                pyld_cache,
+                rdf_comparator,
+            ):
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        else:
+            results = _run_pipeline(
+                fresh_specs,
+                id_to_path_map,
+                client,
+                debug_snapshots,
+                pyld_cache,
+                rdf_comparator,
+            )
+        cache_counters = {
+            "context_materialization": id_to_path_map.contexts.stats(),
+            "pyld_context_cache": pyld_cache.stats(),
+            "rdf_comparison": rdf_comparator.stats(),
+        }
+    results_by_path = {**reused, **{result["file"]: result for result in results}}
+    if on_result is not None and not stream:
+        for spec in specs:
+            if str(spec["path"]) in results_by_path:
+                on_result(results_by_path[str(spec["path"])])
 
     entity_summaries: List[Dict[str, Any]] = []
     for entity_dir in entity_dirs:
@@ -1288,6 +1634,10 @@ def validate_jsonld_frames(
         "routes": list(ROUTES),
         "frame_gaps": frame_gaps,
         **totals,
+        "context_materialization": cache_counters["context_materialization"],
+        "pyld_context_cache": cache_counters.get("pyld_context_cache", {}),
+        "rdf_comparison": cache_counters.get("rdf_comparison", {}),
+        "incremental": incremental.stats() if incremental is not None else None,
         "files": entity_summaries,
     }
     if debug_snapshots and input_file is not None:
@@ -1305,7 +1655,13 @@ def validate_jsonld_frames(
 # ---------------------------------------------------------------------------
 
 
-def _log_results(summary: Dict[str, Any]) -> None:
+def _write_json_line(handle: TextIO, record: Dict[str, Any]) -> None:
+    """Append one record to a JSON Lines stream and flush it."""
+    handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+    handle.flush()
+
+
+def log_results(summary: Dict[str, Any]) -> None:
     """Write a short human-readable result summary to the logger."""
     frame_gaps = summary.get("frame_gaps", [])
     if frame_gaps:
@@ -1343,6 +1699,8 @@ def make_arg_parser() -> argparse.ArgumentParser:
             "Examples:\n"
             "  validate_jsonld_frames --entity cohort -v\n"
             "  validate_jsonld_frames --file path/to/example.json -vv\n"
+            "  validate_jsonld_frames --workers 4 --jobs 8 -v\n"
+            "  validate_jsonld_frames --stream --results-jsonl build/frame_results.jsonl\n"
             "  validate_jsonld_frames --root schemas/entities "
             "--url http://localhost:3020/validate --summary-dir . -v"
         ),
@@ -1370,6 +1728,44 @@ def make_arg_parser() -> argparse.ArgumentParser:
         default=DEFAULT_VALIDATOR_URL,
         help=f"Biovalidator endpoint URL (default: {DEFAULT_VALIDATOR_URL})",
     )
+    add_client_arguments(parser)
+    add_incremental_arguments(parser)
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=positive_int,
+        default=1,
+        help=(
+            "Number of worker processes for the JSON-LD transformation phases "
+            "(default: 1, run serially)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        help=(
+            "Number of Biovalidator requests kept in flight with --workers "
+            "(default: same as --workers)."
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help=(
+            "Run each file through all phases before starting the next one, "
+            "keeping only its result record (default: phase-by-phase batches)."
+        ),
+    )
+    parser.add_argument(
+        "--results-jsonl",
+        type=Path,
+        help=(
+            "Optional JSON Lines file receiving one result record per file; "
+            "with --stream each line is written as soon as the file is done."
+        ),
+    )
     parser.add_argument(
         "--summary-dir",
         type=Path,
@@ -1398,23 +1794,45 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     debug_snapshots = args.input_file is not None and args.verbosity >= 2
     if debug_snapshots and args.print_summary:
         parser.error("--print-summary cannot be combined with --file -vv")
+    if args.stream and args.workers > 1:
+        parser.error("--stream cannot be combined with --workers")
 
     configure_logging(args.verbosity)
     _suppress_third_party_debug()
 
     try:
-        summary = validate_jsonld_frames(
-            args.root,
-            args.entity,
-            args.url,
-            input_file=args.input_file,
-            debug_snapshots=debug_snapshots,
-        )
+        repo_root = find_repo_root(args.root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
+        incremental = incremental_from_args(args, repo_root, registry, SUMMARY_FILENAME)
+        with ExitStack() as stack:
+            client = stack.enter_context(
+                client_from_args(args.url, args, pool_size=args.jobs or args.workers)
+            )
+            on_result = None
+            if args.results_jsonl is not None:
+                args.results_jsonl.parent.mkdir(parents=True, exist_ok=True)
+                handle = stack.enter_context(
+                    args.results_jsonl.open("w", encoding="utf-8")
+                )
+                on_result = partial(_write_json_line, handle)
+            summary = validate_jsonld_frames(
+                args.root,
+                args.entity,
+                client,
+                input_file=args.input_file,
+                debug_snapshots=debug_snapshots,
+                workers=args.workers,
+                jobs=args.jobs,
+                stream=args.stream,
+                on_result=on_result,
+                registry=registry,
+                incremental=incremental,
+            )
     except (FileNotFoundError, RuntimeError, ValueError) as exc:
         LOGGER.error(str(exc))
         sys.exit(2)
 
-    _log_results(summary)
+    log_results(summary)
     if args.summary_dir:
         write_json_summary(summary, args.summary_dir, SUMMARY_FILENAME)
     if args.print_summary:
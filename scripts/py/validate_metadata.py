@@ -2,7 +2,8 @@
 """validate_metadata.py - FEGA CLI validator
 
 Validate one or many FEGA JSON metadata records against a running
-Biovalidator instance and emit a machine-readable summary.
+Biovalidator instance (or in-process with ``--engine local``) and emit a
+machine-readable summary.
 """
 from __future__ import annotations
 
@@ -11,21 +12,33 @@ import datetime as _dt
 import json
 import logging
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
-
-import requests
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 try:
     from fega_tools.biovalidator import (
+        DEFAULT_BATCH_SIZE,
         DEFAULT_VALIDATOR_URL,
-        assert_validator_reachable,
+        add_client_arguments,
         classify_response,
-        post_to_validator,
     )
-    from fega_tools.io import collect_candidate_json
+    from fega_tools.io import collect_candidate_json, sniff_json_object_keys
+    from fega_tools.jsonld_utils import find_repo_root
+    from fega_tools.local_validator import (
+        LocalValidator,
+        ValidationEngine,
+        add_engine_arguments,
+        engine_from_args,
+    )
     from fega_tools.logging_utils import configure_logging
-    from fega_tools.validation_common import load_wrapped_example
+    from fega_tools.schema_registry import SchemaRegistry
+    from fega_tools.validation_cache import (
+        ValidationCache,
+        add_cache_arguments,
+        cache_from_args,
+    )
+    from fega_tools.validation_common import DOCUMENT_CACHE, load_wrapped_example, positive_int
 except ModuleNotFoundError as exc:
     msg = (
         "ERROR:  The helper package 'fega_tools' is not importable.\n"
@@ -36,86 +49,169 @@ except ModuleNotFoundError as exc:
 
 logger = logging.getLogger(Path(__file__).stem)
 
+# Documents loaded per window, as a multiple of the batch size.
+BATCH_WINDOW_FACTOR = 20
+
 # -------
 # Discovery helpers
 # -------
-def filter_metadata_files(json_files: Sequence[Path]) -> List[Path]:
-    """Keep only those JSON files that expose 'data' and 'schema' keys."""
-    valid: List[Path] = []
+WRAPPER_KEYS = frozenset({"data", "schema"})
+
+
+def iter_metadata_documents(
+    json_files: Iterable[Path],
+    sniff: bool = False,
+) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """Lazily yield ``(path, document)`` for JSON files with 'data' and 'schema' keys.
+
+    Each file is parsed once, and only when the consumer asks for it; the
+    documents stay in :data:`DOCUMENT_CACHE` until the consumer discards
+    them. With *sniff*, files whose top-level keys show they are not wrapped documents
+    are skipped before being decoded.
+    """
     for fp in json_files:
+        if sniff and not sniff_json_object_keys(fp, WRAPPER_KEYS):
+            logger.debug(f"Skipping '{fp}': top-level keys lack 'data' and 'schema'")
+            continue
         try:
-            load_wrapped_example(fp)
-            valid.append(fp)
+            document = load_wrapped_example(fp)
         except json.JSONDecodeError as exc:
             logger.warning(f"Not valid JSON file ('{fp}'). Error: {exc}")
+            continue
         except (OSError, ValueError) as exc:
             logger.debug(f"Skipping '{fp}': {exc}")
+            continue
+        yield fp, document
+
+
+def filter_metadata_files(json_files: Sequence[Path], sniff: bool = False) -> List[Path]:
+    """Keep only those JSON files that expose 'data' and 'schema' keys."""
+    valid: List[Path] = []
+    for fp, _document in iter_metadata_documents(json_files, sniff):
+        DOCUMENT_CACHE.discard(fp)
+        valid.append(fp)
     return valid
 
 # -------
 # Core routine
 # -------
-def validate_paths(inputs: Sequence[Path], validator_url: str) -> Dict[str, Any]:
-    """Validate metadata located at *inputs* and build a summary dictionary."""
+def _validate_window(
+    window: Sequence[Tuple[Path, Dict[str, Any]]],
+    client: ValidationEngine,
+    cache: ValidationCache | None,
+    batch_size: int,
+) -> List[Any]:
+    """Return one validator response (or request exception) per document, in order."""
+    paths = [fp for fp, _document in window]
+    documents = [document for _fp, document in window]
+    responses: List[Any] = [None] * len(paths)
+    cache_keys: List[str | None] = [None] * len(paths)
+    pending: List[int] = []
+
+    for index, (fp, document) in enumerate(zip(paths, documents)):
+        if cache is not None:
+            cache_keys[index] = cache.key_for(document, client.url)
+            cached = cache.get(cache_keys[index])
+            if cached is not None:
+                logger.debug(f"Using cached validation result for '{fp}'")
+                responses[index] = cached["errors"]
+                continue
+        logger.debug(f"Validating '{fp}'")
+        pending.append(index)
+
+    fresh = client.validate_many([documents[index] for index in pending], batch_size)
+    for index, resp in zip(pending, fresh):
+        responses[index] = resp
+        if cache is not None and not isinstance(resp, Exception):
+            cache.put(cache_keys[index], classify_response(resp), resp)
+
+    return responses
+
+
+def validate_paths(
+    inputs: Sequence[Path],
+    client: ValidationEngine,
+    cache: ValidationCache | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sniff: bool = False,
+) -> Dict[str, Any]:
+    """Validate metadata located at *inputs* and build a summary dictionary.
+
+    With a *cache*, documents whose content and referenced schemas are
+    unchanged since a previous run reuse the stored outcome. With
+    ``batch_size > 1``, documents sharing a schema are sent to the validator's
+    batch route together. Candidates are discovered and parsed lazily, one
+    window at a time; *sniff* skips non-wrapper JSON before decoding it.
+    """
     try:
-        assert_validator_reachable(validator_url)
+        client.assert_reachable()
     except RuntimeError as exc:
         logger.error(str(exc))
         sys.exit(2)
 
     all_json = collect_candidate_json(inputs)
-    targets = filter_metadata_files(all_json)
+    logger.info(f"Discovered {len(all_json)} JSON file(s)")
+    documents = iter_metadata_documents(all_json, sniff)
+
+    n_targets = 0
+    failed_files: List[str] = []
+    errors_of_failed_files: Dict[str, Any] = {}
+
+    # Validate in windows so batches can group documents sharing a schema
+    # without holding every document of a large submission in memory.
+    window_size = batch_size * BATCH_WINDOW_FACTOR
+    while True:
+        window = list(islice(documents, window_size))
+        if not window:
+            break
+        n_targets += len(window)
+        responses = _validate_window(window, client, cache, batch_size)
+
+        for (fp, _document), resp in zip(window, responses):
+            request_error = isinstance(resp, Exception)
+            if request_error:
+                resp = str(resp)
 
-    if not targets:
+            if request_error:
+                failed_files.append(str(fp))
+                errors_of_failed_files[str(fp)] = [resp]
+                logger.error(f"Validation FAILED (request error) for '{fp}'")
+
+            elif classify_response(resp) == "validation_failed":
+                failed_files.append(str(fp))
+                errors_of_failed_files[str(fp)] = resp
+                logger.error(f"Validation FAILED for '{fp}'")
+
+            elif classify_response(resp) == "validation_passed":
+                logger.debug(f"Validation PASSED for '{fp}'")
+
+            else:
+                failed_files.append(str(fp))
+                errors_of_failed_files[str(fp)] = ["Unrecognised validator response"]
+                logger.error(f"Validation FAILED (unknown response) for '{fp}'")
+
+        # Only the current window is kept: drop its documents from the shared cache.
+        for fp, _document in window:
+            DOCUMENT_CACHE.discard(fp)
+
+    if not n_targets:
         logger.error(
             "No JSON metadata files with 'data' and 'schema' keys were found under the given inputs."
         )
         sys.exit(1)
 
-    logger.info(
-        f"Discovered {len(all_json)} JSON file(s); {len(targets)} qualify for validation"
-    )
-
-    failed_files: List[str] = []
-    errors_of_failed_files: Dict[str, Any] = {}
-
-    for fp in targets:
-        logger.debug(f"Validating '{fp}'")
-        document = load_wrapped_example(fp)
-
-        try:
-            resp = post_to_validator(document, validator_url)
-            request_error = False
-        except (requests.RequestException, json.JSONDecodeError) as exc:
-            request_error = True
-            resp = str(exc)
-
-        if request_error:
-            failed_files.append(str(fp))
-            errors_of_failed_files[str(fp)] = [resp]
-            logger.error(f"Validation FAILED (request error) for '{fp}'")
-
-        elif classify_response(resp) == "validation_failed":
-            failed_files.append(str(fp))
-            errors_of_failed_files[str(fp)] = resp
-            logger.error(f"Validation FAILED for '{fp}'")
-
-        elif classify_response(resp) == "validation_passed":
-            logger.debug(f"Validation PASSED for '{fp}'")
-
-        else:
-            failed_files.append(str(fp))
-            errors_of_failed_files[str(fp)] = ["Unrecognised validator response"]
-            logger.error(f"Validation FAILED (unknown response) for '{fp}'")
+    logger.info(f"{n_targets} of {len(all_json)} JSON file(s) qualified for validation")
 
     summary = {
         "timestamp": _dt.datetime.now(tz=_dt.timezone.utc).isoformat(timespec="seconds"),
-        "validator_url": validator_url,
+        "validator_url": client.url,
         "input_paths": [str(p) for p in inputs],
-        "n_total_files": len(targets),
+        "n_total_files": n_targets,
         "n_failed_files": len(failed_files),
         "failed_files": failed_files,
         "errors_of_failed_files": errors_of_failed_files,
+        "cache": cache.stats() if cache is not None else None,
+        "local_engine": client.stats() if isinstance(client, LocalValidator) else None,
     }
 
     return summary
@@ -126,7 +222,7 @@ def validate_paths(inputs: Sequence[Path], validator_url: str) -> Dict[str, Any]
 def make_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="validate_metadata",
-        description="Validate FEGA JSON metadata using a Biovalidator endpoint.",
+        description="Validate FEGA JSON metadata using a Biovalidator endpoint or the local engine.",
         epilog=(
             "Examples:\n"
             "  validate_metadata schemas/entities             # walk entity schema dir\n"
@@ -147,6 +243,31 @@ def make_arg_parser() -> argparse.ArgumentParser:
         default=DEFAULT_VALIDATOR_URL,
         help=f"Biovalidator /validate endpoint (default: {DEFAULT_VALIDATOR_URL})",
     )
+    add_engine_arguments(parser)
+    add_client_arguments(parser)
+    add_cache_arguments(parser)
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Documents sharing a schema sent per request to the batch route; "
+            f"falls back to one per request if unsupported (default: {DEFAULT_BATCH_SIZE})."
+        ),
+    )
+    parser.add_argument(
+        "--batch-url",
+        help="Biovalidator batch endpoint (default: '<url>/batch'; unused with a batch size of 1).",
+    )
+    parser.add_argument(
+        "--sniff",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip JSON files whose top-level keys show they are not wrapped "
+            "metadata before fully decoding them (useful for large directories)."
+        ),
+    )
     parser.add_argument(
         "--verbosity",
         "-v",
@@ -163,7 +284,15 @@ def main(argv: Sequence[str] | None = None) -> None:
 
     configure_logging(args.verbosity)
 
-    summary = validate_paths(args.inputs, args.validator_url)
+    # Wrapped documents reference this repository's schemas by URL.
+    repo_root = find_repo_root(Path(__file__).resolve().parent)
+    id_to_path_map = SchemaRegistry.from_repo(repo_root)
+    cache = cache_from_args(args, id_to_path_map)
+
+    with engine_from_args(args, repo_root, id_to_path_map) as client:
+        summary = validate_paths(args.inputs, client, cache, args.batch_size, args.sniff)
+    if cache is not None:
+        cache.prune()
 
     json.dump(summary, sys.stdout, indent=2)
     sys.stdout.write("\n")
@@ -11,20 +11,31 @@ from pathlib import Path
 from typing import Any, Dict, List, Sequence, Set, Tuple
 
 try:
+    from fega_tools.incremental import (
+        IncrementalRun,
+        add_incremental_arguments,
+        incremental_from_args,
+    )
     from fega_tools.io import collect_candidate_json
     from fega_tools.jsonld_utils import (
-        build_id_to_path_map,
         find_repo_root,
         materialize_context,
+        replace_context,
     )
     from fega_tools.logging_utils import configure_logging
     from fega_tools.rdf_utils import (
+        DEFAULT_SHACL_BATCH_SIZE,
+        RdfStore,
+        ShaclValidator,
+        add_rdf_store_arguments,
         collect_candidate_rdf,
         extract_types_from_graph,
         jsonld_to_rdf_graph,
         load_rdf_from_file,
+        rdf_store_from_args,
         validate_against_shacl,
     )
+    from fega_tools.schema_registry import SchemaRegistry
     from fega_tools.validation_common import (
         BASIC_COUNT_KEYS as COUNT_KEYS,
         CATEGORIES,
@@ -38,6 +49,7 @@ try:
         find_entity_dirs,
         find_example_coverage_gaps,
         load_wrapped_example,
+        positive_int,
         write_json_summary,
     )
 except ModuleNotFoundError as exc:
@@ -71,14 +83,15 @@ def materialize_data_context(
     input_path: Path,
     id_to_path_map: Dict[str, Path],
 ) -> Dict[str, Any]:
-    """Return JSON-LD data with any repository context URL resolved locally."""
+    """Return JSON-LD data with any repository context URL resolved locally.
+
+    The result shares everything but its top-level object with *jsonld_data*.
+    """
     context = jsonld_data.get("@context")
     if context is None:
         return jsonld_data
 
-    data_copy = json.loads(json.dumps(jsonld_data))
-    data_copy["@context"] = materialize_context(context, input_path, id_to_path_map)
-    return data_copy
+    return replace_context(jsonld_data, materialize_context(context, input_path, id_to_path_map))
 
 
 def root_has_required_type(
@@ -210,64 +223,80 @@ def load_shapes(shapes_paths: Sequence[Path]) -> Tuple[List[Path], List[Any], An
     return shape_files, shape_graphs, merged_shapes, expected_types
 
 
-def validate_file_shacl(
+def _script_error(result: Dict[str, Any], exc: Exception) -> Dict[str, Any]:
+    result.pop("types", None)
+    result.update(
+        {
+            "status": SCRIPT_ERROR_STATUS,
+            "errors": [str(exc)],
+            "conforms": False,
+            "types": [],
+            "n_violations": 0,
+            "violation_summary": [],
+        }
+    )
+    return result
+
+
+def prepare_file_shacl(
     path: Path,
-    shapes_graph: Any,
     id_to_path_map: Dict[str, Path],
     required_root_type: str | None = None,
-) -> Dict[str, Any]:
-    """Validate one wrapped EGA metadata file against merged SHACL shapes."""
+    rdf_store: RdfStore | None = None,
+) -> Tuple[Dict[str, Any], Any]:
+    """Load one wrapped example as an RDF data graph ready for SHACL validation.
+
+    Returns ``(result, data_graph)``. When the file cannot be validated
+    (unreadable, or missing *required_root_type*) *result* is already final
+    and *data_graph* is ``None``. The data graph is created in *rdf_store*
+    (default: in memory).
+    """
     result: Dict[str, Any] = {"file": str(path)}
 
     try:
         document = load_wrapped_example(path)
         jsonld_data = materialize_data_context(document["data"], path, id_to_path_map)
-        data_graph = jsonld_to_rdf_graph(jsonld_data)
-        found_types = sorted(extract_types_from_graph(data_graph))
-        if required_root_type:
-            if not root_has_required_type(jsonld_data, required_root_type):
-                result.update(
-                    {
-                        "status": INVALID_STATUS,
-                        "conforms": False,
-                        "types": found_types,
-                        "n_violations": 0,
-                        "violation_summary": [],
-                        "errors": [
-                            f"Required root RDF type not found: {required_root_type}"
-                        ],
-                    }
-                )
-                return result
-        conforms, report_text, report_dict = validate_against_shacl(
-            data_graph=data_graph,
-            shapes_graph=shapes_graph,
-        )
+        data_graph = jsonld_to_rdf_graph(jsonld_data, store=rdf_store)
+        result["types"] = sorted(extract_types_from_graph(data_graph))
+        if required_root_type and not root_has_required_type(jsonld_data, required_root_type):
+            result.update(
+                {
+                    "status": INVALID_STATUS,
+                    "conforms": False,
+                    "types": result.pop("types"),
+                    "n_violations": 0,
+                    "violation_summary": [],
+                    "errors": [
+                        f"Required root RDF type not found: {required_root_type}"
+                    ],
+                }
+            )
+            return result, None
     except (OSError, json.JSONDecodeError, ValueError, KeyError) as exc:
-        result.update(
-            {
-                "status": SCRIPT_ERROR_STATUS,
-                "errors": [str(exc)],
-                "conforms": False,
-                "types": [],
-                "n_violations": 0,
-                "violation_summary": [],
-            }
-        )
-        return result
+        return _script_error(result, exc), None
+
+    return result, data_graph
 
+
+def finish_file_shacl(
+    result: Dict[str, Any],
+    report_dict: Dict[str, Any],
+    report_text: str | None = None,
+) -> Dict[str, Any]:
+    """Complete a result from :func:`prepare_file_shacl` with its SHACL report."""
+    conforms = report_dict["conforms"]
     violations = report_dict.get("violations", [])
-    status = VALID_STATUS if conforms else INVALID_STATUS
     result.update(
         {
-            "status": status,
+            "status": VALID_STATUS if conforms else INVALID_STATUS,
             "conforms": conforms,
-            "types": found_types,
+            "types": result.pop("types"),
             "n_violations": len(violations),
             "violation_summary": _build_violation_summary(violations),
-            "shacl_report": report_text,
         }
     )
+    if report_text is not None:
+        result["shacl_report"] = report_text
 
     if not conforms:
         result["errors"] = build_error_messages(violations)
@@ -275,6 +304,96 @@ def validate_file_shacl(
     return result
 
 
+def validate_file_shacl(
+    path: Path,
+    shapes_graph: Any,
+    id_to_path_map: Dict[str, Path],
+    required_root_type: str | None = None,
+) -> Dict[str, Any]:
+    """Validate one wrapped EGA metadata file against merged SHACL shapes.
+
+    *shapes_graph* is the merged shapes graph or, faster when validating many
+    files, a :class:`~fega_tools.rdf_utils.ShaclValidator` built from it; the
+    data graph is created in the validator's RDF store.
+    """
+    # A plain rdflib Graph also has a ``store``: only a validator's RDF store applies.
+    rdf_store = shapes_graph.store if isinstance(shapes_graph, ShaclValidator) else None
+    result, data_graph = prepare_file_shacl(path, id_to_path_map, required_root_type, rdf_store)
+    if data_graph is None:
+        return result
+
+    try:
+        # The data graph is private to this file, so RDFS inference may extend it.
+        _conforms, report_text, report_dict = validate_against_shacl(
+            data_graph=data_graph,
+            shapes_graph=shapes_graph,
+            inplace=True,
+        )
+    except ValueError as exc:
+        return _script_error(result, exc)
+
+    return finish_file_shacl(result, report_dict, report_text)
+
+
+def _validate_prepared_batch(
+    prepared: Sequence[Tuple[Dict[str, Any], Any]],
+    shacl_validator: ShaclValidator,
+    batch_size: int,
+) -> None:
+    """Finish the results of *prepared* files with one batched SHACL run."""
+    pending = [(result, graph) for result, graph in prepared if graph is not None]
+    try:
+        reports = shacl_validator.validate_batch([graph for _result, graph in pending], batch_size)
+    except Exception as exc:  # noqa: BLE001 – pyshacl raises diverse exceptions
+        LOGGER.warning("Batched SHACL validation failed (%s); validating one file at a time", exc)
+        for result, graph in pending:
+            try:
+                _conforms, report_text, report_dict = validate_against_shacl(
+                    graph, shacl_validator, inplace=True
+                )
+            except ValueError as file_exc:
+                _script_error(result, file_exc)
+            else:
+                finish_file_shacl(result, report_dict)
+    else:
+        for (result, _graph), report_dict in zip(pending, reports):
+            finish_file_shacl(result, report_dict)
+
+
+def validate_files_shacl(
+    paths: Sequence[Path],
+    shacl_validator: ShaclValidator,
+    id_to_path_map: Dict[str, Path],
+    required_root_type: str | None = None,
+    batch_size: int = 1,
+) -> List[Dict[str, Any]]:
+    """Validate wrapped example files, several data graphs per SHACL run.
+
+    With *batch_size* above 1 the files are loaded and validated
+    *batch_size* at a time: their data graphs are validated in one pyshacl
+    run and the results are split back per file (see
+    :meth:`~fega_tools.rdf_utils.ShaclValidator.validate_batch`); the
+    per-file records then carry no ``shacl_report`` text. Only one batch of
+    data graphs is held at a time, in the validator's RDF store. A batch that fails is retried one file
+    at a time so the error is reported for its file.
+    """
+    if batch_size <= 1:
+        return [
+            validate_file_shacl(path, shacl_validator, id_to_path_map, required_root_type)
+            for path in paths
+        ]
+
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(paths), batch_size):
+        prepared = [
+            prepare_file_shacl(path, id_to_path_map, required_root_type, shacl_validator.store)
+            for path in paths[start:start + batch_size]
+        ]
+        _validate_prepared_batch(prepared, shacl_validator, batch_size)
+        results.extend(result for result, _graph in prepared)
+    return results
+
+
 def expected_status_for(expectation: str) -> str:
     """Return the file status that satisfies one suite category."""
     return VALID_STATUS if expectation == "valid" else INVALID_STATUS
@@ -311,17 +430,30 @@ def summarize_category(
     expected_types: Set[str],
     coverage_gaps: Sequence[Dict[str, Any]],
     required_root_type: str | None,
+    incremental: IncrementalRun | None = None,
+    batch_size: int = 1,
 ) -> Dict[str, Any]:
     """Validate one entity's examples for one category and summarize results."""
     category_dir = entity_dir / "examples" / category
     files = collect_candidate_json([category_dir]) if category_dir.is_dir() else []
     expected_status = expected_status_for(category)
-    results = []
 
-    for path in files:
-        result = validate_file_shacl(
-            path, shapes_graph, id_to_path_map, required_root_type
+    reused = {
+        path: incremental.reusable_result(path) if incremental is not None else None
+        for path in files
+    }
+    to_check = [path for path in files if reused[path] is None]
+    checked = dict(
+        zip(
+            to_check,
+            validate_files_shacl(
+                to_check, shapes_graph, id_to_path_map, required_root_type, batch_size
+            ),
         )
+    )
+    results = []
+    for path in files:
+        result = reused[path] or checked[path]
         results.append(result)
         outcome = "passed" if result["status"] == expected_status else "failed"
         LOGGER.debug("Validated '%s' [expected: %s] -> %s", path.name, category, outcome)
@@ -366,6 +498,8 @@ def summarize_entity(
     expected_types: Set[str],
     coverage_gaps: Sequence[Dict[str, Any]],
     required_root_type: str | None,
+    incremental: IncrementalRun | None = None,
+    batch_size: int = 1,
 ) -> Dict[str, Any]:
     """Validate and summarize all SHACL example categories for one entity."""
     return {
@@ -379,6 +513,8 @@ def summarize_entity(
                 expected_types,
                 coverage_gaps,
                 required_root_type,
+                incremental,
+                batch_size,
             )
             for category in CATEGORIES
         },
@@ -419,8 +555,21 @@ def validate_rdf_shacl(
     all_entities: bool = False,
     include_shacl_reports: bool = False,
     required_root_type: str | None = None,
+    registry: SchemaRegistry | None = None,
+    shapes: Tuple[List[Path], List[Any], Any, Set[str]] | None = None,
+    incremental: IncrementalRun | None = None,
+    batch_size: int = 1,
+    rdf_store: RdfStore | None = None,
 ) -> Dict[str, Any]:
-    """Validate valid and invalid FEGA examples against RDF/SHACL shapes."""
+    """Validate valid and invalid FEGA examples against RDF/SHACL shapes.
+
+    *registry* and *shapes* (the result of :func:`load_shapes`) can be shared
+    with other runs; they are built from the repository and *shapes_paths*
+    when omitted. With *incremental*, files that neither they nor the shape
+    files changed for keep their stored result. With *batch_size* above 1,
+    up to that many examples of a category are validated in one SHACL run.
+    Data graphs are created in *rdf_store* (default: in memory).
+    """
     entity_dirs = find_entity_dirs(
         root,
         entity,
@@ -430,9 +579,15 @@ def validate_rdf_shacl(
     if not entity_dirs:
         raise FileNotFoundError(f"No entity schema directories found under {root}")
 
-    repo_root = find_repo_root(entity_dirs[0].resolve())
-    id_to_path_map = build_id_to_path_map(repo_root)
-    shape_files, _shape_graphs, merged_shapes, expected_types = load_shapes(shapes_paths)
+    if registry is None:
+        registry = SchemaRegistry.from_repo(find_repo_root(entity_dirs[0].resolve()))
+    id_to_path_map = registry
+    if shapes is None:
+        shapes = load_shapes(shapes_paths)
+    shape_files, _shape_graphs, merged_shapes, expected_types = shapes
+    shacl_validator = ShaclValidator(merged_shapes, store=rdf_store)
+    if incremental is not None:
+        incremental.add_shared_dependencies(shape_files)
 
     coverage_gaps = find_example_coverage_gaps(entity_dirs, CATEGORIES)
     for gap in coverage_gaps:
@@ -446,11 +601,13 @@ def validate_rdf_shacl(
     file_summaries = [
         summarize_entity(
             entity_dir,
-            merged_shapes,
+            shacl_validator,
             id_to_path_map,
             expected_types,
             coverage_gaps,
             required_root_type,
+            incremental,
+            batch_size,
         )
         for entity_dir in entity_dirs
     ]
@@ -480,6 +637,10 @@ def validate_rdf_shacl(
         "input_paths": input_paths,
         "category_totals": category_totals,
         "coverage_gaps": coverage_gaps,
+        "context_materialization": id_to_path_map.contexts.stats(),
+        "shacl_validator": shacl_validator.stats(),
+        "rdf_store": rdf_store.stats() if rdf_store is not None else None,
+        "incremental": incremental.stats() if incremental is not None else None,
         "files": file_summaries,
     }
 
@@ -492,7 +653,7 @@ def validate_rdf_shacl(
     return summary
 
 
-def _log_results(summary: Dict[str, Any]) -> None:
+def log_results(summary: Dict[str, Any]) -> None:
     """Emit INFO-level result lines for the validation run."""
     category_totals = summary["category_totals"]
     valid_passed = category_totals["valid"]["validation_passed"]
@@ -553,6 +714,7 @@ def make_arg_parser() -> argparse.ArgumentParser:
         type=Path,
         help=f"Optional directory where {SUMMARY_FILENAME} is written.",
     )
+    add_incremental_arguments(parser)
     parser.add_argument(
         "--print-summary",
         action="store_true",
@@ -564,6 +726,18 @@ def make_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include raw pySHACL validation reports in the JSON summary.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help=(
+            "Validate up to N examples in one SHACL run and split the results back "
+            f"per file (default: 1; bulk runs: e.g. {DEFAULT_SHACL_BATCH_SIZE}). "
+            "Not combinable with --shacl-report."
+        ),
+    )
+    add_rdf_store_arguments(parser)
     parser.add_argument(
         "--required-root-type",
         help="Require a root RDF node with this type IRI before SHACL conformance.",
@@ -582,9 +756,13 @@ def main(argv: Sequence[str] | None = None) -> None:
     """Run the command-line interface and exit with the suite status."""
     parser = make_arg_parser()
     args = parser.parse_args(argv)
+    if args.batch_size > 1 and args.shacl_report:
+        parser.error("--shacl-report needs per-file SHACL runs; drop --batch-size")
     configure_logging(args.verbosity)
 
     try:
+        repo_root = find_repo_root(args.root.resolve())
+        registry = SchemaRegistry.from_repo(repo_root)
         summary = validate_rdf_shacl(
             args.root,
             args.entity,
@@ -592,12 +770,16 @@ def main(argv: Sequence[str] | None = None) -> None:
             all_entities=args.all_entities,
             include_shacl_reports=args.shacl_report,
             required_root_type=args.required_root_type,
+            registry=registry,
+            incremental=incremental_from_args(args, repo_root, registry, SUMMARY_FILENAME),
+            batch_size=args.batch_size,
+            rdf_store=rdf_store_from_args(args),
         )
     except (FileNotFoundError, RuntimeError, ValueError) as exc:
         LOGGER.error(str(exc))
         sys.exit(2)
 
-    _log_results(summary)
+    log_results(summary)
 
     if args.summary_dir:
         write_json_summary(summary, args.summary_dir, SUMMARY_FILENAME)
@@ -1,18 +1,264 @@
 """Shared Biovalidator HTTP helpers."""
 from __future__ import annotations
 
-from typing import Any, Dict
+import argparse
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout
+from urllib3.util.retry import Retry
 
 from fega_tools.validation_common import (
     INVALID_STATUS,
     UNKNOWN_STATUS,
     VALID_STATUS,
+    non_negative_int,
+    positive_float,
+    positive_int,
 )
 
+LOGGER = logging.getLogger(__name__)
+
 DEFAULT_VALIDATOR_URL = "http://localhost:3020/validate"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 300.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503)
+DEFAULT_BATCH_SIZE = 1
+# Status codes meaning "this validator has no batch route".
+BATCH_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
+
+class BiovalidatorClient:
+    """Reusable Biovalidator client backed by a pooled keep-alive session.
+
+    One client should be shared by every request of a run (including across
+    threads) so TCP/TLS connections are reused instead of being rebuilt for
+    each file. Validation requests are idempotent, so POSTs are retried with
+    exponential backoff on 502/503 responses and on connection errors. Read
+    timeouts are not retried: a slow validator costs one ``read_timeout``
+    per request, not one per attempt.
+
+    :meth:`validate_many` can group documents that share a schema into one
+    request to ``batch_url``. The batch route receives
+    ``{"schema": {...}, "data": [d1, d2, ...]}`` and must answer with one
+    ``/validate``-style response per data item, in order. Validators without
+    that route are detected once and served one document per request.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_VALIDATOR_URL,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        batch_url: Optional[str] = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive integer")
+        if retries < 0:
+            raise ValueError("retries must be zero or a positive integer")
+
+        self.url = url
+        self.pool_size = pool_size
+        self.batch_url = batch_url or url.rstrip("/") + "/batch"
+        self.batch_supported: Optional[bool] = None
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+            pool_block=True,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "BiovalidatorClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def assert_reachable(self, timeout_seconds: float = 5) -> None:
+        """Raise RuntimeError if the Biovalidator endpoint is not reachable."""
+        try:
+            self.session.get(self.url, timeout=(self.connect_timeout, timeout_seconds))
+        except (ConnectionError, Timeout, requests.RequestException) as exc:
+            raise RuntimeError(
+                f"Cannot reach Biovalidator endpoint '{self.url}': {exc}"
+            ) from exc
+
+    def validate(self, document: Dict[str, Any]) -> Any:
+        """Send a wrapper document to Biovalidator and return the parsed JSON body."""
+        response = self.session.post(
+            self.url,
+            json=document,
+            timeout=(self.connect_timeout, self.read_timeout),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def validate_many(
+        self,
+        documents: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Any]:
+        """Validate many wrapper documents, batching those that share a schema.
+
+        Returns one entry per input document, in input order: the parsed
+        response, or the exception raised while validating that document
+        (``requests.RequestException`` or ``ValueError``), so callers can
+        keep per-file error handling.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        results: List[Any] = [None] * len(documents)
+        groups: Dict[str, List[int]] = {}
+        for index, document in enumerate(documents):
+            schema = document.get("schema")
+            if batch_size > 1 and isinstance(schema, dict) and isinstance(schema.get("$ref"), str):
+                group_key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+                groups.setdefault(group_key, []).append(index)
+            else:
+                results[index] = self._validate_or_error(document)
+
+        for indices in groups.values():
+            for start in range(0, len(indices), batch_size):
+                chunk = indices[start : start + batch_size]
+                responses = self._validate_batch([documents[index] for index in chunk])
+                for index, response in zip(chunk, responses):
+                    results[index] = response
+
+        return results
+
+    def _validate_or_error(self, document: Dict[str, Any]) -> Any:
+        """Validate one document, returning request/decoding errors as values."""
+        try:
+            return self.validate(document)
+        except (requests.RequestException, ValueError) as exc:
+            return exc
+
+    def _validate_batch(self, documents: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Validate documents sharing one schema, falling back to single requests."""
+        if len(documents) == 1 or self.batch_supported is False:
+            return [self._validate_or_error(document) for document in documents]
+
+        request_body = {
+            "schema": documents[0]["schema"],
+            "data": [document.get("data") for document in documents],
+        }
+        try:
+            response = self.session.post(
+                self.batch_url,
+                json=request_body,
+                timeout=(self.connect_timeout, self.read_timeout),
+            )
+            if response.status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+                LOGGER.info(
+                    "Biovalidator batch route '%s' unavailable (HTTP %d); "
+                    "validating one document per request",
+                    self.batch_url,
+                    response.status_code,
+                )
+                self.batch_supported = False
+                return [self._validate_or_error(document) for document in documents]
+            response.raise_for_status()
+            batch_response = response.json()
+        except (requests.RequestException, ValueError) as exc:
+            return [exc] * len(documents)
+
+        if not isinstance(batch_response, list) or len(batch_response) != len(documents):
+            LOGGER.warning(
+                "Unexpected Biovalidator batch response shape from '%s'; "
+                "validating one document per request",
+                self.batch_url,
+            )
+            self.batch_supported = False
+            return [self._validate_or_error(document) for document in documents]
+
+        self.batch_supported = True
+        return batch_response
+
+
+def add_client_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared Biovalidator connection options to a CLI parser."""
+    parser.add_argument(
+        "--connect-timeout",
+        type=positive_float,
+        default=DEFAULT_CONNECT_TIMEOUT,
+        help=f"Seconds to wait for a Biovalidator connection (default: {DEFAULT_CONNECT_TIMEOUT:g}).",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=positive_float,
+        default=DEFAULT_READ_TIMEOUT,
+        help=f"Seconds to wait for a Biovalidator response (default: {DEFAULT_READ_TIMEOUT:g}).",
+    )
+    parser.add_argument(
+        "--retries",
+        type=non_negative_int,
+        default=DEFAULT_RETRIES,
+        help=(
+            "Retries with backoff on 502/503 responses and connection resets "
+            f"(default: {DEFAULT_RETRIES})."
+        ),
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=positive_int,
+        help=(
+            "Pooled Biovalidator connections (default: one per request kept in flight, "
+            f"or {DEFAULT_POOL_SIZE})."
+        ),
+    )
+
+
+def client_from_args(
+    url: str,
+    args: argparse.Namespace,
+    pool_size: Optional[int] = None,
+) -> BiovalidatorClient:
+    """Build a client from options added by :func:`add_client_arguments`.
+
+    ``--pool-size`` takes precedence over *pool_size*, the number of requests
+    the caller keeps in flight. ``--batch-url`` is only registered by CLIs
+    that batch requests; the others use the default batch route.
+    """
+    return BiovalidatorClient(
+        url,
+        pool_size=args.pool_size or pool_size or DEFAULT_POOL_SIZE,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        retries=args.retries,
+        batch_url=getattr(args, "batch_url", None),
+    )
 
 
 def assert_validator_reachable(url: str, timeout_seconds: int = 5) -> None:
@@ -24,7 +270,11 @@ def assert_validator_reachable(url: str, timeout_seconds: int = 5) -> None:
 
 
 def post_to_validator(document: Dict[str, Any], url: str) -> Any:
-    """Send a wrapper document to Biovalidator and return the parsed JSON body."""
+    """Send a wrapper document to Biovalidator and return the parsed JSON body.
+
+    One-off helper; prefer a shared :class:`BiovalidatorClient` for runs that
+    validate more than a handful of documents.
+    """
     response = requests.post(
         url,
         json=document,
@@ -0,0 +1,437 @@
+"""depgraph.py - persisted forward/reverse dependency index of schema files
+------------------------------------------------------------------------
+
+:class:`DependencyGraph` records, at JSON-Pointer granularity, every
+reference between the JSON documents below ``schemas/`` and ``standards/``:
+
+* ``$ref`` - schema references, including an example's ``schema.$ref``;
+* ``@context`` - context imports, the ``@context`` of schemas and frames and
+  an example's ``data.@context``.
+
+An edge runs from the node holding the reference (``file#/pointer``) to the
+node it resolves to: ``#/$defs/ontologyTerm`` for a schema fragment, or
+``#/@context`` for a context, since that is the part of the document that is
+materialized. The forward edges of every file are stored in
+``build/dependency_graph.json`` together with the file's modification time,
+size and SHA-256, so a refresh only parses files whose content changed. The
+reverse index is derived from the forward edges when the graph is loaded.
+
+:meth:`DependencyGraph.dependents` walks the reverse index from changed nodes
+and only visits what they can affect. A change at ``/$defs/a`` affects every
+reference to ``/$defs/a``, to anything below it or to an ancestor of it (such
+as a whole-file ``$ref``), and everything that depends on those in turn.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote, urldefrag
+
+from fega_tools.jsonld_utils import GITHUB_RAW_PREFIX, resolve_ref
+from fega_tools.schema_index import SKIPPED_DIRECTORIES
+from fega_tools.validation_cache import resolve_schema_file
+
+LOGGER = logging.getLogger(__name__)
+
+GRAPH_FORMAT_VERSION = "2"
+DEFAULT_GRAPH_PATH = Path("build") / "dependency_graph.json"
+DEFAULT_GRAPH_ROOTS = ("schemas", "standards")
+INDEXED_SUFFIXES = (".json", ".jsonld")
+REF_KIND = "$ref"
+CONTEXT_KIND = "@context"
+CONTEXT_POINTER = "/@context"
+
+# (file, JSON Pointer); files are repository-relative POSIX paths.
+Node = Tuple[str, str]
+
+
+class Edge(NamedTuple):
+    """One reference from ``source#source_pointer`` to ``target#target_pointer``."""
+
+    kind: str
+    source: str
+    source_pointer: str
+    target: str
+    target_pointer: str
+
+
+# -------
+# JSON Pointer helpers
+# -------
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def format_node(node: Node) -> str:
+    """Render a node as ``file#/pointer`` (just ``file`` for the whole document)."""
+    path, pointer = node
+    return f"{path}#{pointer}" if pointer else path
+
+
+def parse_node(value: str) -> Node:
+    """Split ``file#/pointer`` into a node; the pointer defaults to the whole file."""
+    path, _sep, fragment = value.partition("#")
+    pointer = unquote(fragment)
+    if pointer and not pointer.startswith("/"):
+        raise ValueError(f"'{value}' does not end in a JSON Pointer fragment")
+    return path, pointer
+
+
+def pointers_overlap(first: str, second: str) -> bool:
+    """Return whether one JSON Pointer equals or contains the other."""
+    if len(first) > len(second):
+        first, second = second, first
+    return second == first or second.startswith(first + "/")
+
+
+def changed_pointers(old: Any, new: Any, pointer: str = "") -> List[str]:
+    """Return the outermost JSON Pointers at which two JSON values differ.
+
+    Objects are compared key by key and arrays of equal length item by item;
+    anything else that differs is reported at its own pointer.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed: List[str] = []
+        for key in sorted(set(old) | set(new)):
+            child = f"{pointer}/{_escape(key)}"
+            if key in old and key in new:
+                changed.extend(changed_pointers(old[key], new[key], child))
+            else:
+                changed.append(child)
+        return changed
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        changed = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            changed.extend(changed_pointers(old_item, new_item, f"{pointer}/{index}"))
+        return changed
+    return [pointer]
+
+
+def _iter_references(value: Any, pointer: str = "") -> Iterator[Tuple[str, str, str]]:
+    """Yield ``(kind, pointer, reference)`` for every ``$ref``/``@context`` string."""
+    if isinstance(value, dict):
+        ref = value.get(REF_KIND)
+        if isinstance(ref, str):
+            yield REF_KIND, pointer, ref
+        context = value.get(CONTEXT_KIND)
+        context_pointer = f"{pointer}/{_escape(CONTEXT_KIND)}"
+        if isinstance(context, str):
+            yield CONTEXT_KIND, context_pointer, context
+        elif isinstance(context, list):
+            for index, item in enumerate(context):
+                if isinstance(item, str):
+                    yield CONTEXT_KIND, f"{context_pointer}/{index}", item
+        for key, child in value.items():
+            yield from _iter_references(child, f"{pointer}/{_escape(key)}")
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _iter_references(item, f"{pointer}/{index}")
+
+
+# -------
+# Graph
+# -------
+
+class DependencyGraph:
+    """Incrementally maintained reference graph of the repository's JSON documents.
+
+    Call :meth:`load` once, then query it with :meth:`dependents` and
+    :meth:`dependencies`. *id_to_path_map* resolves ``$id`` and raw-GitHub
+    references, usually the run's :class:`~fega_tools.schema_registry.SchemaRegistry`.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        id_to_path_map: Mapping[str, Path],
+        graph_path: Optional[Path] = None,
+        roots: Iterable[str] = DEFAULT_GRAPH_ROOTS,
+    ) -> None:
+        self.repo_root = repo_root.resolve()
+        self.id_to_path_map = id_to_path_map
+        self.graph_path = (
+            graph_path if graph_path is not None else repo_root / DEFAULT_GRAPH_PATH
+        )
+        self.roots = tuple(roots)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.forward: Dict[str, List[Edge]] = {}
+        self.reverse: Dict[str, List[Edge]] = {}
+        self.full_rebuild = False
+        self.reresolved = False
+        self.reused_files = 0
+        self.rehashed_files = 0
+        self.reparsed_files = 0
+
+    # -------
+    # Paths
+    # -------
+
+    def relative(self, path: Path) -> str:
+        """Return the repository-relative POSIX form of *path* (absolute if outside)."""
+        resolved = path.resolve()
+        try:
+            return resolved.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def absolute(self, rel: str) -> Path:
+        """Inverse of :meth:`relative`."""
+        return self.repo_root / rel
+
+    def covers(self, path: Path) -> bool:
+        """Return whether *path* is one of the indexed documents."""
+        return self.relative(path) in self.files
+
+    # -------
+    # Snapshot IO
+    # -------
+
+    def _id_digest(self) -> str:
+        entries = sorted((key, self.relative(Path(path))) for key, path in self.id_to_path_map.items())
+        return hashlib.sha256(json.dumps(entries).encode("utf-8")).hexdigest()
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with self.graph_path.open("r", encoding="utf-8") as handle:
+                snapshot = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != GRAPH_FORMAT_VERSION
+            or snapshot.get("raw_prefix") != GITHUB_RAW_PREFIX
+            or snapshot.get("roots") != list(self.roots)
+            or not isinstance(snapshot.get("files"), dict)
+        ):
+            return None
+        return snapshot
+
+    def _write_snapshot(self, id_digest: str) -> None:
+        payload = json.dumps(
+            {
+                "version": GRAPH_FORMAT_VERSION,
+                "raw_prefix": GITHUB_RAW_PREFIX,
+                "roots": list(self.roots),
+                "ids": id_digest,
+                "files": dict(sorted(self.files.items())),
+            },
+            indent=1,
+        )
+        try:
+            self.graph_path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(dir=self.graph_path.parent, suffix=".tmp")
+        except OSError as exc:
+            LOGGER.debug("Cannot write dependency graph '%s': %s", self.graph_path, exc)
+            return
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                temp_file.write(payload)
+            os.replace(temp_name, self.graph_path)
+        except OSError as exc:
+            LOGGER.debug("Cannot write dependency graph '%s': %s", self.graph_path, exc)
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+
+    # -------
+    # Refresh
+    # -------
+
+    def _walk(self) -> Set[str]:
+        found: Set[str] = set()
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(self.repo_root / root):
+                dirnames[:] = sorted(name for name in dirnames if name not in SKIPPED_DIRECTORIES)
+                rel_dir = Path(dirpath).relative_to(self.repo_root).as_posix()
+                found.update(
+                    f"{rel_dir}/{name}" for name in filenames if name.endswith(INDEXED_SUFFIXES)
+                )
+        return found
+
+    def _refresh_entry(self, rel: str, previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the up-to-date entry of one file, or None if it vanished."""
+        path = self.absolute(rel)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if (
+            previous is not None
+            and previous.get("mtime_ns") == stat.st_mtime_ns
+            and previous.get("size") == stat.st_size
+        ):
+            self.reused_files += 1
+            return previous
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        entry: Dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        if previous is not None and previous.get("sha256") == digest:
+            self.rehashed_files += 1
+            for key in ("references", "edges", "unresolved", "error"):
+                if key in previous:
+                    entry[key] = previous[key]
+            return entry
+
+        self.reparsed_files += 1
+        try:
+            document = json.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            entry["references"] = []
+            entry["error"] = f"cannot parse: {exc}"
+            return entry
+        entry["references"] = [list(reference) for reference in _iter_references(document)]
+        return entry
+
+    def _resolve(self, rel: str, entry: Dict[str, Any]) -> None:
+        """Store the resolved edges of one file in its entry."""
+        current = self.absolute(rel)
+        edges: List[List[str]] = []
+        unresolved: List[str] = []
+        error: Optional[str] = entry.get("error")
+        if error is not None and not error.startswith("cannot parse"):
+            error = None
+        for kind, pointer, reference in entry["references"]:
+            if kind == REF_KIND:
+                target = resolve_schema_file(reference, current, dict(self.id_to_path_map))
+                fragment = unquote(urldefrag(reference)[1])
+                target_pointer = fragment if fragment.startswith("/") else ""
+            else:
+                try:
+                    target = resolve_ref(reference, current, self.id_to_path_map)
+                except FileNotFoundError:
+                    target = None
+                target_pointer = CONTEXT_POINTER
+            if target is None:
+                unresolved.append(reference)
+                # Contexts that cannot be materialized and $refs to deleted or
+                # renamed schemas fail validation outright; as broken files they
+                # seed every query, which keeps their referrers reachable.
+                error = error or f"unresolved {kind} reference"
+                continue
+            edges.append([kind, pointer, self.relative(target), target_pointer])
+        entry["edges"] = edges
+        entry["unresolved"] = unresolved
+        if error:
+            entry["error"] = error
+        else:
+            entry.pop("error", None)
+
+    def load(self) -> "DependencyGraph":
+        """Refresh the graph from disk, reparsing only changed files."""
+        snapshot = self._read_snapshot()
+        previous_files: Dict[str, Dict[str, Any]] = {}
+        if snapshot is None:
+            self.full_rebuild = True
+        else:
+            previous_files = snapshot["files"]
+
+        found = self._walk()
+        files: Dict[str, Dict[str, Any]] = {}
+        for rel in sorted(found):
+            entry = self._refresh_entry(rel, previous_files.get(rel))
+            if entry is not None:
+                files[rel] = entry
+
+        # Edges are resolved again whenever a reference may point elsewhere:
+        # after a $id changed or a file was added or removed.
+        id_digest = self._id_digest()
+        self.reresolved = (
+            snapshot is None or snapshot.get("ids") != id_digest or set(files) != set(previous_files)
+        )
+        for rel, entry in files.items():
+            if self.reresolved or "edges" not in entry:
+                entry = dict(entry)
+                self._resolve(rel, entry)
+                files[rel] = entry
+        self.files = files
+
+        if snapshot is None or files != previous_files or snapshot.get("ids") != id_digest:
+            self._write_snapshot(id_digest)
+        self._build_indexes()
+        LOGGER.debug("Dependency graph '%s': %s", self.graph_path, self.stats())
+        return self
+
+    def _build_indexes(self) -> None:
+        self.forward = {}
+        self.reverse = {}
+        for rel, entry in self.files.items():
+            edges = [Edge(kind, rel, pointer, target, target_pointer)
+                     for kind, pointer, target, target_pointer in entry["edges"]]
+            self.forward[rel] = edges
+            for edge in edges:
+                self.reverse.setdefault(edge.target, []).append(edge)
+
+    # -------
+    # Queries
+    # -------
+
+    def broken_files(self) -> Set[str]:
+        """Files that cannot be parsed or whose ``@context`` or ``$ref`` cannot be resolved."""
+        return {rel for rel, entry in self.files.items() if entry.get("error")}
+
+    def dependents(self, changed: Iterable[Node]) -> Set[Node]:
+        """Return every node that can be affected by the *changed* nodes.
+
+        The changed nodes themselves are not included unless something that
+        depends on them is also changed.
+        """
+        found: Set[Node] = set()
+        pending = list(changed)
+        while pending:
+            path, pointer = pending.pop()
+            for edge in self.reverse.get(path, ()):
+                node = (edge.source, edge.source_pointer)
+                if node not in found and pointers_overlap(edge.target_pointer, pointer):
+                    found.add(node)
+                    pending.append(node)
+        return found
+
+    def dependencies(self, nodes: Iterable[Node]) -> Set[Node]:
+        """Return every node the given nodes use, directly or not."""
+        found: Set[Node] = set()
+        pending = list(nodes)
+        while pending:
+            path, pointer = pending.pop()
+            for edge in self.forward.get(path, ()):
+                node = (edge.target, edge.target_pointer)
+                if node not in found and pointers_overlap(edge.source_pointer, pointer):
+                    found.add(node)
+                    pending.append(node)
+        return found
+
+    def affected_paths(self, changed: Iterable[Path]) -> Set[Path]:
+        """Return the changed files and every file a change to them can affect.
+
+        Whole files are treated as changed. Files that cannot be parsed or
+        resolved are always included, since checking them fails regardless.
+        """
+        seeds = [(self.relative(path), "") for path in changed]
+        seeds.extend((rel, "") for rel in self.broken_files())
+        nodes = set(seeds) | self.dependents(seeds)
+        return {self.absolute(path).resolve() for path, _pointer in nodes}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and refresh counters for debugging and benchmarks."""
+        return {
+            "files": len(self.files),
+            "edges": sum(len(edges) for edges in self.forward.values()),
+            "broken_files": len(self.broken_files()),
+            "full_rebuild": self.full_rebuild,
+            "reresolved": self.reresolved,
+            "reused_files": self.reused_files,
+            "rehashed_files": self.rehashed_files,
+            "reparsed_files": self.reparsed_files,
+        }
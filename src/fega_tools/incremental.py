@@ -0,0 +1,349 @@
+"""incremental.py - re-check only inputs affected by changes since a git revision
+-------------------------------------------------------------------------------
+
+With ``--changed-since REV`` the validation scripts ask ``git`` which files
+changed since *REV* (committed, staged, unstaged and untracked) and re-check
+only the inputs those changes can affect. Every other input keeps its result
+from the summary stored by the previous run in ``--summary-dir``; the fresh
+and stored results are merged into one summary.
+
+An input is affected when the input itself or any file it depends on
+changed. Example dependencies are the schema files reachable from its
+``schema.$ref`` and the context files reachable from its ``data.@context``;
+entity dependencies (coverage) are those of the entity schema and its
+frame. Checks can add files of their own, such as a frame, or files every
+input depends on, such as SHACL shapes.
+Touching ``schemas/common/schema.json`` therefore re-checks every entity that
+references it, while touching one example re-checks only that example.
+
+With a :class:`~fega_tools.depgraph.DependencyGraph` the affected files are
+found once, by walking the reverse dependency index from the changed files,
+instead of resolving the dependencies of every input; inputs outside the
+graph fall back to the per-input resolution.
+
+Inputs are re-checked anyway when their dependencies cannot be resolved, when
+the stored summary has no definitive result for them, or when any Python
+file (the validation code itself) changed. Command-line options are not
+compared: the stored summary must come from a run with the same options.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Set
+
+from fega_tools.depgraph import DependencyGraph
+from fega_tools.validation_cache import schema_dependency_paths
+from fega_tools.validation_common import (
+    INVALID_STATUS,
+    VALID_STATUS,
+    load_json_document,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+REUSABLE_STATUSES = (VALID_STATUS, INVALID_STATUS)
+
+
+# -------
+# git
+# -------
+
+def _git_paths(repo_root: Path, *args: str) -> Set[Path]:
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(repo_root), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError("git is required for --changed-since") from exc
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"git {' '.join(args)} failed: {exc.stderr.strip()}") from exc
+    return {(repo_root / name).resolve() for name in completed.stdout.split("\0") if name}
+
+
+def git_changed_paths(repo_root: Path, rev: str) -> Set[Path]:
+    """Return files that differ from *rev* in the working tree, plus untracked files.
+
+    Renames are reported as a deletion and an addition, so dependents of the
+    old path are re-checked too. Raises RuntimeError when git fails.
+    """
+    changed = _git_paths(repo_root, "diff", "--name-only", "--no-renames", "-z", rev, "--")
+    return changed | _git_paths(repo_root, "ls-files", "--others", "--exclude-standard", "-z")
+
+
+def git_file_at(repo_root: Path, rev: str, path: Path) -> Optional[bytes]:
+    """Return the content of *path* at *rev*, or None when it did not exist there."""
+    rel = path.resolve().relative_to(repo_root.resolve()).as_posix()
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(repo_root), "show", f"{rev}:./{rel}"],
+            check=True,
+            capture_output=True,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError("git is required for --changed-since") from exc
+    except subprocess.CalledProcessError:
+        return None
+    return completed.stdout
+
+
+# -------
+# Previous results
+# -------
+
+def load_previous_summary(summary_dir: Path, filename: str) -> Optional[Dict[str, Any]]:
+    """Return the summary stored by the previous run, or None when unreadable."""
+    path = summary_dir / filename
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            summary = json.load(handle)
+    except FileNotFoundError:
+        LOGGER.warning("No previous summary at '%s'; every input will be checked", path)
+        return None
+    except (OSError, json.JSONDecodeError) as exc:
+        LOGGER.warning("Ignoring unreadable previous summary '%s': %s", path, exc)
+        return None
+    return summary if isinstance(summary, dict) else None
+
+
+def _collect_file_results(value: Any, found: Dict[str, Dict[str, Any]]) -> None:
+    if isinstance(value, dict):
+        if isinstance(value.get("file"), str) and "status" in value:
+            found[value["file"]] = value
+            return
+        for child in value.values():
+            _collect_file_results(child, found)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_file_results(item, found)
+
+
+def previous_file_results(summary: Optional[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map every per-file result record of a summary by its ``file`` path."""
+    found: Dict[str, Dict[str, Any]] = {}
+    if summary is not None:
+        _collect_file_results(summary.get("files", []), found)
+    return found
+
+
+# -------
+# Change-aware selection
+# -------
+
+class IncrementalRun:
+    """Decide which inputs to re-check and hand out reusable results.
+
+    *changed* holds resolved paths; *id_to_path_map* is usually the run's
+    :class:`~fega_tools.schema_registry.SchemaRegistry`, whose context
+    materializer records the context-import DAG. A loaded *graph* answers
+    "is this input affected?" for every file it indexes.
+    """
+
+    def __init__(
+        self,
+        changed: Iterable[Path],
+        id_to_path_map: Mapping[str, Path],
+        previous_summary: Optional[Mapping[str, Any]] = None,
+        rev: Optional[str] = None,
+        graph: Optional[DependencyGraph] = None,
+    ) -> None:
+        self.changed: Set[Path] = {path.resolve() for path in changed}
+        self.graph = graph
+        self.affected: Optional[Set[Path]] = (
+            graph.affected_paths(self.changed) if graph is not None else None
+        )
+        self.id_to_path_map = id_to_path_map
+        self.rev = rev
+        self.previous_results = previous_file_results(previous_summary)
+        self.previous_entities: Dict[str, Dict[str, Any]] = {
+            result["entity"]: result
+            for result in (previous_summary or {}).get("files", [])
+            if isinstance(result, dict) and isinstance(result.get("entity"), str)
+        }
+        self.tooling_changed = any(path.suffix == ".py" for path in self.changed)
+        self.shared_dependencies: Set[Path] = set()
+        # schema $ref -> schema files, or the refs below it that do not resolve.
+        self._schema_dependencies: Dict[str, Set[Path]] = {}
+        self._unresolved_refs: Dict[str, Set[str]] = {}
+        self.rechecked = 0
+        self.reused = 0
+
+    def _schema_files(self, schema_ref: str) -> Set[Path]:
+        """Return the schema files below *schema_ref*.
+
+        Raises ``ValueError`` when any ref below it does not resolve (e.g. a
+        deleted or renamed schema), so its dependents are re-checked.
+        """
+        if schema_ref not in self._schema_dependencies:
+            paths, unresolved = schema_dependency_paths(schema_ref, dict(self.id_to_path_map))
+            self._schema_dependencies[schema_ref] = set(paths)
+            self._unresolved_refs[schema_ref] = set(unresolved)
+        if self._unresolved_refs[schema_ref]:
+            raise ValueError(
+                f"Unresolved refs below '{schema_ref}': {sorted(self._unresolved_refs[schema_ref])}"
+            )
+        return self._schema_dependencies[schema_ref]
+
+    def _context_files(self, context: Any, current_file: Path) -> Set[Path]:
+        if context is None:
+            return set()
+        materializer = getattr(self.id_to_path_map, "contexts", None)
+        if materializer is None:
+            raise ValueError("Context dependencies need a SchemaRegistry")
+        return materializer.dependencies(context, current_file)
+
+    def example_dependencies(self, path: Path) -> Set[Path]:
+        """Return the example file plus every schema and context file it uses.
+
+        Raises like the loaders do when the example or a reference is broken.
+        """
+        document = load_json_document(path)
+        schema_ref = document["schema"]["$ref"]
+        dependencies = {path.resolve()} | self._schema_files(schema_ref)
+        return dependencies | self._context_files(document["data"].get("@context"), path)
+
+    def entity_dependencies(self, entity_dir: Path) -> Set[Path]:
+        """Return the entity schema, frame and every schema/context file they use."""
+        schema_path = (entity_dir / "schema.json").resolve()
+        frame_path = (entity_dir / "frame.jsonld").resolve()
+        schema = load_json_document(schema_path)
+        dependencies = {schema_path, frame_path} | self._schema_files(schema["$id"])
+        dependencies |= self._context_files(schema.get("@context"), schema_path)
+        if frame_path.is_file():
+            frame = load_json_document(frame_path)
+            dependencies |= self._context_files(frame.get("@context"), frame_path)
+        return dependencies
+
+    def add_shared_dependencies(self, paths: Iterable[Path]) -> None:
+        """Record files every input of the run depends on (e.g. SHACL shapes)."""
+        self.shared_dependencies.update(path.resolve() for path in paths)
+
+    def _unaffected(
+        self,
+        inputs: Sequence[Path],
+        dependencies: Callable[[], Set[Path]],
+        extra: Sequence[Path],
+    ) -> bool:
+        if self.tooling_changed:
+            return False
+        if (self.shared_dependencies | {path.resolve() for path in extra}) & self.changed:
+            return False
+        if (
+            self.graph is not None
+            and self.affected is not None
+            and all(self.graph.covers(path) for path in inputs)
+        ):
+            return not any(path.resolve() in self.affected for path in inputs)
+        return not dependencies() & self.changed
+
+    def reusable_result(
+        self,
+        path: Path,
+        extra_dependencies: Sequence[Path] = (),
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored result for *path* if no change can affect it, else None."""
+        previous = self.previous_results.get(str(path))
+        try:
+            reusable = (
+                previous is not None
+                and previous.get("status") in REUSABLE_STATUSES
+                and self._unaffected(
+                    [path],
+                    lambda: self.example_dependencies(path),
+                    extra_dependencies,
+                )
+            )
+        except (OSError, json.JSONDecodeError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.debug("Re-checking '%s': cannot resolve its dependencies: %s", path, exc)
+            reusable = False
+        return self._count(previous if reusable else None, path)
+
+    def reusable_entity_result(
+        self,
+        entity_dir: Path,
+        extra_dependencies: Sequence[Path] = (),
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored entity-level result if no change can affect it, else None."""
+        previous = self.previous_entities.get(entity_dir.name)
+        try:
+            reusable = (
+                previous is not None
+                and not previous.get("script_errors")
+                and self._unaffected(
+                    [entity_dir / "schema.json", entity_dir / "frame.jsonld"],
+                    lambda: self.entity_dependencies(entity_dir),
+                    extra_dependencies,
+                )
+            )
+        except (OSError, json.JSONDecodeError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.debug("Re-checking '%s': cannot resolve its dependencies: %s", entity_dir, exc)
+            reusable = False
+        return self._count(previous if reusable else None, entity_dir)
+
+    def _count(self, result: Optional[Dict[str, Any]], path: Path) -> Optional[Dict[str, Any]]:
+        if result is None:
+            self.rechecked += 1
+        else:
+            self.reused += 1
+            LOGGER.debug("Reusing stored result for '%s'", path)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the selection counters for run summaries."""
+        return {
+            "changed_since": self.rev,
+            "changed_files": len(self.changed),
+            "tooling_changed": self.tooling_changed,
+            "rechecked": self.rechecked,
+            "reused": self.reused,
+            "dependency_graph": self.graph is not None,
+        }
+
+
+# -------
+# CLI helpers
+# -------
+
+def add_incremental_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--changed-since`` option to a CLI parser."""
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help=(
+            "Only re-check inputs affected by changes since git revision REV; other "
+            "results are taken from the previous summary in --summary-dir."
+        ),
+    )
+
+
+def incremental_from_args(
+    args: argparse.Namespace,
+    repo_root: Path,
+    id_to_path_map: Mapping[str, Path],
+    summary_filename: str,
+) -> Optional[IncrementalRun]:
+    """Build an :class:`IncrementalRun` from :func:`add_incremental_arguments` options.
+
+    Returns None without ``--changed-since``. Raises RuntimeError when git
+    fails or no ``--summary-dir`` is given. The affected inputs are selected
+    through the persisted :class:`~fega_tools.depgraph.DependencyGraph`.
+    """
+    if not args.changed_since:
+        return None
+    if args.summary_dir is None:
+        raise RuntimeError("--changed-since needs --summary-dir to find the previous summary")
+    changed = git_changed_paths(repo_root, args.changed_since)
+    LOGGER.info("%d file(s) changed since %s", len(changed), args.changed_since)
+    return IncrementalRun(
+        changed,
+        id_to_path_map,
+        load_previous_summary(args.summary_dir, summary_filename),
+        rev=args.changed_since,
+        graph=DependencyGraph(repo_root, id_to_path_map).load(),
+    )
@@ -3,12 +3,25 @@ io.py - file-system helpers for FEGA tools
 """
 from __future__ import annotations
 
+import json
 import logging
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
 from pathlib import Path
-from typing import List, Sequence, Set
+from typing import AbstractSet, List, Optional, Sequence, Set
 
 LOGGER = logging.getLogger(__name__)
 
+SNIFF_PREFIX_BYTES = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match is not None else pos
+
 def collect_candidate_json(paths: Sequence[Path]) -> List[Path]:
     """Return every *.json file found in *paths* (files **or** directories)."""
     files: Set[Path] = set()
@@ -28,3 +41,86 @@ def collect_candidate_json(paths: Sequence[Path]) -> List[Path]:
             LOGGER.debug(f"Ignoring non-JSON path: {p}")
 
     return sorted(files)
+
+
+# -------
+# Top-level key sniffing
+# -------
+
+def _skip_value(text: str, pos: int) -> Optional[int]:
+    """Return the index just past the JSON value at *pos*, or None if truncated.
+
+    The value is scanned by the C JSON decoder and discarded right away.
+    """
+    pos = _skip_whitespace(text, pos)
+    try:
+        return _DECODER.raw_decode(text, pos)[1]
+    except json.JSONDecodeError:
+        return None
+
+
+def _scan_object_keys(text: str, keys: AbstractSet[str]) -> Optional[bool]:
+    """Return whether the top-level JSON object in *text* has all *keys*.
+
+    Returns None when *text* ends (or stops looking like JSON) before the
+    answer is known.
+    """
+    pos = _skip_whitespace(text, 0)
+    if pos >= len(text):
+        return None
+    if text[pos] != "{":
+        return False if text[pos] in '["-0123456789tfn' else None
+
+    missing = set(keys)
+    pos += 1
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if pos >= len(text):
+            return None
+        token = text[pos]
+        if token == "}":
+            return False
+        if token == ",":
+            pos += 1
+            continue
+        if token != '"':
+            return None
+        try:
+            key, pos = scanstring(text, pos + 1)
+        except ValueError:
+            return None
+        missing.discard(key)
+        if not missing:
+            return True
+        pos = _skip_whitespace(text, pos)
+        if not text.startswith(":", pos):
+            return None
+        skipped = _skip_value(text, pos + 1)
+        if skipped is None:
+            return None
+        pos = skipped
+
+
+def sniff_json_object_keys(
+    path: Path,
+    keys: AbstractSet[str],
+    prefix_bytes: int = SNIFF_PREFIX_BYTES,
+) -> bool:
+    """Cheaply check that *path* holds a JSON object with all top-level *keys*.
+
+    Only top-level keys are collected; values before the last needed key are
+    scanned and discarded, and the scan stops as soon as the answer is known,
+    usually within the first *prefix_bytes*. Returns False only when the file is
+    certainly not such an object; malformed or unreadable files return True
+    so that the full parse reports the problem.
+    """
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(prefix_bytes)
+            verdict = _scan_object_keys(head.decode("utf-8", errors="ignore"), keys)
+            if verdict is None and len(head) == prefix_bytes:
+                content = head + handle.read()
+                verdict = _scan_object_keys(content.decode("utf-8", errors="ignore"), keys)
+    except OSError:
+        return True
+    return verdict is not False
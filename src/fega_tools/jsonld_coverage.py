@@ -3,19 +3,26 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urldefrag
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
+from fega_tools.incremental import IncrementalRun
 from fega_tools.jsonld_utils import (
     JSONLD_KEYWORDS,
-    build_id_to_path_map,
     context_terms_and_prefixes,
     find_repo_root,
     is_known_jsonld_key,
+    load_json_file,
     materialize_context,
     validate_context_term_mappings,
 )
+from fega_tools.schema_registry import (
+    SchemaRegistry,
+    get_pointer as _get_pointer,
+    json_pointer_parts,
+)
 from fega_tools.validation_common import find_entity_dirs
 
 IGNORED_SCHEMA_PROPERTIES = {"@context", "@id", "@type", "@graph"}
@@ -29,43 +36,25 @@ TRAVERSAL_KEYS = (
     "items",
     "contains",
 )
+# Term mappings are probed in chunks of this many terms with --workers, so
+# large entities (biomaterial, dataset) are spread over several processes.
+TERM_PROBE_CHUNK_SIZE = 16
 LOGGER = logging.getLogger(__name__)
 
-def load_json_object(path: Path) -> Dict[str, Any]:
-    """Load a JSON file and require the top-level value to be an object."""
-    with path.open("r", encoding="utf-8") as handle:
-        value = json.load(handle)
+def load_json_object(
+    path: Path,
+    id_to_path_map: Optional[Mapping[str, Path]] = None,
+) -> Dict[str, Any]:
+    """Load a JSON file and require the top-level value to be an object.
+
+    Pass a :class:`SchemaRegistry` as *id_to_path_map* to reuse its parsed copy.
+    """
+    value = load_json_file(path, id_to_path_map)
     if not isinstance(value, dict):
         raise ValueError(f"Expected a JSON object in {path}")
     return value
 
 
-def _json_pointer_parts(fragment: str) -> List[str]:
-    """Return decoded JSON Pointer parts from a URI fragment."""
-    if not fragment:
-        return []
-    if not fragment.startswith("/"):
-        raise ValueError(f"Unsupported non-pointer schema fragment '#{fragment}'")
-    return [
-        part.replace("~1", "/").replace("~0", "~")
-        for part in fragment.lstrip("/").split("/")
-        if part != ""
-    ]
-
-
-def _get_pointer(document: Any, parts: Sequence[str]) -> Any:
-    """Resolve a decoded JSON Pointer inside a JSON document."""
-    current = document
-    for part in parts:
-        if isinstance(current, dict):
-            current = current[part]
-        elif isinstance(current, list):
-            current = current[int(part)]
-        else:
-            raise KeyError(part)
-    return current
-
-
 def _is_fega_schema_path(path: Path, repo_root: Path) -> bool:
     """Return whether *path* is a maintained EGA metadata schema in coverage scope."""
     try:
@@ -84,7 +73,7 @@ def _is_fega_schema_path(path: Path, repo_root: Path) -> bool:
 def _resolve_schema_ref(
     ref: str,
     current_file: Path,
-    id_to_path_map: Dict[str, Path],
+    id_to_path_map: Mapping[str, Path],
     repo_root: Path,
 ) -> Optional[Tuple[Path, List[str]]]:
     """Resolve a JSON Schema ref to an in-scope local schema target."""
@@ -100,7 +89,7 @@ def _resolve_schema_ref(
 
     if not target_path.exists() or not _is_fega_schema_path(target_path, repo_root):
         return None
-    return target_path, _json_pointer_parts(fragment)
+    return target_path, list(json_pointer_parts(fragment))
 
 
 def _add_property_path(
@@ -114,16 +103,16 @@ def _add_property_path(
     property_paths.setdefault(property_name, set()).add(path)
 
 
-def _load_schema(path: Path) -> Dict[str, Any]:
-    """Load a schema object from disk."""
-    loaded = load_json_object(path)
+def _load_schema(path: Path, id_to_path_map: Mapping[str, Path]) -> Dict[str, Any]:
+    """Load a schema object from disk (or from the registry's parsed copy)."""
+    loaded = load_json_object(path, id_to_path_map)
     return loaded
 
 
 def collect_schema_property_paths(
     schema: Dict[str, Any],
     schema_path: Path,
-    id_to_path_map: Dict[str, Path],
+    id_to_path_map: Mapping[str, Path],
     repo_root: Path,
 ) -> Dict[str, Set[str]]:
     """Return FEGA-maintained schema-facing property names and JSON paths.
@@ -138,7 +127,7 @@ def collect_schema_property_paths(
     def schema_for(path: Path) -> Dict[str, Any]:
         resolved = path.resolve()
         if resolved not in loaded_schemas:
-            loaded_schemas[resolved] = _load_schema(resolved)
+            loaded_schemas[resolved] = _load_schema(resolved, id_to_path_map)
         return loaded_schemas[resolved]
 
     def visit(value: Any, current_file: Path, data_path: str) -> None:
@@ -159,7 +148,10 @@ def collect_schema_property_paths(
                     seen_refs.add(ref_key)
                     ref_schema = schema_for(ref_path)
                     try:
-                        target = _get_pointer(ref_schema, pointer_parts)
+                        if isinstance(id_to_path_map, SchemaRegistry):
+                            target = id_to_path_map.fragment(ref_path, pointer_parts)
+                        else:
+                            target = _get_pointer(ref_schema, pointer_parts)
                     except (KeyError, IndexError, TypeError, ValueError) as exc:
                         raise ValueError(
                             f"Cannot resolve schema ref '{ref}' from '{current_file}': {exc}"
@@ -228,21 +220,49 @@ def _empty_entity_result(entity_dir: Path) -> Dict[str, Any]:
     }
 
 
+class _PendingCoverage(NamedTuple):
+    """Entity result waiting for its context term-mapping probes."""
+
+    result: Dict[str, Any]
+    # False when the schema could not be read, so no check ran.
+    context_checked: bool
+    # Materialized context and schema properties to probe; None when the
+    # context could not be materialized (the probes are skipped then).
+    context: Any
+    probe_terms: Optional[List[str]]
+    # Extra frame keys to report if the context has no errors; None when the
+    # frame stage did not complete.
+    unknown_frame_keys: Optional[List[str]]
+
+
 def validate_entity_coverage(
     entity_dir: Path,
-    id_to_path_map: Dict[str, Path],
+    id_to_path_map: Mapping[str, Path],
     repo_root: Path,
 ) -> Dict[str, Any]:
     """Validate context and frame coverage for one entity directory."""
+    pending = _collect_entity_coverage(entity_dir, id_to_path_map, repo_root)
+    term_errors: List[str] = []
+    if pending.probe_terms is not None:
+        term_errors = validate_context_term_mappings(pending.context, set(pending.probe_terms))
+    return _finish_entity_coverage(pending, term_errors)
+
+
+def _collect_entity_coverage(
+    entity_dir: Path,
+    id_to_path_map: Mapping[str, Path],
+    repo_root: Path,
+) -> _PendingCoverage:
+    """Run every coverage check of one entity except the term-mapping probes."""
     result = _empty_entity_result(entity_dir)
     schema_path = entity_dir / "schema.json"
     frame_path = entity_dir / "frame.jsonld"
 
     try:
-        schema = load_json_object(schema_path)
+        schema = load_json_object(schema_path, id_to_path_map)
     except (OSError, json.JSONDecodeError, ValueError) as exc:
         result["script_errors"].append(f"Cannot load schema: {exc}")
-        return result
+        return _PendingCoverage(result, False, None, None, None)
 
     try:
         property_path_map = collect_schema_property_paths(
@@ -253,7 +273,7 @@ def validate_entity_coverage(
         )
     except (OSError, json.JSONDecodeError, ValueError) as exc:
         result["script_errors"].append(f"Cannot collect schema properties: {exc}")
-        return result
+        return _PendingCoverage(result, False, None, None, None)
 
     schema_properties = sorted(property_path_map)
     root_frame_properties = sorted(
@@ -310,14 +330,8 @@ def validate_entity_coverage(
         key: sorted(property_path_map[key])
         for key in result["missing_context_terms"]
     }
-    if not result["context_errors"]:
-        result["context_errors"].extend(
-            validate_context_term_mappings(materialized_context, set(schema_properties))
-        )
-    result["context_coverage_passed"] = (
-        not result["missing_context_terms"]
-        and not result["context_errors"]
-    )
+    probe_context = None if result["context_errors"] else materialized_context
+    probe_terms = None if result["context_errors"] else schema_properties
 
     if not frame_path.is_file():
         result["missing_frame_keys"] = root_frame_properties
@@ -326,13 +340,13 @@ def validate_entity_coverage(
             for key in result["missing_frame_keys"]
         }
         result["frame_errors"].append(f"Frame file not found: {frame_path}")
-        return result
+        return _PendingCoverage(result, True, probe_context, probe_terms, None)
 
     try:
-        frame = load_json_object(frame_path)
+        frame = load_json_object(frame_path, id_to_path_map)
     except (OSError, json.JSONDecodeError, ValueError) as exc:
         result["script_errors"].append(f"Cannot load frame: {exc}")
-        return result
+        return _PendingCoverage(result, True, probe_context, probe_terms, None)
 
     frame_keys = frame_coverage_keys(frame)
     result["frame_keys"] = frame_keys
@@ -348,14 +362,34 @@ def validate_entity_coverage(
         key: sorted(path for path in property_path_map[key] if "." not in path)
         for key in result["missing_frame_keys"]
     }
+    root_frame_property_set = set(root_frame_properties)
+    unknown_frame_keys = [
+        key
+        for key in frame_keys
+        if key not in root_frame_property_set
+        and not is_known_jsonld_key(key, terms, prefixes)
+    ]
+    return _PendingCoverage(result, True, probe_context, probe_terms, unknown_frame_keys)
+
+
+def _finish_entity_coverage(
+    pending: _PendingCoverage,
+    term_errors: Sequence[str],
+) -> Dict[str, Any]:
+    """Apply the term-mapping probe errors and compute the pass flags."""
+    result = pending.result
+    if not pending.context_checked:
+        return result
+    result["context_errors"].extend(term_errors)
+    result["context_coverage_passed"] = (
+        not result["missing_context_terms"]
+        and not result["context_errors"]
+    )
+    if pending.unknown_frame_keys is None:
+        return result
+
     if not result["context_errors"]:
-        root_frame_property_set = set(root_frame_properties)
-        result["unknown_frame_keys"] = [
-            key
-            for key in frame_keys
-            if key not in root_frame_property_set
-            and not is_known_jsonld_key(key, terms, prefixes)
-        ]
+        result["unknown_frame_keys"] = pending.unknown_frame_keys
     result["frame_coverage_passed"] = (
         not result["missing_frame_keys"]
         and not result["unknown_frame_keys"]
@@ -368,7 +402,7 @@ def validate_entity_coverage(
     )
     LOGGER.debug(
         "Entity '%s': missing_context_terms=%s missing_frame_keys=%s unknown_extra_frame_keys=%s",
-        entity_dir.name,
+        result["entity"],
         result["missing_context_terms"],
         result["missing_frame_keys"],
         result["unknown_frame_keys"],
@@ -403,16 +437,91 @@ def summarize_coverage(entity_results: Sequence[Dict[str, Any]]) -> Dict[str, An
     }
 
 
+# ---------------------------------------------------------------------------
+# Process-pool execution
+# ---------------------------------------------------------------------------
+
+_WORKER_REGISTRY: Optional[SchemaRegistry] = None
+
+
+def _init_coverage_worker(id_to_path_map: Dict[str, Path]) -> None:
+    """Give each worker process its own parse-once registry."""
+    global _WORKER_REGISTRY
+    _WORKER_REGISTRY = SchemaRegistry(id_to_path_map)
+
+
+def _collect_in_worker(entity_dir: Path, repo_root: Path) -> _PendingCoverage:
+    assert _WORKER_REGISTRY is not None, "worker was started without _init_coverage_worker"
+    return _collect_entity_coverage(entity_dir, _WORKER_REGISTRY, repo_root)
+
+
+def _probe_chunks(terms: Sequence[str], chunk_size: int) -> List[Set[str]]:
+    """Split sorted *terms* into consecutive chunks.
+
+    validate_context_term_mappings reports terms in sorted order, so joining
+    the chunk results in chunk order reproduces the serial error list.
+    """
+    return [set(terms[start : start + chunk_size]) for start in range(0, len(terms), chunk_size)]
+
+
+def _validate_entities_in_pool(
+    executor: Executor,
+    entity_dirs: Sequence[Path],
+    repo_root: Path,
+    chunk_size: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Fan entity checks, then their term-probe chunks, out to *executor*.
+
+    Probe chunks of an entity are submitted as soon as its collection pass
+    finishes; results are put back together in *entity_dirs* order.
+    """
+    chunk_size = chunk_size or TERM_PROBE_CHUNK_SIZE
+    collect_futures = {
+        executor.submit(_collect_in_worker, entity_dir, repo_root): index
+        for index, entity_dir in enumerate(entity_dirs)
+    }
+    pending: Dict[int, _PendingCoverage] = {}
+    probe_futures: Dict[int, List[Future]] = {}
+    for future in as_completed(collect_futures):
+        index = collect_futures[future]
+        pending[index] = future.result()
+        terms = pending[index].probe_terms
+        probe_futures[index] = [
+            executor.submit(validate_context_term_mappings, pending[index].context, chunk)
+            for chunk in _probe_chunks(terms or [], chunk_size)
+        ]
+
+    results = []
+    for index in range(len(entity_dirs)):
+        term_errors = [
+            error for future in probe_futures[index] for error in future.result()
+        ]
+        results.append(_finish_entity_coverage(pending[index], term_errors))
+    return results
+
+
 def validate_jsonld_coverage(
     root: Path,
     entity: Optional[str],
     repo_root: Optional[Path] = None,
+    workers: int = 1,
+    registry: Optional[SchemaRegistry] = None,
+    incremental: Optional[IncrementalRun] = None,
 ) -> Dict[str, Any]:
-    """Validate schema-driven JSON-LD context and frame coverage."""
+    """Validate schema-driven JSON-LD context and frame coverage.
+
+    With ``workers > 1`` entities and their term-mapping probes are spread
+    over a pool of that many processes; the summary is identical to a serial
+    run. A *registry* shared with other checks is used instead of building
+    a new one. With *incremental*, entities whose schema, context and frame
+    dependencies did not change keep their stored result.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
     if repo_root is None:
         repo_root = find_repo_root(root.resolve())
 
-    id_to_path_map = build_id_to_path_map(repo_root)
+    id_to_path_map = registry if registry is not None else SchemaRegistry.from_repo(repo_root)
     entity_dirs = find_entity_dirs(root, entity, require_schema=True)
     if not entity_dirs:
         raise FileNotFoundError(f"No entity schema directories found under {root}")
@@ -422,8 +531,32 @@ def validate_jsonld_coverage(
         [path.name for path in entity_dirs],
     )
 
+    reused: Dict[str, Dict[str, Any]] = {}
+    if incremental is not None:
+        for entity_dir in entity_dirs:
+            result = incremental.reusable_entity_result(entity_dir)
+            if result is not None:
+                reused[entity_dir.name] = result
+    fresh_dirs = [entity_dir for entity_dir in entity_dirs if entity_dir.name not in reused]
+
+    if workers > 1 and fresh_dirs:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_coverage_worker,
+            initargs=(dict(id_to_path_map),),
+        ) as executor:
+            fresh_results = _validate_entities_in_pool(executor, fresh_dirs, repo_root)
+    else:
+        fresh_results = [
+            validate_entity_coverage(entity_dir, id_to_path_map, repo_root)
+            for entity_dir in fresh_dirs
+        ]
+        LOGGER.debug("Schema registry usage: %s", id_to_path_map.stats())
+    fresh_by_name = {
+        entity_dir.name: result for entity_dir, result in zip(fresh_dirs, fresh_results)
+    }
     entity_results = [
-        validate_entity_coverage(entity_dir, id_to_path_map, repo_root)
+        reused.get(entity_dir.name) or fresh_by_name[entity_dir.name]
         for entity_dir in entity_dirs
     ]
     totals = summarize_coverage(entity_results)
@@ -434,5 +567,6 @@ def validate_jsonld_coverage(
         "entity_names": [path.name for path in entity_dirs],
         "passed": totals["failed_entities"] == 0 and totals["script_errors"] == 0,
         **totals,
+        "incremental": incremental.stats() if incremental is not None else None,
         "files": entity_results,
     }
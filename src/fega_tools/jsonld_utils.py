@@ -2,9 +2,11 @@
 """
 from __future__ import annotations
 
+import copy
 import json
+import threading
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, List, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 GITHUB_RAW_PREFIX = "https://raw.githubusercontent.com/M-casado/fega-metadata-schema/main/"
@@ -58,22 +60,29 @@ def find_repo_root(start: Path) -> Path:
 # $id → local-path map
 # ---------------------------------------------------------------------------
 
-def build_id_to_path_map(repo_root: Path) -> Dict[str, Path]:
-    """Return a dict mapping GitHub raw URLs (and schema $ids) to local Paths.
+def index_repository_documents(
+    repo_root: Path,
+    include_context_documents: bool = True,
+) -> Tuple[Dict[str, Path], Dict[Path, Any]]:
+    """Walk *repo_root* once and return ``(id_to_path_map, parsed_documents)``.
 
-    Covers every ``schema.json`` and every ``context.jsonld`` found under
-    *repo_root*.
+    Every ``schema.json`` is parsed (to read its ``$id``) and registered under
+    its ``$id`` and inferred raw-GitHub URL; every ``context.jsonld`` under its
+    raw-GitHub URL. Parsed documents are keyed by resolved path; contexts are
+    only parsed when *include_context_documents* is true.
     """
     id_map: Dict[str, Path] = {}
+    documents: Dict[Path, Any] = {}
 
     for schema_file in sorted(repo_root.rglob("schema.json")):
         try:
             with schema_file.open("r", encoding="utf-8") as fh:
                 schema = json.load(fh)
+            documents[schema_file.resolve()] = schema
             schema_id = schema.get("$id", "")
             if schema_id:
                 id_map[schema_id] = schema_file
-        except (json.JSONDecodeError, OSError):
+        except (json.JSONDecodeError, OSError, AttributeError):
             pass
         # Register via inferred raw-GitHub URL as well.
         try:
@@ -90,15 +99,48 @@ def build_id_to_path_map(repo_root: Path) -> Dict[str, Path]:
             id_map[url] = context_file
         except ValueError:
             pass
+        if include_context_documents:
+            try:
+                with context_file.open("r", encoding="utf-8") as fh:
+                    documents[context_file.resolve()] = json.load(fh)
+            except (json.JSONDecodeError, OSError):
+                pass
 
+    return id_map, documents
+
+
+def build_id_to_path_map(repo_root: Path) -> Dict[str, Path]:
+    """Return a dict mapping GitHub raw URLs (and schema $ids) to local Paths.
+
+    Covers every ``schema.json`` and every ``context.jsonld`` found under
+    *repo_root*. Use :class:`fega_tools.schema_registry.SchemaRegistry` when
+    the parsed files are needed as well.
+    """
+    id_map, _documents = index_repository_documents(
+        repo_root, include_context_documents=False
+    )
     return id_map
 
 
+def load_json_file(path: Path, id_to_path_map: Optional[Mapping[str, Path]] = None) -> Any:
+    """Parse a JSON file, reusing a schema registry's parsed copy when given one.
+
+    With a plain dict (or None) the file is read from disk on every call. With
+    a :class:`~fega_tools.schema_registry.SchemaRegistry` the result is shared
+    and must not be modified in place.
+    """
+    load = getattr(id_to_path_map, "load_json", None)
+    if load is not None:
+        return load(path)
+    with path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
 # ---------------------------------------------------------------------------
 # Context materialization
 # ---------------------------------------------------------------------------
 
-def resolve_ref(ref: str, current_file: Path, id_to_path_map: Dict[str, Path]) -> Path:
+def resolve_ref(ref: str, current_file: Path, id_to_path_map: Mapping[str, Path]) -> Path:
     """Resolve a context string reference to a local Path.
 
     Checks the URL map first, then falls back to relative-path resolution.
@@ -123,24 +165,31 @@ def resolve_ref(ref: str, current_file: Path, id_to_path_map: Dict[str, Path]) -
 def materialize_context(
     ctx_value: Any,
     current_file: Path,
-    id_to_path_map: Dict[str, Path],
+    id_to_path_map: Mapping[str, Path],
     seen: FrozenSet[Path] = frozenset(),
 ) -> Any:
     """Recursively resolve all string references in *ctx_value* to inline objects.
 
     Returns a context value (dict or list of dicts) that can be passed directly
     to rdflib or PyLD without network requests.
+
+    When *id_to_path_map* is a :class:`~fega_tools.schema_registry.SchemaRegistry`
+    the work is delegated to its :class:`ContextMaterializer`, so every
+    context file is built once per run; the parts it returns are read-only.
     """
+    materializer = getattr(id_to_path_map, "contexts", None)
+    if isinstance(materializer, ContextMaterializer) and not seen:
+        return materializer.materialize(ctx_value, current_file)
+
     if isinstance(ctx_value, str):
         local_path = resolve_ref(ctx_value, current_file, id_to_path_map)
 
         if local_path in seen:
             raise ValueError(f"Circular context reference detected: '{local_path}'")
 
-        with local_path.open("r", encoding="utf-8") as fh:
-            loaded = json.load(fh)
+        loaded = load_json_file(local_path, id_to_path_map)
 
-        if "@context" not in loaded:
+        if not isinstance(loaded, dict) or "@context" not in loaded:
             raise ValueError(f"No '@context' key found in '{local_path}'")
 
         return materialize_context(
@@ -164,6 +213,202 @@ def materialize_context(
     return ctx_value
 
 
+def replace_context(document: Mapping[str, Any], context: Any) -> Dict[str, Any]:
+    """Return *document* with its ``@context`` replaced by *context*.
+
+    Only the top-level object is copied; every other value is shared with
+    *document*, so the result must be treated as read-only (rdflib and PyLD
+    do). This is how materialized contexts are attached to shared example
+    documents without a deep copy.
+    """
+    return {**document, "@context": context}
+
+
+class FrozenJSONDict(dict):
+    """Read-only ``dict`` for shared JSON values.
+
+    Still a ``dict`` for ``json.dumps``, PyLD and rdflib; in-place changes raise
+    ``TypeError``, while ``copy.copy``/``copy.deepcopy`` and pickling give
+    ordinary mutable containers (copy-on-write).
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Shared JSON values are read-only; copy them before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+
+class FrozenJSONList(list):
+    """Read-only ``list`` counterpart of :class:`FrozenJSONDict`."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Shared JSON values are read-only; copy them before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore[assignment]
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+def freeze_json(value: Any) -> Any:
+    """Return a read-only deep copy of a JSON value (frozen parts are reused)."""
+    if isinstance(value, (FrozenJSONDict, FrozenJSONList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenJSONDict((key, freeze_json(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenJSONList(freeze_json(item) for item in value)
+    return value
+
+
+class ContextMaterializer:
+    """Memoizing :func:`materialize_context` shared by every file of a run.
+
+    Each ``(reference, resolved path)`` pair is materialized once, so shared
+    contexts such as ``schemas/common/context.jsonld`` are not rebuilt for
+    every entity, example and frame. Results are frozen with
+    :func:`freeze_json` and shared between callers. :attr:`imports` records
+    the context-import DAG (context file -> context files it references).
+    Safe to use from several threads.
+    """
+
+    def __init__(self, id_to_path_map: Mapping[str, Path]) -> None:
+        self.id_to_path_map = id_to_path_map
+        self.imports: Dict[Path, Set[Path]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[Tuple[str, Path], Any] = {}
+        self._lock = threading.Lock()
+
+    def materialize(self, ctx_value: Any, current_file: Path) -> Any:
+        """Inline every string reference in *ctx_value*, like :func:`materialize_context`."""
+        return self._materialize(ctx_value, current_file, frozenset(), None)
+
+    def _materialize(
+        self,
+        ctx_value: Any,
+        current_file: Path,
+        seen: FrozenSet[Path],
+        importer: Optional[Path],
+    ) -> Any:
+        if isinstance(ctx_value, str):
+            local_path = resolve_ref(ctx_value, current_file, self.id_to_path_map).resolve()
+            if importer is not None:
+                with self._lock:
+                    self.imports.setdefault(importer, set()).add(local_path)
+
+            if local_path in seen:
+                raise ValueError(f"Circular context reference detected: '{local_path}'")
+
+            key = (ctx_value, local_path)
+            with self._lock:
+                if key in self._cache:
+                    self.hits += 1
+                    return self._cache[key]
+
+            loaded = load_json_file(local_path, self.id_to_path_map)
+            if not isinstance(loaded, dict) or "@context" not in loaded:
+                raise ValueError(f"No '@context' key found in '{local_path}'")
+            materialized = freeze_json(
+                self._materialize(loaded["@context"], local_path, seen | {local_path}, local_path)
+            )
+
+            with self._lock:
+                self.imports.setdefault(local_path, set())
+                # Another thread may have won the race; keep the first copy.
+                if key not in self._cache:
+                    self._cache[key] = materialized
+                    self.misses += 1
+                return self._cache[key]
+
+        if isinstance(ctx_value, list):
+            result: List[Any] = []
+            for item in ctx_value:
+                materialized = self._materialize(item, current_file, seen, importer)
+                if isinstance(materialized, list):
+                    result.extend(materialized)
+                else:
+                    result.append(materialized)
+            return result
+
+        # dict or scalar – return as-is
+        return ctx_value
+
+    def import_graph(self) -> Dict[str, List[str]]:
+        """Return the context-import DAG as sorted ``path -> [imported paths]``."""
+        with self._lock:
+            return {
+                str(path): sorted(str(target) for target in targets)
+                for path, targets in sorted(self.imports.items())
+            }
+
+    def dependencies(self, ctx_value: Any, current_file: Path) -> Set[Path]:
+        """Return every context file *ctx_value* references, directly or not.
+
+        *ctx_value* is materialized first, so its imports are in the DAG;
+        materialization errors propagate.
+        """
+        self.materialize(ctx_value, current_file)
+        items = ctx_value if isinstance(ctx_value, list) else [ctx_value]
+        pending = [
+            resolve_ref(item, current_file, self.id_to_path_map).resolve()
+            for item in items
+            if isinstance(item, str)
+        ]
+        found: Set[Path] = set()
+        with self._lock:
+            while pending:
+                path = pending.pop()
+                if path not in found:
+                    found.add(path)
+                    pending.extend(self.imports.get(path, ()))
+        return found
+
+    def dependents(self, path: Path) -> Set[Path]:
+        """Return every context file that imports *path*, directly or not."""
+        target = path.resolve()
+        with self._lock:
+            reverse: Dict[Path, Set[Path]] = {}
+            for importer, targets in self.imports.items():
+                for imported in targets:
+                    reverse.setdefault(imported, set()).add(importer)
+        found: Set[Path] = set()
+        pending = [target]
+        while pending:
+            for importer in reverse.get(pending.pop(), ()):
+                if importer not in found:
+                    found.add(importer)
+                    pending.append(importer)
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        """Return memoization counters for run summaries."""
+        with self._lock:
+            return {
+                "materialized_contexts": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "import_edges": sum(len(targets) for targets in self.imports.values()),
+            }
+
+
 # ---------------------------------------------------------------------------
 # Context inspection
 # ---------------------------------------------------------------------------
@@ -197,9 +442,122 @@ def context_terms_and_prefixes(context: Any) -> Tuple[Set[str], Set[str]]:
     return terms, prefixes
 
 
+TERM_PROBE_TOKEN = "urn:fega-jsonld-probe:"
+REVERSE_PROBE_ID = "https://example.org/jsonld-coverage-probe"
+
+
+def _term_definition(context: Any, term: str) -> Any:
+    """Return the effective definition of a term in a materialized context."""
+    contexts = context if isinstance(context, list) else [context]
+    definition = None
+    for context_item in contexts:
+        if isinstance(context_item, dict) and term in context_item:
+            definition = context_item[term]
+    return definition
+
+
+def _keyword_alias(definition: Any) -> Optional[str]:
+    """Return the JSON-LD keyword a term definition aliases, if any."""
+    if isinstance(definition, str) and definition in JSONLD_KEYWORDS:
+        return definition
+    if isinstance(definition, dict):
+        candidate = definition.get("@id")
+        if isinstance(candidate, str) and candidate in JSONLD_KEYWORDS:
+            return candidate
+    return None
+
+
+def _is_reverse(definition: Any) -> bool:
+    return isinstance(definition, dict) and "@reverse" in definition
+
+
+def _probe_term(jsonld: Any, context: Any, term: str, definition: Any) -> Optional[str]:
+    """Expand one term on its own; return its error message, if any."""
+    probe_value: Any = "value"
+    if _is_reverse(definition):
+        probe_value = {"@id": REVERSE_PROBE_ID}
+    try:
+        expanded = jsonld.expand({"@context": context, term: probe_value})
+    except Exception as exc:  # pyld exposes several exception types
+        return f"Term '{term}' cannot be expanded: {exc}"
+
+    properties = {
+        key
+        for node in expanded
+        if isinstance(node, dict)
+        for key in node
+        if not key.startswith("@")
+    }
+    properties.update(
+        key
+        for node in expanded
+        if isinstance(node, dict)
+        for reverse in [node.get("@reverse", {})]
+        if isinstance(reverse, dict)
+        for key in reverse
+    )
+    if not properties or not all(urlparse(key).scheme for key in properties):
+        return f"Term '{term}' does not expand to an absolute IRI"
+    return None
+
+
+def _probe_tokens(value: Any) -> List[str]:
+    """Return every probe token found in an expanded JSON-LD value."""
+    if isinstance(value, str):
+        return [value] if value.startswith(TERM_PROBE_TOKEN) else []
+    if isinstance(value, dict):
+        return [token for item in value.values() for token in _probe_tokens(item)]
+    if isinstance(value, list):
+        return [token for item in value for token in _probe_tokens(item)]
+    return []
+
+
+def _probe_terms_batched(
+    jsonld: Any,
+    context: Any,
+    definitions: Dict[str, Any],
+) -> Optional[Set[str]]:
+    """Expand all *definitions* in one synthetic node.
+
+    Every term gets a unique probe token as value (a node reference for
+    ``@reverse`` terms), so the expanded properties can be attributed back to
+    the terms that produced them. Returns the terms that expanded to absolute
+    IRIs only, or None when the batch as a whole fails to expand.
+    """
+    tokens = {f"{TERM_PROBE_TOKEN}{index}": term for index, term in enumerate(definitions)}
+    node: Dict[str, Any] = {"@context": context}
+    for token, term in tokens.items():
+        node[term] = {"@id": token} if _is_reverse(definitions[term]) else token
+    try:
+        expanded = jsonld.expand(node)
+    except Exception:  # pyld exposes several exception types
+        return None
+
+    keys_by_term: Dict[str, Set[str]] = {}
+    for expanded_node in expanded:
+        if not isinstance(expanded_node, dict):
+            continue
+        reverse = expanded_node.get("@reverse", {})
+        properties = [
+            (key, value) for key, value in expanded_node.items() if not key.startswith("@")
+        ]
+        if isinstance(reverse, dict):
+            properties.extend(reverse.items())
+        for key, value in properties:
+            for token in _probe_tokens(value):
+                if token in tokens:
+                    keys_by_term.setdefault(tokens[token], set()).add(key)
+    return {
+        term
+        for term, keys in keys_by_term.items()
+        if all(urlparse(key).scheme for key in keys)
+    }
+
+
 def validate_context_term_mappings(
     context: Any,
     terms: Set[str],
+    batched: bool = True,
 ) -> List[str]:
     """Check that schema-facing context terms expand to absolute IRIs.
 
@@ -207,63 +565,41 @@ def validate_context_term_mappings(
     drops terms mapped to null and rejects or leaves malformed compact IRIs
     unresolved.  Expand each maintained term independently so coverage checks
     verify the mapping that downstream RDF consumers will actually use.
+
+    By default all terms are first expanded together in a single synthetic
+    node, so the context is processed once instead of once per term; only
+    terms that do not pass there are expanded one by one to report the exact
+    error. ``batched=False`` expands every term separately.
     """
     try:
         from pyld import jsonld
     except ImportError as exc:  # pragma: no cover - runtime dependency guard
         raise ValueError("pyld is required to validate JSON-LD term mappings") from exc
 
-    def term_definition(term: str) -> Any:
-        """Return the effective definition of a term in a materialized context."""
-        contexts = context if isinstance(context, list) else [context]
-        definition = None
-        for context_item in contexts:
-            if isinstance(context_item, dict) and term in context_item:
-                definition = context_item[term]
-        return definition
+    definitions = {term: _term_definition(context, term) for term in sorted(terms)}
+    probe_definitions = {
+        term: definition
+        for term, definition in definitions.items()
+        if _keyword_alias(definition) is None
+    }
+    passed: Set[str] = set()
+    if batched and len(probe_definitions) > 1:
+        passed = _probe_terms_batched(jsonld, context, probe_definitions) or set()
 
     errors: List[str] = []
-    for term in sorted(terms):
-        definition = term_definition(term)
-        keyword_alias = None
-        if isinstance(definition, str) and definition in JSONLD_KEYWORDS:
-            keyword_alias = definition
-        elif isinstance(definition, dict):
-            candidate = definition.get("@id")
-            if isinstance(candidate, str) and candidate in JSONLD_KEYWORDS:
-                keyword_alias = candidate
+    for term, definition in definitions.items():
+        keyword_alias = _keyword_alias(definition)
         if keyword_alias is not None:
             errors.append(
                 f"Term '{term}' aliases JSON-LD keyword '{keyword_alias}' "
                 "and cannot represent a schema property"
             )
             continue
-        probe_value: Any = "value"
-        if isinstance(definition, dict) and "@reverse" in definition:
-            probe_value = {"@id": "https://example.org/jsonld-coverage-probe"}
-        try:
-            expanded = jsonld.expand({"@context": context, term: probe_value})
-        except Exception as exc:  # pyld exposes several exception types
-            errors.append(f"Term '{term}' cannot be expanded: {exc}")
+        if term in passed:
             continue
-
-        properties = {
-            key
-            for node in expanded
-            if isinstance(node, dict)
-            for key in node
-            if not key.startswith("@")
-        }
-        properties.update(
-            key
-            for node in expanded
-            if isinstance(node, dict)
-            for reverse in [node.get("@reverse", {})]
-            if isinstance(reverse, dict)
-            for key in reverse
-        )
-        if not properties or not all(urlparse(key).scheme for key in properties):
-            errors.append(f"Term '{term}' does not expand to an absolute IRI")
+        error = _probe_term(jsonld, context, term, definition)
+        if error is not None:
+            errors.append(error)
     return errors
 
 
@@ -345,8 +681,7 @@ def make_local_document_loader(
     def loader(url: str, options: Dict[str, Any] = {}) -> Dict[str, Any]:  # noqa: B006
         if url in id_to_path_map:
             local_path = id_to_path_map[url]
-            with local_path.open("r", encoding="utf-8") as fh:
-                document = json.load(fh)
+            document = load_json_file(local_path, id_to_path_map)
             return {
                 "contentType": "application/ld+json",
                 "contextUrl": None,
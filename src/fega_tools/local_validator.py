@@ -0,0 +1,280 @@
+"""local_validator.py - in-process JSON Schema validation of wrapped documents
+---------------------------------------------------------------------------
+
+A Biovalidator-free fast path for structural checks. Each target schema is
+compiled once into a Draft 2020-12 validator whose ``$ref``s (``../../common``
+definitions, ``standards/json-schema`` files, other entity schemas) are served
+from the local checkout, then reused for every document that points to it.
+
+Responses use the Biovalidator shape (``[]`` when valid, otherwise
+``[{"dataPath": ..., "errors": [...]}]``), so :func:`classify_response`,
+the validation cache and the summaries work unchanged. Biovalidator's custom
+ontology keywords (``graphRestriction`` and friends) need an ontology lookup
+service; they are not evaluated here and are counted as *deferred* instead.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from jsonschema import Draft202012Validator, validators
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource, Unresolvable
+from referencing.jsonschema import DRAFT202012
+
+from fega_tools.biovalidator import BiovalidatorClient, client_from_args
+from fega_tools.jsonld_utils import GITHUB_RAW_PREFIX, build_id_to_path_map
+from fega_tools.validation_cache import schema_dependency_paths
+
+LOGGER = logging.getLogger(__name__)
+
+LOCAL_ENGINE_ID = "local:jsonschema-draft2020-12"
+DRAFT_2020_12_URI = "https://json-schema.org/draft/2020-12/schema"
+ENGINES = ("biovalidator", "local")
+DEFAULT_ENGINE = "biovalidator"
+# Formats used by the schemas that need optional jsonschema dependencies.
+CHECKED_FORMATS = ("date", "date-time", "email", "uri", "uri-reference", "uri-template")
+FORMAT_CHECKER = Draft202012Validator.FORMAT_CHECKER
+# Biovalidator keywords that need an ontology service to evaluate.
+DEFERRED_KEYWORDS = ("graphRestriction", "isChildTermOf", "isValidTerm", "isValidTaxonomy")
+
+
+class LocalSchemaError(ValueError):
+    """The target schema of a document cannot be resolved or loaded locally."""
+
+
+def instance_pointer(path: Sequence[Any]) -> str:
+    """Return the JSON Pointer of an instance location (``""`` for the root)."""
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
+
+
+def _sorted_errors(errors: Iterator[Any]) -> List[Any]:
+    """Order top-level errors by instance location, then schema location."""
+    return sorted(
+        errors,
+        key=lambda error: (
+            [str(part) for part in error.absolute_path],
+            [str(part) for part in error.absolute_schema_path],
+        ),
+    )
+
+
+class LocalValidator:
+    """Validate ``{"data", "schema"}`` wrappers in-process with ``jsonschema``.
+
+    Exposes the same ``url``/``validate``/``validate_many``/``assert_reachable``
+    surface as :class:`~fega_tools.biovalidator.BiovalidatorClient`, so the
+    validation CLIs can use either engine. ``url`` is a fixed engine
+    identifier, which keeps cached local outcomes apart from Biovalidator ones.
+    Compiled validators are shared and safe to use from several threads.
+    """
+
+    url = LOCAL_ENGINE_ID
+
+    def __init__(self, repo_root: Path, id_to_path_map: Optional[Dict[str, Path]] = None) -> None:
+        self.repo_root = repo_root.resolve()
+        self.id_to_path_map = (
+            id_to_path_map if id_to_path_map is not None else build_id_to_path_map(self.repo_root)
+        )
+        self.deferred: Dict[str, int] = {keyword: 0 for keyword in DEFERRED_KEYWORDS}
+        self._registry: Registry = Registry(retrieve=self._retrieve)  # type: ignore[call-arg]
+        self._loaded_paths: Set[Path] = set()
+        self._validators: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        missing_formats = sorted(set(CHECKED_FORMATS) - set(FORMAT_CHECKER.checkers))
+        if missing_formats:
+            LOGGER.warning(
+                "Format(s) %s are not checked locally; install 'jsonschema[format-nongpl]'",
+                ", ".join(missing_formats),
+            )
+        self._validator_class = validators.extend(
+            Draft202012Validator,
+            {keyword: self._deferred_keyword(keyword) for keyword in DEFERRED_KEYWORDS},
+        )
+
+    def __enter__(self) -> "LocalValidator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Nothing to release; present for parity with the HTTP client."""
+
+    def assert_reachable(self, timeout_seconds: float = 5) -> None:
+        """The local engine is always available."""
+
+    # -------
+    # Schema loading
+    # -------
+
+    def _deferred_keyword(self, keyword: str):
+        def record(_validator: Any, _value: Any, _instance: Any, _schema: Any) -> Iterator[Any]:
+            with self._lock:
+                self.deferred[keyword] += 1
+            return iter(())
+
+        return record
+
+    def _uri_for(self, path: Path, contents: Any) -> str:
+        schema_id = contents.get("$id") if isinstance(contents, dict) else None
+        if isinstance(schema_id, str) and schema_id:
+            return schema_id
+        return GITHUB_RAW_PREFIX + path.relative_to(self.repo_root).as_posix()
+
+    def _path_for_uri(self, uri: str) -> Optional[Path]:
+        if uri in self.id_to_path_map:
+            return self.id_to_path_map[uri]
+        if uri.startswith(GITHUB_RAW_PREFIX):
+            candidate = self.repo_root / uri[len(GITHUB_RAW_PREFIX) :]
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _load_resource(self, path: Path) -> Resource:
+        with path.open("r", encoding="utf-8") as handle:
+            contents = json.load(handle)
+        if isinstance(contents, dict) and contents.get("$schema") == DRAFT_2020_12_URI:
+            # jsonschema swaps in its stock validator class when a referenced
+            # schema declares ``$schema``, which would drop the deferred
+            # keyword hooks. The dialect is already the default here.
+            contents = {key: value for key, value in contents.items() if key != "$schema"}
+        return Resource.from_contents(contents, default_specification=DRAFT202012)
+
+    def _retrieve(self, uri: str) -> Resource:
+        """Serve refs missed by the eager crawl from the local checkout."""
+        path = self._path_for_uri(uri)
+        if path is None:
+            raise NoSuchResource(ref=uri)  # type: ignore[call-arg]
+        try:
+            return self._load_resource(path)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise NoSuchResource(ref=uri) from exc  # type: ignore[call-arg]
+
+    def _compile(self, schema_ref: str) -> Any:
+        """Return the validator for *schema_ref*, loading its schema files once."""
+        with self._lock:
+            compiled = self._validators.get(schema_ref)
+            if compiled is not None:
+                return compiled
+
+            paths, unresolved = schema_dependency_paths(schema_ref, self.id_to_path_map)
+            if not paths:
+                raise LocalSchemaError(f"Schema '{schema_ref}' is not available in the local checkout")
+            for ref in unresolved:
+                LOGGER.debug("Reference '%s' of '%s' is not local", ref, schema_ref)
+
+            resources = []
+            for path in paths:
+                if path in self._loaded_paths:
+                    continue
+                try:
+                    resource = self._load_resource(path)
+                except (OSError, json.JSONDecodeError) as exc:
+                    raise LocalSchemaError(f"Cannot load schema '{path}': {exc}") from exc
+                resources.append((self._uri_for(path, resource.contents), resource))
+                self._loaded_paths.add(path)
+            if resources:
+                self._registry = self._registry.with_resources(resources).crawl()
+
+            compiled = self._validator_class(
+                {"$ref": schema_ref},
+                registry=self._registry,
+                format_checker=FORMAT_CHECKER,
+            )
+            self._validators[schema_ref] = compiled
+            LOGGER.debug("Compiled local validator for '%s'", schema_ref)
+            return compiled
+
+    # -------
+    # Validation
+    # -------
+
+    def validate(self, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Validate one wrapper document and return Biovalidator-style errors.
+
+        Raises :class:`LocalSchemaError` (a ``ValueError``) when the target
+        schema cannot be resolved locally.
+        """
+        schema = document.get("schema")
+        schema_ref = schema.get("$ref") if isinstance(schema, dict) else None
+        if not isinstance(schema_ref, str) or not schema_ref:
+            raise LocalSchemaError("Wrapper document has no 'schema.$ref' to validate against")
+
+        validator = self._compile(schema_ref)
+        grouped: Dict[str, List[str]] = {}
+        try:
+            for error in _sorted_errors(validator.iter_errors(document.get("data"))):
+                grouped.setdefault(instance_pointer(error.absolute_path), []).append(error.message)
+        except Unresolvable as exc:
+            raise LocalSchemaError(f"Cannot resolve schema reference: {exc}") from exc
+
+        return [{"dataPath": data_path, "errors": messages} for data_path, messages in grouped.items()]
+
+    def validate_many(
+        self,
+        documents: Sequence[Dict[str, Any]],
+        batch_size: int = 1,
+    ) -> List[Any]:
+        """Validate documents in order; errors are returned as values.
+
+        *batch_size* is accepted for interface parity; local validation has no
+        per-request overhead to amortise.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        results: List[Any] = []
+        for document in documents:
+            try:
+                results.append(self.validate(document))
+            except ValueError as exc:
+                results.append(exc)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Return compiled-schema and deferred-keyword counters for run summaries."""
+        with self._lock:
+            return {
+                "engine": "local",
+                "compiled_schemas": len(self._validators),
+                "loaded_schema_files": len(self._loaded_paths),
+                "deferred_checks": {
+                    keyword: count for keyword, count in self.deferred.items() if count
+                },
+            }
+
+
+ValidationEngine = Union[BiovalidatorClient, LocalValidator]
+
+
+def add_engine_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--engine`` option to a CLI parser."""
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=(
+            "Validate through a Biovalidator endpoint, or in-process with jsonschema "
+            "('local'; ontology keywords such as graphRestriction are deferred). "
+            f"Default: {DEFAULT_ENGINE}."
+        ),
+    )
+
+
+def engine_from_args(
+    args: argparse.Namespace,
+    repo_root: Path,
+    id_to_path_map: Optional[Dict[str, Path]] = None,
+    pool_size: Optional[int] = None,
+) -> ValidationEngine:
+    """Build the engine chosen with :func:`add_engine_arguments`."""
+    if args.engine == "local":
+        return LocalValidator(repo_root, id_to_path_map)
+    return client_from_args(args.validator_url, args, pool_size=pool_size)
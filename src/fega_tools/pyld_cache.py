@@ -0,0 +1,137 @@
+"""pyld_cache.py - shared PyLD options and memos for repeated JSON-LD calls
+-------------------------------------------------------------------------
+
+:class:`PyLDContextCache` hands the same PyLD options (the local document
+loader) to every ``expand``/``flatten``/``frame``/``to_rdf``/``normalize``
+call of a run through :meth:`PyLDContextCache.options`; PyLD's own
+resolved-context cache then shares the processed contexts between calls.
+:meth:`PyLDContextCache.expand_node_identifier` memoizes ``@id`` expansion
+per (context, value), with contexts keyed by a SHA-256 of their sorted JSON,
+memoized per object for read-only contexts
+(:class:`~fega_tools.jsonld_utils.FrozenJSONDict`, PyLD's own frozen dicts).
+
+Only PyLD's public API is used. Contexts must not change while the cache is
+in use. One cache per process; it is not thread-safe.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from pyld import jsonld
+
+from fega_tools.jsonld_utils import FrozenJSONDict, FrozenJSONList
+
+try:  # PyLD >= 2.0 freezes processed contexts with frozendict
+    from frozendict import frozendict
+except ImportError:  # pragma: no cover - exercised only with old PyLD releases
+    frozendict = None  # type: ignore[assignment,misc]
+
+LOGGER = logging.getLogger(__name__)
+
+NODE_ID_PROBE_PROPERTY = "https://example.org/jsonld-frame-probe"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize PyLD's frozen mappings like plain objects."""
+    return dict(value)
+
+
+def stable_context_key(context: Any) -> str:
+    """Return a SHA-256 digest identifying a JSON-LD context by content."""
+    encoded = json.dumps(
+        context,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _ContextKeys:
+    """Content keys for contexts, memoized per read-only object."""
+
+    def __init__(self) -> None:
+        # id(context) -> (context, key); keeping the object alive pins its id.
+        self._memo: Dict[int, Tuple[Any, str]] = {}
+        self.hits = 0
+        self.computed = 0
+
+    def key(self, context: Any) -> str:
+        memo = self._memo.get(id(context))
+        if memo is not None and memo[0] is context:
+            self.hits += 1
+            return memo[1]
+        key = stable_context_key(context)
+        self.computed += 1
+        if self._is_read_only(context):
+            self._memo[id(context)] = (context, key)
+        return key
+
+    @staticmethod
+    def _is_read_only(context: Any) -> bool:
+        if isinstance(context, (FrozenJSONDict, FrozenJSONList)):
+            return True
+        return frozendict is not None and isinstance(context, frozendict)
+
+
+class PyLDContextCache:
+    """Share PyLD options and node identifier expansions across the calls of one run.
+
+    Pass ``options=cache.options(...)`` to every PyLD call that should share
+    the cache; extra keyword arguments are added to the returned options.
+    """
+
+    def __init__(self, document_loader: Optional[Any] = None) -> None:
+        self.document_loader = document_loader
+        self._keys = _ContextKeys()
+        self._node_ids: Dict[Tuple[str, str], Optional[str]] = {}
+        self.node_id_hits = 0
+        self.node_id_misses = 0
+
+    def options(self, **extra: Any) -> Dict[str, Any]:
+        """Return PyLD options using the shared document loader."""
+        options: Dict[str, Any] = {}
+        if self.document_loader is not None:
+            options["documentLoader"] = self.document_loader
+        options.update(extra)
+        return options
+
+    def expand_node_identifier(self, value: str, context: Any) -> Optional[str]:
+        """Expand a compact or absolute node identifier to an absolute IRI.
+
+        Returns None when the context cannot be processed. Results are
+        memoized per (context content, value).
+        """
+        memo_key = (self._keys.key(context), value)
+        if memo_key in self._node_ids:
+            self.node_id_hits += 1
+            return self._node_ids[memo_key]
+
+        self.node_id_misses += 1
+        expanded_id = None
+        try:
+            expanded = jsonld.expand(
+                {"@context": context, "@id": value, NODE_ID_PROBE_PROPERTY: "probe"},
+                options=self.options(),
+            )
+        except Exception:  # noqa: BLE001 - PyLD exposes several exception types
+            expanded = []
+        for node in expanded:
+            if isinstance(node, dict) and isinstance(node.get("@id"), str):
+                expanded_id = node["@id"]
+                break
+        self._node_ids[memo_key] = expanded_id
+        return expanded_id
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters for run summaries."""
+        return {
+            "context_keys_computed": self._keys.computed,
+            "context_key_hits": self._keys.hits,
+            "node_id_expansion_hits": self.node_id_hits,
+            "node_id_expansion_misses": self.node_id_misses,
+        }
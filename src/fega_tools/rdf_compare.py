@@ -0,0 +1,185 @@
+"""rdf_compare.py - fast RDF dataset equivalence for JSON-LD round-trips
+---------------------------------------------------------------------
+
+Checking that two JSON-LD documents mean the same thing usually means
+running URDNA2015 on both and comparing the canonical N-Quads.
+:class:`RDFComparator` works on PyLD RDF datasets (``jsonld.to_rdf`` without
+a ``format``) and settles most comparisons with cheap invariants instead:
+
+1. the number of distinct quads and the set of quads without blank nodes
+   (ground quads) must be equal;
+2. every blank node gets a first-degree signature, the sorted quads it
+   occurs in with itself written as ``_:a`` and other blank nodes as
+   ``_:z`` (the input of URDNA2015's first-degree hash). Both datasets must
+   have the same signatures;
+3. when no two blank nodes share a signature, the signatures map blank nodes
+   one-to-one, and the relabeled quads are compared directly.
+
+Only datasets with blank nodes that share a signature fall back to full
+URDNA2015 canonicalization. :meth:`RDFDataset.canonical` is computed at
+most once per dataset, so an original compared against several outputs is
+canonicalized once.
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from pyld import jsonld
+
+LOGGER = logging.getLogger(__name__)
+
+# (kind, value, datatype, language); kind is "I" (IRI), "B" (blank) or "L" (literal)
+Term = Tuple[str, str, str, str]
+Quad = Tuple[Term, Term, Term, Term]
+
+DEFAULT_GRAPH: Term = ("D", "", "", "")
+METHOD_INVARIANTS = "invariants"
+METHOD_SIGNATURES = "signatures"
+METHOD_URDNA2015 = "urdna2015"
+
+_SELF: Term = ("B", "a", "", "")
+_OTHER: Term = ("B", "z", "", "")
+
+
+def _term(node: Mapping[str, Any]) -> Term:
+    kind = node["type"]
+    if kind == "IRI":
+        return ("I", node["value"], "", "")
+    if kind == "blank node":
+        return ("B", node["value"], "", "")
+    return ("L", node["value"], node.get("datatype") or "", node.get("language") or "")
+
+
+def _graph_term(graph_name: str) -> Term:
+    if graph_name == "@default":
+        return DEFAULT_GRAPH
+    if graph_name.startswith("_:"):
+        return ("B", graph_name, "", "")
+    return ("I", graph_name, "", "")
+
+
+def _relabel(quad: Quad, mapping: Mapping[str, Term], default: Optional[Term] = None) -> Quad:
+    return tuple(  # type: ignore[return-value]
+        mapping.get(term[1], default or term) if term[0] == "B" else term
+        for term in quad
+    )
+
+
+class RDFDataset:
+    """Distinct quads of one PyLD RDF dataset, with comparison invariants.
+
+    Invariants and the canonical form are computed lazily and cached.
+    """
+
+    def __init__(self, dataset: Mapping[str, Sequence[Mapping[str, Any]]]) -> None:
+        self._dataset = dataset
+        self.quads: FrozenSet[Quad] = frozenset(
+            (
+                _term(triple["subject"]),
+                _term(triple["predicate"]),
+                _term(triple["object"]),
+                _graph_term(graph_name),
+            )
+            for graph_name, triples in dataset.items()
+            for triple in triples
+        )
+        self._ground: Optional[FrozenSet[Quad]] = None
+        self._signatures: Optional[Dict[str, Tuple[Quad, ...]]] = None
+        self._canonical: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.quads)
+
+    @property
+    def ground_quads(self) -> FrozenSet[Quad]:
+        """Quads without any blank node."""
+        if self._ground is None:
+            self._ground = frozenset(
+                quad for quad in self.quads if all(term[0] != "B" for term in quad)
+            )
+        return self._ground
+
+    @property
+    def signatures(self) -> Dict[str, Tuple[Quad, ...]]:
+        """First-degree signature of every blank node label."""
+        if self._signatures is None:
+            mentions: Dict[str, List[Quad]] = {}
+            for quad in self.quads:
+                for label in {term[1] for term in quad if term[0] == "B"}:
+                    mentions.setdefault(label, []).append(quad)
+            self._signatures = {
+                label: tuple(sorted(_relabel(quad, {label: _SELF}, _OTHER) for quad in quads))
+                for label, quads in mentions.items()
+            }
+        return self._signatures
+
+    def canonical(self) -> str:
+        """Return the URDNA2015 canonical N-Quads of the dataset (cached)."""
+        if self._canonical is None:
+            self._canonical = jsonld.normalize(
+                jsonld.JsonLdProcessor.to_nquads(self._dataset),
+                {
+                    "algorithm": "URDNA2015",
+                    "inputFormat": "application/n-quads",
+                    "format": "application/n-quads",
+                },
+            )
+        return self._canonical
+
+
+def compare_datasets(expected: RDFDataset, actual: RDFDataset) -> Tuple[Optional[bool], str]:
+    """Decide equivalence from invariants alone.
+
+    Returns ``(equivalent, method)``; ``equivalent`` is None when the
+    invariants cannot decide and URDNA2015 is needed.
+    """
+    if len(expected) != len(actual) or expected.ground_quads != actual.ground_quads:
+        return False, METHOD_INVARIANTS
+    if len(expected.ground_quads) == len(expected):
+        return True, METHOD_INVARIANTS
+
+    expected_signatures = expected.signatures
+    actual_signatures = actual.signatures
+    expected_counts = Counter(expected_signatures.values())
+    if expected_counts != Counter(actual_signatures.values()):
+        return False, METHOD_SIGNATURES
+    if any(count > 1 for count in expected_counts.values()):
+        return None, METHOD_SIGNATURES
+
+    by_signature = {signature: label for label, signature in expected_signatures.items()}
+    mapping = {
+        label: ("B", by_signature[signature], "", "")
+        for label, signature in actual_signatures.items()
+    }
+    relabeled = frozenset(_relabel(quad, mapping) for quad in actual.quads)
+    return relabeled == expected.quads, METHOD_SIGNATURES
+
+
+class RDFComparator:
+    """Compare RDF datasets, falling back to URDNA2015 only when needed.
+
+    Counts how each comparison was decided for run summaries.
+    """
+
+    def __init__(self) -> None:
+        self.decided_by: Dict[str, int] = {
+            METHOD_INVARIANTS: 0,
+            METHOD_SIGNATURES: 0,
+            METHOD_URDNA2015: 0,
+        }
+
+    def equivalent(self, expected: RDFDataset, actual: RDFDataset) -> bool:
+        """Return whether both datasets are isomorphic."""
+        equivalent, method = compare_datasets(expected, actual)
+        if equivalent is None:
+            method = METHOD_URDNA2015
+            equivalent = expected.canonical() == actual.canonical()
+        self.decided_by[method] += 1
+        LOGGER.debug("RDF comparison decided by %s: %s", method, equivalent)
+        return equivalent
+
+    def stats(self) -> Dict[str, int]:
+        """Return decision counters for run summaries."""
+        return {f"decided_by_{method}": count for method, count in self.decided_by.items()}
@@ -3,10 +3,13 @@ rdf_utils.py - RDF and JSON-LD utilities for FEGA tools
 """
 from __future__ import annotations
 
-import json
+import argparse
 import logging
+import shutil
+import tempfile
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 try:
     from rdflib import Graph
@@ -24,19 +27,149 @@ except ImportError as exc:
 
 logger = logging.getLogger(__name__)
 
+SH_NAMESPACE = "http://www.w3.org/ns/shacl#"
+
+#: Data graphs merged into one pyshacl run by :meth:`ShaclValidator.validate_batch`.
+DEFAULT_SHACL_BATCH_SIZE = 50
+
+#: rdflib store plugin behind each backend, and the package that provides it.
+RDF_STORES: Dict[str, Tuple[str, Optional[str]]] = {
+    "memory": ("Memory", None),
+    "berkeleydb": ("BerkeleyDB", "berkeleydb"),
+    "oxigraph": ("Oxigraph", "oxrdflib"),
+}
+DEFAULT_RDF_STORE = "memory"
+
+# -------
+# RDF store backends
+# -------
+
+def _store_plugin(backend: str) -> Any:
+    """Return the rdflib store class of *backend*, or raise ``ValueError``."""
+    from rdflib import plugin
+    from rdflib.plugin import PluginException
+    from rdflib.store import Store
+
+    if backend not in RDF_STORES:
+        raise ValueError(f"Unknown RDF store '{backend}'; choose from: {', '.join(RDF_STORES)}")
+    plugin_name, package = RDF_STORES[backend]
+    try:
+        return plugin.get(plugin_name, Store)
+    except (PluginException, ImportError) as exc:
+        raise ValueError(
+            f"RDF store '{backend}' is not available. Install with: pip install {package}"
+        ) from exc
+
+
+def available_rdf_stores() -> List[str]:
+    """Return the backends of :data:`RDF_STORES` usable in this environment."""
+    available = []
+    for backend in RDF_STORES:
+        try:
+            _store_plugin(backend)
+        except ValueError:
+            continue
+        available.append(backend)
+    return available
+
+
+def _close_store(store: Any, directory: str) -> None:
+    try:
+        store.close()
+    except Exception:  # noqa: BLE001 – best effort; the files are removed anyway
+        logger.debug("Failed to close RDF store in %s", directory, exc_info=True)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class RdfStore:
+    """Where the RDF graphs built for validation keep their triples.
+
+    ``memory`` (the default) is rdflib's in-memory store. ``berkeleydb``
+    (needs the ``berkeleydb`` package) and ``oxigraph`` (needs ``oxrdflib``)
+    keep each graph on disk, in its own scratch directory below *directory*
+    (default: the system temporary directory), so data graphs larger than
+    RAM can be validated. The scratch directory is removed, and the store
+    closed, when the graph is garbage collected.
+
+    Raises:
+        ValueError: If *backend* is unknown or not installed.
+    """
+
+    def __init__(self, backend: str = DEFAULT_RDF_STORE, directory: Optional[Path] = None) -> None:
+        self.backend = backend
+        self.directory = directory
+        self._store_class = _store_plugin(backend)
+        self.graphs = 0
+
+    def graph(self) -> Graph:
+        """Return a new, empty graph on this backend."""
+        self.graphs += 1
+        if RDF_STORES[self.backend][1] is None:
+            return Graph(store=self._store_class())
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        scratch = tempfile.mkdtemp(prefix="fega-rdf-", dir=self.directory)
+        store = self._store_class()
+        graph = Graph(store=store)
+        graph.open(scratch, create=True)
+        weakref.finalize(graph, _close_store, store, scratch)
+        return graph
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the backend and number of graphs created, for run summaries."""
+        return {"backend": self.backend, "graphs": self.graphs}
+
+
+def _new_graph(store: Optional[RdfStore]) -> Graph:
+    return store.graph() if store is not None else Graph()
+
+
+def add_rdf_store_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--rdf-store``/``--rdf-store-dir`` options to a CLI parser."""
+    parser.add_argument(
+        "--rdf-store",
+        choices=list(RDF_STORES),
+        default=DEFAULT_RDF_STORE,
+        help=(
+            f"Where RDF data graphs keep their triples (default: {DEFAULT_RDF_STORE}; "
+            f"available here: {', '.join(available_rdf_stores())})."
+        ),
+    )
+    parser.add_argument(
+        "--rdf-store-dir",
+        type=Path,
+        help="Scratch directory for on-disk RDF stores (default: the system temporary directory).",
+    )
+
+
+def rdf_store_from_args(args: argparse.Namespace) -> Optional[RdfStore]:
+    """Build a store from options added by :func:`add_rdf_store_arguments`.
+
+    Returns ``None`` for the default in-memory store.
+    """
+    if args.rdf_store == DEFAULT_RDF_STORE and args.rdf_store_dir is None:
+        return None
+    return RdfStore(args.rdf_store, args.rdf_store_dir)
+
 # -------
 # JSON-LD to RDF conversion
 # -------
 
 def jsonld_to_rdf_graph(
     jsonld_document: Dict[str, Any],
-    base_uri: Optional[str] = None
+    base_uri: Optional[str] = None,
+    store: Optional[RdfStore] = None,
 ) -> Graph:
     """Convert a JSON-LD document to an RDF graph.
 
+    The parsed document is handed to rdflib's JSON-LD parser as is, without
+    serializing it to JSON and parsing it back; it is not modified.
+
     Args:
         jsonld_document: Dictionary containing the JSON-LD data with @context, @type, etc.
         base_uri: Optional base URI for resolving relative references.
+        store: Backend of the new graph (default: in memory).
 
     Returns:
         An rdflib Graph containing the RDF representation.
@@ -44,11 +177,10 @@ def jsonld_to_rdf_graph(
     Raises:
         ValueError: If the JSON-LD document cannot be converted.
     """
+    graph = _new_graph(store)
     try:
-        # Create a graph and parse the JSON-LD
-        graph = Graph()
         graph.parse(
-            data=json.dumps(jsonld_document),
+            data=jsonld_document,  # type: ignore[arg-type]  # rdflib's JSON-LD parser takes parsed data too
             format="json-ld",
             base=base_uri or "http://example.org/data/"
         )
@@ -60,35 +192,334 @@ def jsonld_to_rdf_graph(
 # SHACL validation
 # -------
 
+class ShaclValidator:
+    """A SHACL shapes graph prepared once and used to validate many data graphs.
+
+    ``pyshacl.validate`` wraps the shapes graph and harvests every node and
+    property shape again on each call. This class does that once; each
+    :meth:`validate` call only pays for RDFS inference on the data graph and
+    for evaluating the shapes. Results are identical to ``pyshacl.validate``
+    with the same options.
+
+    The shapes graph is not mixed into data graphs (no ontology graph is
+    used), so the RDFS closure covers the data graph alone and cannot be
+    shared between files. With ``inplace=True`` it is computed on the data
+    graph itself instead of on a copy; use that for throw-away graphs.
+
+    With *prune* (the default) only the shapes whose ``sh:targetClass`` (or
+    implicit class target) can match a type of the data graph are evaluated;
+    shapes with other targets always are. The subset is cached per set of
+    matching classes, and a data graph no shape applies to is reported as
+    conforming without running pyshacl (or RDFS inference) at all.
+
+    The merged data graphs of :meth:`validate_batch` are created in *store*
+    (default: in memory). Validate on-disk data graphs with
+    ``inplace=True``; otherwise pyshacl copies them into memory first.
+    """
+
+    def __init__(
+        self,
+        shapes_graph: Graph,
+        inference: Optional[str] = "rdfs",
+        prune: bool = True,
+        store: Optional[RdfStore] = None,
+    ) -> None:
+        # pyshacl internals: ShapesGraph, apply_patches, assign_baked_in and the
+        # Validator.shacl_graph swap in validate() (which _ShapesSubset relies
+        # on too) are not public API. They are tied to the pyshacl==0.31.0 pin
+        # in requirements.txt and guarded by tests/test_validate_rdf_shacl.py.
+        from pyshacl.monkey import apply_patches
+        from pyshacl.shapes_graph import ShapesGraph
+        from pyshacl.validator import assign_baked_in
+        from rdflib import RDF, RDFS, Namespace
+
+        apply_patches()
+        assign_baked_in()
+        self.shapes_graph = shapes_graph
+        self.inference = inference
+        self.prune = prune
+        self.store = store
+        self._logger = logging.getLogger("pyshacl-validate")
+        self._compiled = ShapesGraph(shapes_graph, False, self._logger)
+        self.n_shapes = len(self._compiled.shapes)
+        self.shape_messages = shape_messages(shapes_graph)
+        self.validations = 0
+        self.batched_graphs = 0
+        self.skipped = 0
+        sh = Namespace(SH_NAMESPACE)
+        self._batchable = (None, sh.sparql, None) not in shapes_graph
+        self._isolate_values = (None, sh.inversePath, None) in shapes_graph
+
+        # Shapes without targets only run when referenced (sh:node, ...), so
+        # they are left out of every subset. RDFS inference types nodes with
+        # RDF/RDFS classes on its own, so shapes targeting those always run.
+        self._shape_classes: List[Tuple[Any, Optional[Set[Any]]]] = []
+        for shape in self._compiled.shapes:
+            nodes, explicit_classes, implicit_classes, objects_of, subjects_of = map(
+                list, shape.target()
+            )
+            classes = set(explicit_classes) | set(implicit_classes)
+            if nodes or objects_of or subjects_of or any(
+                str(cls).startswith((str(RDF), str(RDFS))) for cls in classes
+            ):
+                self._shape_classes.append((shape, None))
+            elif classes:
+                self._shape_classes.append((shape, classes))
+        self._target_classes: Set[Any] = set().union(
+            *(classes for _shape, classes in self._shape_classes if classes is not None)
+        )
+        self._subsets: Dict[FrozenSet[Any], _ShapesSubset] = {}
+
+    def validate(
+        self,
+        data_graph: Graph,
+        focus_nodes: Optional[Sequence[str]] = None,
+        inplace: bool = False,
+    ) -> Tuple[bool, Graph, str]:
+        """Return pyshacl's ``(conforms, results_graph, results_text)`` for one data graph."""
+        from pyshacl import Validator
+
+        # The compiled ShapesGraph, or a _ShapesSubset standing in for it.
+        shapes: Any = self._compiled
+        if self.prune and not focus_nodes:
+            subset = self.applicable_shapes(data_graph)
+            if subset is not None:
+                if not subset.shapes:
+                    self.skipped += 1
+                    results_graph, results_text = Validator.create_validation_report(shapes, True, [])
+                    return True, results_graph, results_text
+                shapes = subset
+
+        validator = Validator(
+            data_graph,
+            shacl_graph=self.shapes_graph,
+            options={
+                "inference": self.inference,
+                "inplace": inplace,
+                "abort_on_first": False,
+                "focus_nodes": list(focus_nodes) if focus_nodes else None,
+                "logger": self._logger,
+            },
+        )
+        # Swap in the prepared shapes instead of the freshly wrapped copy
+        # (pyshacl 0.31 internals, see __init__).
+        validator.shacl_graph = shapes
+        self.validations += 1
+        return validator.run()
+
+    def applicable_shapes(self, data_graph: Graph) -> Optional["_ShapesSubset"]:
+        """Return the shapes that can have focus nodes in *data_graph*.
+
+        Types are taken from ``rdf:type`` and the ``rdfs:subClassOf`` chains
+        of the data graph, as RDFS inference would add them. Returns ``None``
+        (evaluate every shape) when the data graph declares domains, ranges
+        or sub-properties, from which inference could derive other types.
+        """
+        from rdflib import RDF, RDFS
+
+        if any(
+            (None, predicate, None) in data_graph
+            for predicate in (RDFS.domain, RDFS.range, RDFS.subPropertyOf)
+        ):
+            return None
+        types: Set[Any] = set()
+        for rdf_type in set(data_graph.objects(predicate=RDF.type)):
+            types.update(data_graph.transitive_objects(rdf_type, RDFS.subClassOf))
+        key = frozenset(types & self._target_classes)
+
+        subset = self._subsets.get(key)
+        if subset is None:
+            subset = _ShapesSubset(
+                self._compiled,
+                [shape for shape, classes in self._shape_classes if classes is None or classes & key],
+            )
+            self._subsets[key] = subset
+        return subset
+
+    def validate_batch(
+        self,
+        data_graphs: Sequence[Graph],
+        batch_size: int = DEFAULT_SHACL_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """Validate independent data graphs with one pyshacl run per batch.
+
+        Up to *batch_size* graphs are merged into one data graph and
+        validated together; each result is given back to the graphs its
+        focus node occurs in. Graphs are only merged when that cannot change
+        their outcome: they must not share a node that one of them describes
+        (as a subject) and, for shapes with inverse paths, not even a value
+        node. Shapes with SPARQL constraints are validated one graph at a
+        time. Only graphs with the same prefix bindings are merged, so that
+        messages are worded alike. *data_graphs* are not modified.
+
+        Returns:
+            One ``{"conforms": bool, "violations": [...]}`` report per data
+            graph, in order (the ``report_dict`` of :func:`validate_against_shacl`).
+        """
+        nodes = [_batch_nodes(graph) for graph in data_graphs]
+        # Messages abbreviate IRIs with the data graph's prefixes.
+        prefixes = [frozenset(graph.namespaces()) for graph in data_graphs]
+        size = batch_size if self._batchable else 1
+        reports: List[Dict[str, Any]] = [{} for _ in data_graphs]
+
+        for batch in _plan_batches(nodes, prefixes, size, self._isolate_values):
+            merged = _new_graph(self.store)
+            for prefix, namespace in prefixes[batch[0]]:
+                merged.bind(prefix, namespace, override=True, replace=True)
+            sources: Dict[Any, List[int]] = {}
+            for index in batch:
+                merged += data_graphs[index]
+                for node in nodes[index][3]:
+                    sources.setdefault(node, []).append(index)
+
+            _conforms, results_graph, _results_text = self.validate(merged, inplace=True)
+            violations: Dict[int, List[Dict[str, Any]]] = {index: [] for index in batch}
+            for focus, violation in _iter_violations(results_graph, self.shape_messages):
+                for index in sources.get(focus, batch):
+                    violations[index].append(violation)
+            for index in batch:
+                reports[index] = {"conforms": not violations[index], "violations": violations[index]}
+            self.batched_graphs += len(batch)
+
+        return reports
+
+    def stats(self) -> Dict[str, int]:
+        """Return usage counters for run summaries."""
+        return {
+            "shapes": self.n_shapes,
+            "validations": self.validations,
+            "batched_graphs": self.batched_graphs,
+            "shape_subsets": len(self._subsets),
+            "skipped_validations": self.skipped,
+        }
+
+
+class _ShapesSubset:
+    """A prepared pyshacl ``ShapesGraph`` that evaluates only some of its shapes.
+
+    Everything but :attr:`shapes` is delegated, so shapes outside the subset
+    still resolve when another shape references them.
+    """
+
+    def __init__(self, compiled: Any, shapes: List[Any]) -> None:
+        self._compiled = compiled
+        self.shapes = shapes
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._compiled, name)
+
+
+def _batch_nodes(graph: Graph) -> Tuple[Set[Any], Set[Any], Set[Any], Set[Any]]:
+    """Return the subjects, value nodes, terms and all nodes of *graph*.
+
+    Value nodes are non-literal objects other than ``rdf:type`` classes;
+    terms are every subject, predicate and non-literal object. All nodes
+    adds the literals, which can be focus nodes too.
+    """
+    from rdflib import RDF, Literal
+
+    subjects: Set[Any] = set()
+    values: Set[Any] = set()
+    terms: Set[Any] = set()
+    literals: Set[Any] = set()
+    for subject, predicate, obj in graph:
+        subjects.add(subject)
+        terms.add(predicate)
+        if isinstance(obj, Literal):
+            literals.add(obj)
+            continue
+        terms.add(obj)
+        if predicate != RDF.type:
+            values.add(obj)
+    terms |= subjects
+    return subjects, values, terms, terms | literals
+
+
+def _plan_batches(
+    nodes: Sequence[Tuple[Set[Any], Set[Any], Set[Any], Set[Any]]],
+    keys: Sequence[Any],
+    batch_size: int,
+    isolate_values: bool,
+) -> List[List[int]]:
+    """Greedily pack graph indices into batches of mutually independent graphs.
+
+    Graphs only share a batch with graphs of an equal key.
+    """
+    batches: List[List[int]] = []
+    subject_batches: Dict[Any, Set[int]] = {}
+    term_batches: Dict[Any, Set[int]] = {}
+    value_batches: Dict[Any, Set[int]] = {}
+
+    for index, (subjects, values, terms, _all_nodes) in enumerate(nodes):
+        conflicts: Set[int] = set()
+        if batch_size > 1:
+            for node in subjects:
+                conflicts.update(term_batches.get(node, ()))
+            for node in terms:
+                conflicts.update(subject_batches.get(node, ()))
+            if isolate_values:
+                for node in values:
+                    conflicts.update(value_batches.get(node, ()))
+        target = next(
+            (
+                number
+                for number, batch in enumerate(batches)
+                if len(batch) < batch_size and number not in conflicts and keys[batch[0]] == keys[index]
+            ),
+            len(batches),
+        )
+        if target == len(batches):
+            batches.append([])
+        batches[target].append(index)
+        for registry, members in ((subject_batches, subjects), (term_batches, terms), (value_batches, values)):
+            for node in members:
+                registry.setdefault(node, set()).add(target)
+
+    return batches
+
+
 def validate_against_shacl(
     data_graph: Graph,
-    shapes_graph: Graph,
-    shape_focus: Optional[str] = None
+    shapes_graph: Union[Graph, ShaclValidator],
+    shape_focus: Optional[str] = None,
+    inplace: bool = False,
 ) -> Tuple[bool, str, Dict[str, Any]]:
     """Validate a data graph against SHACL shapes.
 
     Args:
         data_graph: The RDF graph to validate.
-        shapes_graph: The RDF graph containing SHACL shape definitions.
+        shapes_graph: The RDF graph containing SHACL shape definitions, or a
+            :class:`ShaclValidator` prepared from it (faster for many graphs).
         shape_focus: Optional specific shape to validate against (defaults to all).
+        inplace: Add inferred triples to *data_graph* instead of a copy.
 
     Returns:
         A tuple of (conforms: bool, report_text: str, report_dict: dict).
         The report_dict contains detailed violation information.
     """
     try:
-        conforms, results_graph, results_text = shacl_validate(
-            data_graph=data_graph,
-            shacl_graph=shapes_graph,
-            focus_nodes=[shape_focus] if shape_focus else None,
-            inference="rdfs",
-            abort_on_first=False
-        )
+        if isinstance(shapes_graph, ShaclValidator):
+            conforms, results_graph, results_text = shapes_graph.validate(
+                data_graph,
+                focus_nodes=[shape_focus] if shape_focus else None,
+                inplace=inplace,
+            )
+            messages = shapes_graph.shape_messages
+        else:
+            conforms, results_graph, results_text = shacl_validate(
+                data_graph=data_graph,
+                shacl_graph=shapes_graph,
+                focus_nodes=[shape_focus] if shape_focus else None,
+                inference="rdfs",
+                inplace=inplace,
+                abort_on_first=False
+            )
+            messages = shape_messages(shapes_graph)
         
         # Convert results_graph to a dict-like structure for easier inspection
         report_dict = {
             "conforms": conforms,
-            "violations": extract_violations_from_graph(results_graph)
+            "violations": extract_violations_from_graph(results_graph, messages)
         }
         
         return conforms, results_text, report_dict
@@ -99,11 +530,12 @@ def validate_against_shacl(
 # RDF graph utilities
 # -------
 
-def load_rdf_from_file(filepath: Path) -> Graph:
+def load_rdf_from_file(filepath: Path, store: Optional[RdfStore] = None) -> Graph:
     """Load an RDF graph from a file (TTL, RDF/XML, N-Triples, JSON-LD, etc.).
 
     Args:
         filepath: Path to the RDF file.
+        store: Backend of the new graph (default: in memory).
 
     Returns:
         An rdflib Graph containing the RDF data.
@@ -111,8 +543,8 @@ def load_rdf_from_file(filepath: Path) -> Graph:
     Raises:
         ValueError: If the file cannot be parsed.
     """
+    graph = _new_graph(store)
     try:
-        graph = Graph()
         # Auto-detect format from file extension
         fmt = _guess_rdf_format(filepath)
         graph.parse(str(filepath), format=fmt)
@@ -150,68 +582,80 @@ def extract_types_from_graph(graph: Graph) -> Set[str]:
         types.add(str(obj))
     return types
 
-def extract_violations_from_graph(results_graph: Graph) -> List[Dict[str, Any]]:
+def extract_violations_from_graph(
+    results_graph: Graph,
+    shape_messages: Optional[Dict[Any, str]] = None,
+) -> List[Dict[str, Any]]:
     """Extract SHACL violation details from a results graph.
 
     Args:
         results_graph: The RDF graph containing SHACL validation results.
+        shape_messages: ``sh:message`` of each shape, used for results
+            without a ``sh:resultMessage`` (see :func:`shape_messages`).
+            Defaults to the messages found in *results_graph* itself.
 
     Returns:
         A list of dictionaries, each describing a violation.
     """
-    from rdflib import Literal, Namespace, RDF
-    
-    SH = Namespace("http://www.w3.org/ns/shacl#")
-    violations = []
+    return [violation for _focus, violation in _iter_violations(results_graph, shape_messages)]
+
+
+def shape_messages(shapes_graph: Graph) -> Dict[Any, str]:
+    """Return the first literal ``sh:message`` of every shape in *shapes_graph*."""
+    from rdflib import Literal, Namespace
+
+    SH = Namespace(SH_NAMESPACE)
+    messages: Dict[Any, str] = {}
+    for shape, message in shapes_graph.subject_objects(SH.message):
+        if isinstance(message, Literal):
+            messages.setdefault(shape, str(message))
+    return messages
+
+
+def _iter_violations(
+    results_graph: Graph,
+    messages: Optional[Dict[Any, str]] = None,
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Yield ``(focus node, violation details)`` for each result in *results_graph*.
+
+    Each result property is read in one pass over its predicate index,
+    rather than with one lookup per result and property.
+    """
+    from rdflib import Namespace, RDF
     
-    for result in results_graph.subjects(
-        predicate=RDF.type, object=SH.ValidationResult
-    ):
-        # Extract violation details
-        violation_info = {}
-        
-        # Get the focus node (what was validated)
-        for focus in results_graph.objects(subject=result, predicate=SH.focusNode):
-            violation_info["focusNode"] = str(focus)
-            
-        # Get the property shape
-        source_shape = None
-        for prop_shape in results_graph.objects(subject=result, predicate=SH.sourceShape):
-            source_shape = prop_shape
-            violation_info["sourceShape"] = str(prop_shape)
-            
-        # Get the severity
-        for severity in results_graph.objects(subject=result, predicate=SH.severity):
-            violation_info["severity"] = str(severity)
-            
-        # Get the message - try result message first, then source shape message
-        message = None
-        for msg in results_graph.objects(subject=result, predicate=SH.resultMessage):
-            message = str(msg)
-            violation_info["message"] = message
-            break
-        
-        # If no result message, try to get message from the source shape
-        if not message and source_shape:
-            for shape_msg in results_graph.objects(subject=source_shape, predicate=SH.message):
-                if isinstance(shape_msg, Literal):
-                    message = str(shape_msg)
-                    violation_info["message"] = message
-                    break
-        
-        # Get the path (property)
-        for path in results_graph.objects(subject=result, predicate=SH.resultPath):
-            violation_info["resultPath"] = str(path)
-            
-        # Get the constraint component for better identification
-        for component in results_graph.objects(subject=result, predicate=SH.sourceConstraintComponent):
-            violation_info["constraint_type"] = str(component).split("#")[-1] if "#" in str(component) else str(component)
-            break
-            
+    SH = Namespace(SH_NAMESPACE)
+    fields = (
+        ("focusNode", SH.focusNode),
+        ("sourceShape", SH.sourceShape),
+        ("severity", SH.severity),
+        ("message", SH.resultMessage),
+        ("resultPath", SH.resultPath),
+        ("constraint_type", SH.sourceConstraintComponent),
+    )
+    results: Dict[Any, Dict[str, Any]] = {
+        result: {} for result in results_graph.subjects(predicate=RDF.type, object=SH.ValidationResult)
+    }
+    for key, predicate in fields:
+        for result, value in results_graph.subject_objects(predicate):
+            values = results.get(result)
+            if values is not None:
+                values.setdefault(key, value)
+
+    for values in results.values():
+        violation_info: Dict[str, Any] = {}
+        for key, _predicate in fields:
+            if key in values:
+                text = str(values[key])
+                violation_info[key] = text.split("#")[-1] if key == "constraint_type" else text
+            # If no result message, try to get message from the source shape
+            if key == "message" and not violation_info.get("message") and "sourceShape" in values:
+                if messages is None:
+                    messages = shape_messages(results_graph)
+                if values["sourceShape"] in messages:
+                    violation_info["message"] = messages[values["sourceShape"]]
+
         if violation_info:
-            violations.append(violation_info)
-    
-    return violations
+            yield values.get("focusNode"), violation_info
 
 # -------
 # Utilities for batch operations
@@ -0,0 +1,298 @@
+"""schema_index.py - persisted ``$id`` -> path index for fast CLI startup
+-----------------------------------------------------------------------
+
+Building the ``$id`` -> path map means walking the whole checkout and parsing
+every ``schema.json``. :class:`SchemaIndex` stores the result in
+``build/schema_index.json`` together with:
+
+* the modification time of every walked directory, so added, removed or
+  renamed files are noticed without listing unchanged directories;
+* the modification time, size and SHA-256 of every indexed file, so only
+  files whose content changed are parsed again.
+
+On startup the snapshot is checked with one ``stat`` per directory and per
+indexed file; anything that changed is rescanned or reparsed, and the
+snapshot is rewritten. A missing, unreadable or outdated snapshot falls back
+to a full walk. The resulting map is identical to
+:func:`~fega_tools.jsonld_utils.build_id_to_path_map`, apart from never
+descending into VCS, cache or virtualenv directories.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, Optional, Set
+
+from fega_tools.jsonld_utils import GITHUB_RAW_PREFIX
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = "1"
+DEFAULT_INDEX_PATH = Path("build") / "schema_index.json"
+SCHEMA_FILENAME = "schema.json"
+CONTEXT_FILENAME = "context.jsonld"
+INDEXED_FILENAMES = (SCHEMA_FILENAME, CONTEXT_FILENAME)
+SKIPPED_DIRECTORIES = frozenset(
+    {
+        ".cache",
+        ".git",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    }
+)
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _parent(rel_path: str) -> str:
+    return rel_path.rpartition("/")[0]
+
+
+def _is_within(rel_path: str, rel_dir: str) -> bool:
+    return not rel_dir or rel_path == rel_dir or rel_path.startswith(rel_dir + "/")
+
+
+class SchemaIndex:
+    """Incrementally maintained snapshot of the repository's schema/context files.
+
+    Call :meth:`load` to get the ``$id`` -> path map. Schemas parsed while
+    refreshing the snapshot are kept in :attr:`documents` (keyed by resolved
+    path) so callers such as :class:`~fega_tools.schema_registry.SchemaRegistry`
+    do not parse them a second time.
+    """
+
+    def __init__(self, repo_root: Path, index_path: Optional[Path] = None) -> None:
+        self.repo_root = repo_root
+        self.index_path = (
+            index_path if index_path is not None else repo_root / DEFAULT_INDEX_PATH
+        )
+        self.documents: Dict[Path, Any] = {}
+        try:
+            index_dir = self.index_path.parent.resolve().relative_to(repo_root.resolve()).as_posix()
+            # Writing the snapshot touches its own directory, so that directory
+            # is always rescanned instead of being compared by mtime.
+            self._index_dir: Optional[str] = "" if index_dir == "." else index_dir
+        except ValueError:
+            self._index_dir = None
+        self.full_rebuild = False
+        self.rescanned_directories = 0
+        self.reused_files = 0
+        self.rehashed_files = 0
+        self.reparsed_files = 0
+
+    # -------
+    # Snapshot IO
+    # -------
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with self.index_path.open("r", encoding="utf-8") as handle:
+                snapshot = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != INDEX_FORMAT_VERSION
+            or snapshot.get("raw_prefix") != GITHUB_RAW_PREFIX
+            or not isinstance(snapshot.get("directories"), dict)
+            or not isinstance(snapshot.get("files"), dict)
+        ):
+            return None
+        return snapshot
+
+    def _write_snapshot(self, directories: Dict[str, int], files: Dict[str, Dict[str, Any]]) -> None:
+        payload = json.dumps(
+            {
+                "version": INDEX_FORMAT_VERSION,
+                "raw_prefix": GITHUB_RAW_PREFIX,
+                "directories": dict(sorted(directories.items())),
+                "files": dict(sorted(files.items())),
+            },
+            indent=1,
+        )
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        except OSError as exc:
+            LOGGER.debug("Cannot write schema index '%s': %s", self.index_path, exc)
+            return
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                temp_file.write(payload)
+            os.replace(temp_name, self.index_path)
+        except OSError as exc:
+            LOGGER.debug("Cannot write schema index '%s': %s", self.index_path, exc)
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+
+    # -------
+    # Directory scanning
+    # -------
+
+    def _walk(self, rel_dir: str, directories: Dict[str, int], found: Set[str]) -> None:
+        """Record every directory and indexed file under *rel_dir*."""
+        top = self.repo_root / rel_dir if rel_dir else self.repo_root
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [name for name in dirnames if name not in SKIPPED_DIRECTORIES]
+            rel = Path(dirpath).relative_to(self.repo_root).as_posix()
+            rel = "" if rel == "." else rel
+            try:
+                directories[rel] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            found.update(_join(rel, name) for name in filenames if name in INDEXED_FILENAMES)
+
+    def _rescan(
+        self,
+        rel_dir: str,
+        known_directories: Iterable[str],
+        directories: Dict[str, int],
+        found: Set[str],
+    ) -> None:
+        """Refresh one directory whose listing changed since the snapshot."""
+        path = self.repo_root / rel_dir if rel_dir else self.repo_root
+        directories[rel_dir] = os.stat(path).st_mtime_ns
+        found.difference_update([rel for rel in found if _parent(rel) == rel_dir])
+        known = set(known_directories)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                rel = _join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRECTORIES and rel not in known:
+                        self._walk(rel, directories, found)
+                elif entry.name in INDEXED_FILENAMES:
+                    found.add(rel)
+
+    # -------
+    # Refresh
+    # -------
+
+    def _refresh_entry(self, rel: str, previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the up-to-date index entry of one file, or None if it vanished."""
+        path = self.repo_root / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if (
+            previous is not None
+            and previous.get("mtime_ns") == stat.st_mtime_ns
+            and previous.get("size") == stat.st_size
+        ):
+            self.reused_files += 1
+            return previous
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(content).hexdigest()
+        entry: Dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        if previous is not None and previous.get("sha256") == digest:
+            self.rehashed_files += 1
+            if "id" in previous:
+                entry["id"] = previous["id"]
+            return entry
+
+        self.reparsed_files += 1
+        if rel.rpartition("/")[2] == SCHEMA_FILENAME:
+            schema_id = None
+            try:
+                schema = json.loads(content.decode("utf-8"))
+                self.documents[path.resolve()] = schema
+                schema_id = schema.get("$id") if isinstance(schema, dict) else None
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                pass
+            entry["id"] = schema_id if isinstance(schema_id, str) and schema_id else None
+        return entry
+
+    def load(self) -> Dict[str, Path]:
+        """Return the ``$id`` -> path map, refreshing the snapshot if needed."""
+        snapshot = self._read_snapshot()
+        directories: Dict[str, int] = {}
+        found: Set[str] = set()
+        previous_files: Dict[str, Dict[str, Any]] = {}
+
+        if snapshot is None:
+            self.full_rebuild = True
+            self._walk("", directories, found)
+        else:
+            previous_files = snapshot["files"]
+            known_directories = snapshot["directories"]
+            found.update(previous_files)
+            for rel_dir in sorted(known_directories):
+                if rel_dir in directories:
+                    continue
+                path = self.repo_root / rel_dir if rel_dir else self.repo_root
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    # Removed directory: forget everything below it.
+                    found.difference_update([rel for rel in found if _is_within(rel, rel_dir)])
+                    continue
+                if rel_dir == self._index_dir:
+                    self._rescan(rel_dir, known_directories, directories, found)
+                elif mtime_ns == known_directories[rel_dir]:
+                    directories[rel_dir] = mtime_ns
+                else:
+                    self.rescanned_directories += 1
+                    self._rescan(rel_dir, known_directories, directories, found)
+
+        files: Dict[str, Dict[str, Any]] = {}
+        for rel in sorted(found):
+            entry = self._refresh_entry(rel, previous_files.get(rel))
+            if entry is not None:
+                files[rel] = entry
+
+        changed = (
+            snapshot is None
+            or self._tracked(directories) != self._tracked(snapshot["directories"])
+            or files != snapshot["files"]
+        )
+        if changed:
+            self._write_snapshot(directories, files)
+        LOGGER.debug("Schema index '%s': %s", self.index_path, self.stats())
+        return self._id_map(files)
+
+    def _tracked(self, directories: Dict[str, int]) -> Dict[str, int]:
+        return {rel: mtime for rel, mtime in directories.items() if rel != self._index_dir}
+
+    def _id_map(self, files: Dict[str, Dict[str, Any]]) -> Dict[str, Path]:
+        """Build the map in the same precedence order as build_id_to_path_map."""
+        def sort_key(rel: str) -> Any:
+            return PurePosixPath(rel).parts
+
+        id_map: Dict[str, Path] = {}
+        for rel in sorted((r for r in files if r.rpartition("/")[2] == SCHEMA_FILENAME), key=sort_key):
+            schema_id = files[rel].get("id")
+            if schema_id:
+                id_map[schema_id] = self.repo_root / rel
+            id_map.setdefault(GITHUB_RAW_PREFIX + rel, self.repo_root / rel)
+        for rel in sorted((r for r in files if r.rpartition("/")[2] == CONTEXT_FILENAME), key=sort_key):
+            id_map[GITHUB_RAW_PREFIX + rel] = self.repo_root / rel
+        return id_map
+
+    def stats(self) -> Dict[str, Any]:
+        """Return refresh counters for debugging and benchmarks."""
+        return {
+            "full_rebuild": self.full_rebuild,
+            "rescanned_directories": self.rescanned_directories,
+            "reused_files": self.reused_files,
+            "rehashed_files": self.rehashed_files,
+            "reparsed_files": self.reparsed_files,
+        }
@@ -0,0 +1,189 @@
+"""schema_registry.py - parse-once index of the repository's schemas and contexts
+-----------------------------------------------------------------------------
+
+:class:`SchemaRegistry` indexes every ``schema.json`` and ``context.jsonld`` by
+``$id``, by inferred raw-GitHub URL and by resolved local path, and parses
+each of them at most once per run. The index itself is read from the
+persisted :class:`~fega_tools.schema_index.SchemaIndex` snapshot. Resolved JSON-Pointer fragments
+(``schema.json#/$defs/ontologyTerm``) are cached as well, and
+:attr:`SchemaRegistry.contexts` builds each materialized ``@context`` once.
+
+The registry is a read-only ``Mapping[str, Path]`` with the same content as
+:func:`~fega_tools.jsonld_utils.build_id_to_path_map`, so it can be passed
+wherever an ``id_to_path_map`` is expected. Helpers that load files through
+:func:`~fega_tools.jsonld_utils.load_json_file` then reuse its parsed copies.
+
+Documents handed out by the registry are shared between callers and must be
+treated as read-only; copy before modifying them.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+from urllib.parse import urldefrag
+
+from fega_tools.jsonld_utils import ContextMaterializer, index_repository_documents
+from fega_tools.schema_index import SchemaIndex
+
+LOGGER = logging.getLogger(__name__)
+
+
+def json_pointer_parts(fragment: str) -> Tuple[str, ...]:
+    """Return decoded JSON Pointer parts from a URI fragment (without ``#``)."""
+    if not fragment:
+        return ()
+    if not fragment.startswith("/"):
+        raise ValueError(f"Unsupported non-pointer schema fragment '#{fragment}'")
+    return tuple(
+        part.replace("~1", "/").replace("~0", "~")
+        for part in fragment.lstrip("/").split("/")
+        if part != ""
+    )
+
+
+def get_pointer(document: Any, parts: Sequence[str]) -> Any:
+    """Resolve decoded JSON Pointer *parts* inside a JSON document."""
+    current = document
+    for part in parts:
+        if isinstance(current, dict):
+            current = current[part]
+        elif isinstance(current, list):
+            current = current[int(part)]
+        else:
+            raise KeyError(part)
+    return current
+
+
+class SchemaRegistry(Mapping):
+    """Shared, parse-once store of repository JSON documents.
+
+    Mapping access (``registry[url]``, ``registry.get(url)``) returns local
+    paths exactly like an ``id_to_path_map``. :meth:`load_json` and
+    :meth:`resolve` return parsed content; files outside the initial index
+    (frames, examples) are parsed on first use and cached the same way.
+    """
+
+    def __init__(
+        self,
+        id_to_path_map: Dict[str, Path],
+        documents: Optional[Dict[Path, Any]] = None,
+    ) -> None:
+        self._id_to_path_map = dict(id_to_path_map)
+        self._documents: Dict[Path, Any] = {
+            path.resolve(): document for path, document in (documents or {}).items()
+        }
+        self._fragments: Dict[Tuple[Path, Tuple[str, ...]], Any] = {}
+        self._lock = threading.Lock()
+        self.parsed_files = len(self._documents)
+        self.document_hits = 0
+        self.fragment_hits = 0
+        self.fragment_misses = 0
+        self.contexts = ContextMaterializer(self)
+
+    @classmethod
+    def from_repo(cls, repo_root: Path, use_index: bool = True) -> "SchemaRegistry":
+        """Index every ``schema.json``/``context.jsonld`` under *repo_root*.
+
+        By default the map comes from the persisted :class:`SchemaIndex`, and
+        files are parsed lazily on first use. With ``use_index=False`` the tree
+        is walked and every file is parsed up front.
+        """
+        if use_index:
+            index = SchemaIndex(repo_root)
+            id_to_path_map = index.load()
+            documents = index.documents
+        else:
+            id_to_path_map, documents = index_repository_documents(repo_root)
+        registry = cls(id_to_path_map, documents)
+        LOGGER.debug(
+            "Schema registry: %d map entrie(s), %d parsed file(s)",
+            len(registry),
+            registry.parsed_files,
+        )
+        return registry
+
+    # -------
+    # Mapping protocol ($id / raw URL -> path)
+    # -------
+
+    def __getitem__(self, key: str) -> Path:
+        return self._id_to_path_map[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._id_to_path_map)
+
+    def __len__(self) -> int:
+        return len(self._id_to_path_map)
+
+    # -------
+    # Documents
+    # -------
+
+    def load_json(self, path: Path) -> Any:
+        """Return the parsed content of *path*, reading it at most once.
+
+        Raises ``OSError``/``json.JSONDecodeError`` like ``json.load`` would;
+        failures are not cached, so a fixed file is picked up on retry.
+        """
+        resolved = path.resolve()
+        with self._lock:
+            if resolved in self._documents:
+                self.document_hits += 1
+                return self._documents[resolved]
+
+        with resolved.open("r", encoding="utf-8") as handle:
+            document = json.load(handle)
+
+        with self._lock:
+            # Another thread may have won the race; keep the first copy.
+            if resolved not in self._documents:
+                self._documents[resolved] = document
+                self.parsed_files += 1
+            return self._documents[resolved]
+
+    def path_for(self, ref: str, current_file: Optional[Path] = None) -> Optional[Path]:
+        """Map a ``$ref``/context URL (fragment ignored) to a local path."""
+        base, _fragment = urldefrag(ref)
+        if not base:
+            return current_file.resolve() if current_file is not None else None
+        if base in self._id_to_path_map:
+            return self._id_to_path_map[base].resolve()
+        if current_file is not None and not base.startswith(("http://", "https://")):
+            return (current_file.parent / base).resolve()
+        return None
+
+    def fragment(self, path: Path, parts: Sequence[str]) -> Any:
+        """Return the JSON-Pointer target *parts* inside *path*, cached."""
+        key = (path.resolve(), tuple(parts))
+        with self._lock:
+            if key in self._fragments:
+                self.fragment_hits += 1
+                return self._fragments[key]
+
+        target = get_pointer(self.load_json(key[0]), key[1])
+        with self._lock:
+            self._fragments[key] = target
+            self.fragment_misses += 1
+        return target
+
+    def resolve(self, ref: str, current_file: Optional[Path] = None) -> Any:
+        """Return the JSON value a ``$ref`` points to, e.g. ``schema.json#/$defs/x``."""
+        path = self.path_for(ref, current_file)
+        if path is None:
+            raise FileNotFoundError(f"Cannot map reference '{ref}' to a local file")
+        return self.fragment(path, json_pointer_parts(urldefrag(ref)[1]))
+
+    def stats(self) -> Dict[str, int]:
+        """Return parse and cache counters for run summaries."""
+        with self._lock:
+            return {
+                "map_entries": len(self._id_to_path_map),
+                "parsed_files": self.parsed_files,
+                "document_hits": self.document_hits,
+                "fragment_hits": self.fragment_hits,
+                "fragment_misses": self.fragment_misses,
+            }
@@ -0,0 +1,358 @@
+"""validation_cache.py - content-addressed cache of schema validation results
+---------------------------------------------------------------------------
+
+A cache key covers everything that can change a validation outcome: the
+canonicalised ``{"data", "schema"}`` wrapper, the validator identity, and the
+content hash of every schema file reachable from ``schema.$ref``. Editing an
+example, or any schema it (transitively) references, therefore produces a new
+key, while unchanged files cost a hash lookup instead of a validator round trip.
+
+Only definitive outcomes (passed/failed) are stored; request errors and
+unrecognised responses are always retried.
+
+Caching is opt-in (``--cache-dir``): Biovalidator outcomes of ontology
+keywords such as ``graphRestriction`` also depend on external ontology
+lookups and on the validator build, which the key cannot see. Pass a
+``--cache-salt`` (e.g. the validator version) to start from fresh keys when
+either changes.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urldefrag
+
+from fega_tools.validation_common import INVALID_STATUS, VALID_STATUS
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = "1"
+SUGGESTED_CACHE_DIR = Path(".cache/fega-tools/validation")
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHEABLE_STATUSES = (VALID_STATUS, INVALID_STATUS)
+
+
+def canonical_json(value: Any) -> bytes:
+    """Serialise a JSON value deterministically (sorted keys, no whitespace)."""
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _iter_refs(value: Any) -> Iterator[str]:
+    """Yield every string ``$ref`` found anywhere in a JSON value."""
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        for child in value.values():
+            yield from _iter_refs(child)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_refs(item)
+
+
+def resolve_schema_file(
+    ref: str,
+    current_file: Optional[Path],
+    id_to_path_map: Dict[str, Path],
+) -> Optional[Path]:
+    """Map a JSON Schema ``$ref`` to the local file it points into, if any."""
+    base, _fragment = urldefrag(ref)
+    if not base:
+        return current_file
+    if base in id_to_path_map:
+        return id_to_path_map[base].resolve()
+    if current_file is not None and not base.startswith(("http://", "https://")):
+        candidate = (current_file.parent / base).resolve()
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def schema_dependency_paths(
+    schema_ref: str,
+    id_to_path_map: Dict[str, Path],
+) -> Tuple[List[Path], List[str]]:
+    """Return schema files reachable from *schema_ref* and refs that stay unresolved."""
+    root = resolve_schema_file(schema_ref, None, id_to_path_map)
+    if root is None:
+        return [], [schema_ref]
+
+    seen: Set[Path] = {root}
+    pending = [root]
+    unresolved: Set[str] = set()
+    while pending:
+        current = pending.pop()
+        try:
+            with current.open("r", encoding="utf-8") as handle:
+                schema = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            # Malformed schemas have no refs to follow, but their bytes still
+            # contribute to the key.
+            continue
+        for ref in _iter_refs(schema):
+            target = resolve_schema_file(ref, current, id_to_path_map)
+            if target is None:
+                unresolved.add(ref)
+            elif target not in seen:
+                seen.add(target)
+                pending.append(target)
+
+    return sorted(seen), sorted(unresolved)
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """On-disk, content-addressed store of classified validation results.
+
+    Entries live under ``<cache_dir>/<key[:2]>/<key>.json``. Reads refresh an
+    entry's modification time, so :meth:`prune` evicts the least recently
+    used entries first once ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        id_to_path_map: Dict[str, Path],
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        salt: str = "",
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.salt = salt
+        self.id_to_path_map = id_to_path_map
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        self._schema_digests: Dict[str, Optional[str]] = {}
+        self._file_digests: Dict[Path, str] = {}
+
+    def __enter__(self) -> "ValidationCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.prune()
+
+    # -------
+    # Keys
+    # -------
+
+    def _digest_for_file(self, path: Path) -> str:
+        with self._lock:
+            cached = self._file_digests.get(path)
+        if cached is None:
+            cached = _file_digest(path)
+            with self._lock:
+                self._file_digests[path] = cached
+        return cached
+
+    def schema_digest(self, schema_ref: str) -> Optional[str]:
+        """Return a digest of every local schema file reachable from *schema_ref*.
+
+        Returns None when the root schema cannot be mapped to a local file,
+        since a remote schema could change without the key noticing.
+        """
+        with self._lock:
+            if schema_ref in self._schema_digests:
+                return self._schema_digests[schema_ref]
+
+        paths, unresolved = schema_dependency_paths(schema_ref, self.id_to_path_map)
+        digest: Optional[str] = None
+        try:
+            file_digests = sorted(self._digest_for_file(path) for path in paths)
+        except OSError as exc:
+            LOGGER.warning("Cannot hash schemas for '%s'; not caching: %s", schema_ref, exc)
+            file_digests = []
+        if file_digests:
+            # Hash contents only, so keys survive moving the checkout elsewhere.
+            hasher = hashlib.sha256()
+            for file_digest in file_digests:
+                hasher.update(file_digest.encode("ascii"))
+                hasher.update(b"\n")
+            for ref in unresolved:
+                hasher.update(ref.encode("utf-8"))
+                hasher.update(b"\n")
+            digest = hasher.hexdigest()
+
+        with self._lock:
+            self._schema_digests[schema_ref] = digest
+        return digest
+
+    def key_for(self, document: Dict[str, Any], validator_id: str) -> Optional[str]:
+        """Return the cache key of one wrapper document, or None if uncacheable."""
+        schema = document.get("schema")
+        schema_ref = schema.get("$ref") if isinstance(schema, dict) else None
+        if not isinstance(schema_ref, str) or not schema_ref:
+            return None
+        schema_digest = self.schema_digest(schema_ref)
+        if schema_digest is None:
+            return None
+
+        hasher = hashlib.sha256()
+        hasher.update(CACHE_FORMAT_VERSION.encode("ascii"))
+        hasher.update(b"\0")
+        hasher.update(validator_id.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(self.salt.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(schema_digest.encode("ascii"))
+        hasher.update(b"\0")
+        hasher.update(canonical_json({"data": document.get("data"), "schema": schema}))
+        return hasher.hexdigest()
+
+    # -------
+    # Entries
+    # -------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached ``{"status", "errors"}`` record for *key*, if any."""
+        if key is None:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            with entry_path.open("r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+            os.utime(entry_path)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if not isinstance(entry, dict) or entry.get("status") not in CACHEABLE_STATUSES:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return {"status": entry["status"], "errors": entry.get("errors", [])}
+
+    def put(self, key: Optional[str], status: str, errors: Sequence[Any]) -> None:
+        """Store a definitive validation outcome under *key*."""
+        if key is None or status not in CACHEABLE_STATUSES:
+            return
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = canonical_json({"status": status, "errors": list(errors)})
+
+        # Write atomically so concurrent readers never see a partial entry.
+        handle, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                temp_file.write(payload)
+            os.replace(temp_name, entry_path)
+        except OSError as exc:
+            LOGGER.warning("Cannot write validation cache entry '%s': %s", entry_path, exc)
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self.stores += 1
+
+    def prune(self) -> int:
+        """Evict least recently used entries beyond the size limits."""
+        if not self.cache_dir.is_dir():
+            return 0
+
+        entries = []
+        for entry_path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        entries.sort(reverse=True)
+        kept_bytes = 0
+        evicted = 0
+        for index, (_mtime, size, entry_path) in enumerate(entries):
+            kept_bytes += size
+            if index < self.max_entries and kept_bytes <= self.max_bytes:
+                continue
+            try:
+                entry_path.unlink()
+                evicted += 1
+            except OSError:
+                pass
+
+        if evicted:
+            LOGGER.debug("Evicted %d validation cache entrie(s)", evicted)
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for run summaries."""
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+        }
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--cache-dir``/``--cache-salt``/``--no-cache`` options to a CLI parser."""
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=(
+            "Cache passed/failed outcomes in this directory, e.g. "
+            f"{SUGGESTED_CACHE_DIR} (default: no caching)."
+        ),
+    )
+    parser.add_argument(
+        "--cache-salt",
+        default="",
+        help=(
+            "Text mixed into every cache key, e.g. the validator version; change it "
+            "to ignore results cached by another validator build or ontology state."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Always contact the validator; do not read or write cached results.",
+    )
+
+
+def cache_from_args(
+    args: argparse.Namespace,
+    id_to_path_map: Dict[str, Path],
+) -> Optional[ValidationCache]:
+    """Build a cache from options added by :func:`add_cache_arguments`.
+
+    Returns None unless ``--cache-dir`` is given, or with ``--no-cache``.
+    """
+    if args.no_cache or args.cache_dir is None:
+        return None
+    return ValidationCache(args.cache_dir, id_to_path_map, salt=args.cache_salt)
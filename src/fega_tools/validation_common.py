@@ -1,11 +1,17 @@
 """Shared helpers for FEGA validation CLI scripts."""
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
 from fega_tools.io import collect_candidate_json
+from fega_tools.jsonld_utils import freeze_json
 
 DEFAULT_ROOT = Path("schemas/entities")
 
@@ -107,10 +113,134 @@ def coverage_gaps_for_entity_category(
     ]
 
 
+# -------
+# Parsed-document cache
+# -------
+
+DEFAULT_DOCUMENT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class _CachedDocument(NamedTuple):
+    mtime_ns: int
+    size: int
+    sha256: Optional[str]
+    document: Any
+
+
+class DocumentCache:
+    """Parse-once cache for JSON files shared by every check in a process.
+
+    Entries are keyed by resolved path and validated against the file's
+    modification time and size (and its SHA-256 with ``verify_content``), so
+    edited files are parsed again. Documents are frozen with
+    :func:`~fega_tools.jsonld_utils.freeze_json`: they are shared between
+    callers and raise ``TypeError`` on in-place changes; copy them first.
+
+    The least recently used files are dropped once the cached files add up to
+    more than *max_bytes* on disk. Safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_DOCUMENT_CACHE_BYTES,
+        verify_content: bool = False,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.verify_content = verify_content
+        self._entries: "OrderedDict[Path, _CachedDocument]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Path) -> Any:
+        """Return the frozen parsed content of *path*, parsing it at most once.
+
+        Raises ``OSError``/``json.JSONDecodeError`` like ``json.load`` would;
+        failures are not cached.
+        """
+        resolved = path.resolve()
+        stat = os.stat(resolved)
+        with self._lock:
+            entry = self._entries.get(resolved)
+            if (
+                entry is not None
+                and not self.verify_content
+                and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size)
+            ):
+                self._entries.move_to_end(resolved)
+                self.hits += 1
+                return entry.document
+
+        content = resolved.read_bytes()
+        digest = hashlib.sha256(content).hexdigest() if self.verify_content else None
+        if entry is not None and digest is not None and entry.sha256 == digest:
+            document = entry.document
+            with self._lock:
+                self.hits += 1
+        else:
+            document = freeze_json(json.loads(content.decode("utf-8")))
+            with self._lock:
+                self.misses += 1
+
+        with self._lock:
+            previous = self._entries.pop(resolved, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[resolved] = _CachedDocument(
+                stat.st_mtime_ns, len(content), digest, document
+            )
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+        return document
+
+    def discard(self, path: Path) -> None:
+        """Forget *path*, e.g. once a streaming consumer is done with it."""
+        with self._lock:
+            entry = self._entries.pop(path.resolve(), None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self) -> None:
+        """Forget every cached document."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters for run summaries."""
+        with self._lock:
+            return {
+                "cached_documents": len(self._entries),
+                "cached_bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+DOCUMENT_CACHE = DocumentCache()
+
+
+def load_json_document(path: Path) -> Any:
+    """Parse a JSON file through the process-wide :data:`DOCUMENT_CACHE`.
+
+    The result is shared and read-only; copy it before modifying it.
+    """
+    return DOCUMENT_CACHE.load(path)
+
+
 def load_wrapped_example(path: Path) -> Dict[str, Any]:
-    """Load a wrapped FEGA example and require top-level data/schema keys."""
-    with path.open("r", encoding="utf-8") as handle:
-        document = json.load(handle)
+    """Load a wrapped FEGA example and require top-level data/schema keys.
+
+    The document comes from :data:`DOCUMENT_CACHE`, so it is parsed once per
+    process however many checks read it, and it is read-only.
+    """
+    document = load_json_document(path)
 
     if not isinstance(document, dict) or not {"data", "schema"}.issubset(document):
         raise ValueError("Expected a JSON object containing both 'data' and 'schema' keys")
@@ -139,3 +269,27 @@ def write_json_summary(summary: Dict[str, Any], summary_dir: Path, filename: str
     with (summary_dir / filename).open("w", encoding="utf-8") as handle:
         json.dump(summary, handle, indent=2)
         handle.write("\n")
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value (an argparse ``type``)."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a zero-or-greater integer command-line value (an argparse ``type``)."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value!r}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """Parse a strictly positive number command-line value (an argparse ``type``)."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value!r}")
+    return number
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+import requests
+
+from fega_tools.biovalidator import (
+    DEFAULT_POOL_SIZE,
+    BiovalidatorClient,
+    add_client_arguments,
+    classify_response,
+    client_from_args,
+)
+from fega_tools.validation_common import DOCUMENT_CACHE
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_ROOT = REPO_ROOT / "scripts" / "py"
+if str(SCRIPT_ROOT) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_ROOT))
+
+import validate_metadata
+
+
+class _StubValidatorHandler(BaseHTTPRequestHandler):
+    """Minimal Biovalidator stand-in: 'bad' data fails, anything else passes.
+
+    ``POST /validate/batch`` answers one response per data item when the
+    server's ``batch_enabled`` flag is set, and 404 otherwise.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, value: Any) -> None:
+        body = json.dumps(value).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._send_json(200, {"status": "up"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        document = json.loads(self.rfile.read(length))
+        server.requests.append(self.path)
+        if server.failures_left > 0:
+            server.failures_left -= 1
+            self._send_json(503, {"error": "busy"})
+            return
+        if self.path.endswith("/batch"):
+            if not server.batch_enabled:
+                self._send_json(404, {"error": "no such route"})
+                return
+            self._send_json(
+                200,
+                [
+                    _validate_stub_document({"schema": document["schema"], "data": data})
+                    for data in document["data"]
+                ],
+            )
+            return
+        self._send_json(200, _validate_stub_document(document))
+
+
+def _validate_stub_document(document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if document.get("data", {}).get("bad"):
+        return [{"dataPath": "/bad", "errors": ["must not be present"]}]
+    return []
+
+
+@pytest.fixture
+def stub_validator() -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubValidatorHandler)
+    server.requests = []
+    server.failures_left = 0
+    server.batch_enabled = False
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/validate"
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_validates_documents_over_one_session(stub_validator) -> None:
+    """Check the pooled client posts wrappers and returns parsed responses."""
+    with BiovalidatorClient(stub_validator.url) as client:
+        client.assert_reachable()
+        passed = client.validate({"schema": {"$ref": "x"}, "data": {}})
+        failed = client.validate({"schema": {"$ref": "x"}, "data": {"bad": True}})
+
+    assert classify_response(passed) == "validation_passed"
+    assert classify_response(failed) == "validation_failed"
+
+
+def test_client_retries_service_unavailable(stub_validator) -> None:
+    """Check 503 responses are retried instead of failing the file."""
+    stub_validator.failures_left = 2
+    client = BiovalidatorClient(stub_validator.url, retries=3, backoff_factor=0)
+
+    assert client.validate({"schema": {"$ref": "x"}, "data": {}}) == []
+    assert len(stub_validator.requests) == 3
+
+
+def test_client_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError, match="pool_size"):
+        BiovalidatorClient(pool_size=0)
+
+
+def test_client_does_not_retry_read_timeouts() -> None:
+    """Check only connection errors and 502/503 responses are retried."""
+    client = BiovalidatorClient(retries=3)
+
+    retry = client.session.get_adapter(client.url).max_retries
+    assert (retry.connect, retry.read, retry.status) == (3, 0, 3)
+
+
+def test_client_pool_size_follows_options() -> None:
+    parser = argparse.ArgumentParser()
+    add_client_arguments(parser)
+
+    assert client_from_args("http://x/validate", parser.parse_args([]), pool_size=2).pool_size == 2
+    assert client_from_args("http://x/validate", parser.parse_args([])).pool_size == DEFAULT_POOL_SIZE
+    options = parser.parse_args(["--pool-size", "4"])
+    assert client_from_args("http://x/validate", options, pool_size=2).pool_size == 4
+
+
+def _documents() -> List[Dict[str, Any]]:
+    return [
+        {"schema": {"$ref": "a"}, "data": {"n": 0}},
+        {"schema": {"$ref": "b"}, "data": {"n": 1, "bad": True}},
+        {"schema": {"$ref": "a"}, "data": {"n": 2, "bad": True}},
+        {"schema": {"$ref": "a"}, "data": {"n": 3}},
+    ]
+
+
+def test_validate_many_groups_documents_by_schema(stub_validator) -> None:
+    """Check documents sharing a schema go through the batch route in one request."""
+    stub_validator.batch_enabled = True
+    client = BiovalidatorClient(stub_validator.url)
+
+    responses = client.validate_many(_documents(), batch_size=10)
+
+    assert [classify_response(response) for response in responses] == [
+        "validation_passed",
+        "validation_failed",
+        "validation_failed",
+        "validation_passed",
+    ]
+    assert stub_validator.requests == ["/validate/batch", "/validate"]
+    assert client.batch_supported is True
+
+
+def test_validate_many_falls_back_without_batch_route(stub_validator) -> None:
+    """Check a missing batch route is detected once, then documents go one by one."""
+    client = BiovalidatorClient(stub_validator.url)
+
+    responses = client.validate_many(_documents(), batch_size=10)
+
+    assert [classify_response(response) for response in responses] == [
+        "validation_passed",
+        "validation_failed",
+        "validation_failed",
+        "validation_passed",
+    ]
+    assert client.batch_supported is False
+    assert stub_validator.requests.count("/validate/batch") == 1
+
+
+def test_validate_many_reports_request_errors_per_document() -> None:
+    """Check unreachable validators yield one exception per document."""
+    client = BiovalidatorClient("http://127.0.0.1:9/validate", retries=0)
+
+    responses = client.validate_many(_documents()[:2], batch_size=1)
+
+    assert all(isinstance(response, requests.RequestException) for response in responses)
+
+
+@pytest.mark.parametrize("batch_enabled", [False, True])
+def test_metadata_summary_is_unchanged_by_batching(
+    stub_validator,
+    tmp_path: Path,
+    batch_enabled: bool,
+) -> None:
+    """Check batched runs report the same failed files and errors as single requests."""
+    for index, document in enumerate(_documents()):
+        (tmp_path / f"record-{index}.json").write_text(json.dumps(document), encoding="utf-8")
+    stub_validator.batch_enabled = batch_enabled
+
+    with BiovalidatorClient(stub_validator.url) as client:
+        single = validate_metadata.validate_paths([tmp_path], client)
+    with BiovalidatorClient(stub_validator.url) as client:
+        batched = validate_metadata.validate_paths([tmp_path], client, batch_size=3)
+
+    assert batched["failed_files"] == single["failed_files"]
+    assert batched["errors_of_failed_files"] == single["errors_of_failed_files"]
+    assert len(single["failed_files"]) == 2
+
+
+def test_metadata_sniffing_skips_non_wrapper_json(stub_validator, tmp_path: Path) -> None:
+    """Check --sniff discovery validates the same documents as a full parse."""
+    for index, document in enumerate(_documents()):
+        (tmp_path / f"record-{index}.json").write_text(json.dumps(document), encoding="utf-8")
+    (tmp_path / "package.json").write_text(json.dumps({"name": "not-metadata"}), encoding="utf-8")
+    (tmp_path / "list.json").write_text(json.dumps([_documents()[0]]), encoding="utf-8")
+
+    with BiovalidatorClient(stub_validator.url) as client:
+        parsed = validate_metadata.validate_paths([tmp_path], client)
+    with BiovalidatorClient(stub_validator.url) as client:
+        sniffed = validate_metadata.validate_paths([tmp_path], client, sniff=True)
+
+    assert sniffed["n_total_files"] == parsed["n_total_files"] == len(_documents())
+    assert sniffed["failed_files"] == parsed["failed_files"]
+
+
+def test_metadata_documents_are_released_after_their_window(stub_validator, tmp_path: Path) -> None:
+    """Check validated documents do not stay in the process-wide document cache."""
+    for index, document in enumerate(_documents()):
+        (tmp_path / f"record-{index}.json").write_text(json.dumps(document), encoding="utf-8")
+    DOCUMENT_CACHE.clear()
+
+    with BiovalidatorClient(stub_validator.url) as client:
+        summary = validate_metadata.validate_paths([tmp_path], client, batch_size=1)
+
+    assert summary["n_total_files"] == len(_documents())
+    assert DOCUMENT_CACHE.stats()["cached_documents"] == 0
+    assert validate_metadata.filter_metadata_files(sorted(tmp_path.glob("*.json")))
+    assert DOCUMENT_CACHE.stats()["cached_documents"] == 0
+
+
+def test_batch_url_is_only_a_validate_metadata_option() -> None:
+    args = validate_metadata.make_arg_parser().parse_args(["records", "--batch-url", "http://x/batch"])
+    assert client_from_args("http://x/validate", args).batch_url == "http://x/batch"
+
+    parser = argparse.ArgumentParser()
+    add_client_arguments(parser)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--batch-url", "http://x/batch"])
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from fega_tools.depgraph import DependencyGraph, changed_pointers
+from fega_tools.incremental import IncrementalRun
+from fega_tools.schema_registry import SchemaRegistry
+from fega_tools.validation_common import DOCUMENT_CACHE, VALID_STATUS
+
+COMMON = "schemas/common/schema.json"
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _touch_later(path: Path, seconds: int = 10) -> None:
+    """Move a path's mtime forward so changes are visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def _write_repo(repo: Path) -> None:
+    """Two entities sharing a common context, each using a different common $def."""
+    _write_json(
+        repo / COMMON,
+        {"$defs": {"text": {"type": "string"}, "number": {"type": "integer"}}},
+    )
+    _write_json(repo / "schemas" / "common" / "context.jsonld", {"@context": {"ex": "https://example.org/"}})
+    for entity, definition in (("sample", "text"), ("study", "number")):
+        entity_dir = repo / "schemas" / "entities" / entity
+        entity_id = f"https://example.org/schemas/entities/{entity}/schema.json"
+        _write_json(
+            entity_dir / "schema.json",
+            {
+                "$id": entity_id,
+                "@context": "./context.jsonld",
+                "properties": {"value": {"$ref": f"../../common/schema.json#/$defs/{definition}"}},
+            },
+        )
+        _write_json(
+            entity_dir / "context.jsonld",
+            {"@context": ["../../common/context.jsonld", {"value": "ex:value"}]},
+        )
+        _write_json(entity_dir / "frame.jsonld", {"@context": entity_id})
+        _write_json(
+            entity_dir / "examples" / "valid" / f"{entity}.json",
+            {
+                "data": {"@context": "../../context.jsonld", "@type": "ex:Thing", "value": "a"},
+                "schema": {"$ref": entity_id},
+            },
+        )
+
+
+def _files(nodes: set) -> set:
+    return {path for path, _pointer in nodes}
+
+
+def test_dependents_follow_json_pointers(tmp_path: Path) -> None:
+    """Check a change to one $def only reaches the entity and examples using it."""
+    _write_repo(tmp_path)
+    graph = DependencyGraph(tmp_path, SchemaRegistry.from_repo(tmp_path, use_index=False)).load()
+
+    assert _files(graph.dependents([(COMMON, "/$defs/text/type")])) == {
+        "schemas/entities/sample/schema.json",
+        "schemas/entities/sample/examples/valid/sample.json",
+    }
+    assert "schemas/entities/study/schema.json" in _files(graph.dependents([(COMMON, "")]))
+
+    context_dependents = _files(graph.dependents([("schemas/common/context.jsonld", "")]))
+    assert {
+        "schemas/entities/sample/context.jsonld",
+        "schemas/entities/sample/frame.jsonld",
+        "schemas/entities/study/examples/valid/study.json",
+    } <= context_dependents
+    assert (COMMON, "/$defs/number") in graph.dependencies(
+        [("schemas/entities/study/examples/valid/study.json", "")]
+    )
+
+
+def test_graph_snapshot_is_refreshed_incrementally(tmp_path: Path) -> None:
+    """Check a reload reuses unchanged files and reparses edited ones."""
+    _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    first = DependencyGraph(tmp_path, registry).load()
+    assert first.full_rebuild
+    assert (tmp_path / "build" / "dependency_graph.json").is_file()
+
+    second = DependencyGraph(tmp_path, registry).load()
+    assert second.stats()["reparsed_files"] == 0
+    assert second.forward == first.forward
+
+    schema_path = tmp_path / "schemas" / "entities" / "study" / "schema.json"
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    schema["properties"]["value"]["$ref"] = "../../common/schema.json#/$defs/text"
+    _write_json(schema_path, schema)
+    _touch_later(schema_path)
+
+    third = DependencyGraph(tmp_path, registry).load()
+    assert third.stats()["reparsed_files"] == 1
+    assert "schemas/entities/study/schema.json" in _files(third.dependents([(COMMON, "/$defs/text")]))
+
+
+def test_changed_pointers_reports_outermost_differences() -> None:
+    """Check JSON values are diffed down to the changed members."""
+    old = {"$defs": {"a": {"type": "string"}, "b~/c": 1}, "items": [1, 2]}
+    new = {"$defs": {"a": {"type": "integer"}, "b~/c": 2, "d": 3}, "items": [1, 2, 3]}
+
+    assert changed_pointers(old, old) == []
+    assert changed_pointers(old, new) == ["/$defs/a/type", "/$defs/b~0~1c", "/$defs/d", "/items"]
+
+
+def test_incremental_run_selects_inputs_through_the_graph(tmp_path: Path) -> None:
+    """Check the graph selects the same inputs as per-example dependency resolution."""
+    _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    graph = DependencyGraph(tmp_path, registry).load()
+    examples = sorted(tmp_path.glob("schemas/entities/*/examples/valid/*.json"))
+    previous = {"files": [{"file": str(path), "status": VALID_STATUS} for path in examples]}
+    DOCUMENT_CACHE.clear()
+
+    for changed in (COMMON, "schemas/common/context.jsonld", "schemas/entities/study/context.jsonld"):
+        with_graph = IncrementalRun([tmp_path / changed], registry, previous, graph=graph)
+        without_graph = IncrementalRun([tmp_path / changed], registry, previous)
+        assert [with_graph.reusable_result(path) for path in examples] == [
+            without_graph.reusable_result(path) for path in examples
+        ]
+        assert with_graph.stats()["dependency_graph"]
+
+
+@pytest.mark.parametrize("renamed_to", [None, "schemas/common/defs.json"])
+def test_referrers_of_a_deleted_or_renamed_schema_stay_affected(
+    tmp_path: Path,
+    renamed_to: Optional[str],
+) -> None:
+    """Check $refs left dangling by a delete or rename still reach their referrers."""
+    _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    DependencyGraph(tmp_path, registry).load()
+    common = tmp_path / COMMON
+    changed = [common]
+    if renamed_to is None:
+        common.unlink()
+    else:
+        changed.append(common.rename(tmp_path / renamed_to))
+
+    graph = DependencyGraph(tmp_path, SchemaRegistry.from_repo(tmp_path, use_index=False)).load()
+    affected = {path.relative_to(tmp_path.resolve()).as_posix() for path in graph.affected_paths(changed)}
+
+    assert "schemas/entities/sample/schema.json" in graph.broken_files()
+    assert {
+        "schemas/entities/sample/schema.json",
+        "schemas/entities/sample/examples/valid/sample.json",
+        "schemas/entities/study/schema.json",
+        "schemas/entities/study/examples/valid/study.json",
+    } <= affected
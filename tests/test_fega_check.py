@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_ROOT = REPO_ROOT / "scripts" / "py"
+if str(SCRIPT_ROOT) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_ROOT))
+
+import fega_check
+from validate_jsonld_contexts import validate_jsonld_contexts
+
+
+def test_selected_checks_share_one_registry_and_write_their_summaries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check the runner builds one registry and writes each usual summary file."""
+    registries = []
+    original_run_checks = fega_check.run_checks
+
+    def recording_run_checks(checks, args, shared):
+        registries.append(shared["registry"])
+        return original_run_checks(checks, args, shared)
+
+    monkeypatch.setattr(fega_check, "run_checks", recording_run_checks)
+    root = REPO_ROOT / "schemas" / "entities"
+
+    with pytest.raises(SystemExit) as exit_info:
+        fega_check.main(
+            [
+                "--root",
+                str(root),
+                "--entity",
+                "cohort",
+                "--checks",
+                "coverage",
+                "contexts",
+                "--summary-dir",
+                str(tmp_path),
+            ]
+        )
+
+    assert exit_info.value.code == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "jsonld_coverage_summary.json",
+        "jsonld_summary.json",
+    ]
+    contexts_summary = json.loads((tmp_path / "jsonld_summary.json").read_text(encoding="utf-8"))
+    standalone = validate_jsonld_contexts(root, "cohort")
+    assert contexts_summary["files"] == standalone["files"]
+    assert len(registries) == 1
+    assert registries[0].stats()["parsed_files"] > 0
+
+
+def test_check_modules_expose_the_public_runner_interface() -> None:
+    for module in fega_check.CHECK_MODULES.values():
+        assert callable(module.log_results)
+        assert module.SUMMARY_FILENAME.endswith(".json")
+
+
+def test_shacl_check_requires_shapes() -> None:
+    """Check an explicitly requested SHACL stage needs shape files."""
+    with pytest.raises(SystemExit) as exit_info:
+        fega_check.main(["--checks", "shacl"])
+
+    assert exit_info.value.code == 2
@@ -14,12 +14,20 @@ def test_fega_tools_modules_import() -> None:
     """Check that the main helper modules can be imported."""
     modules = [
         "fega_tools.biovalidator",
+        "fega_tools.depgraph",
+        "fega_tools.incremental",
         "fega_tools.io",
         "fega_tools.json_pointer",
         "fega_tools.jsonld_coverage",
         "fega_tools.jsonld_utils",
+        "fega_tools.local_validator",
         "fega_tools.logging_utils",
+        "fega_tools.pyld_cache",
+        "fega_tools.rdf_compare",
         "fega_tools.rdf_utils",
+        "fega_tools.schema_index",
+        "fega_tools.schema_registry",
+        "fega_tools.validation_cache",
         "fega_tools.validation_common",
     ]
 
@@ -30,6 +38,10 @@ def test_fega_tools_modules_import() -> None:
 def test_validation_scripts_show_help() -> None:
     """Check that each validation script can start and show its help text."""
     scripts = [
+        "scripts/py/benchmark_shacl.py",
+        "scripts/py/benchmark_term_mappings.py",
+        "scripts/py/fega_check.py",
+        "scripts/py/query_dependencies.py",
         "scripts/py/schema_diff.py",
         "scripts/py/validate_examples.py",
         "scripts/py/validate_jsonld_contexts.py",
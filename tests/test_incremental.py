@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from fega_tools.incremental import IncrementalRun, git_changed_paths
+from fega_tools.schema_registry import SchemaRegistry
+from fega_tools.validation_common import DOCUMENT_CACHE, INVALID_STATUS, VALID_STATUS
+
+ENTITY_ID = "https://example.org/schemas/entities/sample/schema.json"
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _write_repo(repo: Path) -> Path:
+    _write_json(repo / "schemas" / "common" / "schema.json", {"$defs": {"text": {"type": "string"}}})
+    _write_json(repo / "schemas" / "common" / "context.jsonld", {"@context": {"ex": "https://example.org/"}})
+    entity_dir = repo / "schemas" / "entities" / "sample"
+    _write_json(
+        entity_dir / "schema.json",
+        {
+            "$id": ENTITY_ID,
+            "@context": "./context.jsonld",
+            "properties": {"label": {"$ref": "../../common/schema.json#/$defs/text"}},
+        },
+    )
+    _write_json(
+        entity_dir / "context.jsonld",
+        {"@context": ["../../common/context.jsonld", {"label": "ex:label"}]},
+    )
+    for name in ("a", "b"):
+        _write_json(
+            entity_dir / "examples" / "valid" / f"{name}.json",
+            {
+                "data": {"@context": "../../context.jsonld", "@type": "ex:Sample", "label": name},
+                "schema": {"$ref": ENTITY_ID},
+            },
+        )
+    return entity_dir
+
+
+def _previous_summary(*paths: Path) -> dict:
+    return {"files": [{"files": [{"file": str(path), "status": VALID_STATUS} for path in paths]}]}
+
+
+def test_only_inputs_that_depend_on_a_changed_file_are_rechecked(tmp_path: Path) -> None:
+    """Check examples are re-checked through the reverse $ref/@context dependencies."""
+    entity_dir = _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    example_a = entity_dir / "examples" / "valid" / "a.json"
+    example_b = entity_dir / "examples" / "valid" / "b.json"
+    previous = _previous_summary(example_a, example_b)
+    DOCUMENT_CACHE.clear()
+
+    touched_example = IncrementalRun([example_a], registry, previous)
+    assert touched_example.reusable_result(example_a) is None
+    assert touched_example.reusable_result(example_b) == {"file": str(example_b), "status": VALID_STATUS}
+    assert (touched_example.rechecked, touched_example.reused) == (1, 1)
+
+    for shared_file in ("context.jsonld", "schema.json"):
+        touched_common = IncrementalRun([tmp_path / "schemas" / "common" / shared_file], registry, previous)
+        assert touched_common.reusable_result(example_a) is None
+        assert touched_common.reusable_result(example_b) is None
+
+    touched_code = IncrementalRun([tmp_path / "scripts" / "py" / "check.py"], registry, previous)
+    assert touched_code.tooling_changed
+    assert touched_code.reusable_result(example_b) is None
+
+
+def test_dependents_of_a_deleted_schema_are_rechecked(tmp_path: Path) -> None:
+    """Check a $ref that no longer resolves makes its inputs non-reusable."""
+    entity_dir = _write_repo(tmp_path)
+    example_a = entity_dir / "examples" / "valid" / "a.json"
+    common_schema = tmp_path / "schemas" / "common" / "schema.json"
+    common_schema.unlink()
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    DOCUMENT_CACHE.clear()
+
+    previous = _previous_summary(example_a)
+    previous["files"][0]["entity"] = entity_dir.name
+    run = IncrementalRun([common_schema], registry, previous)
+
+    assert run.reusable_result(example_a) is None
+    assert run.reusable_entity_result(entity_dir) is None
+    assert (run.rechecked, run.reused) == (2, 0)
+
+def test_only_definitive_stored_results_are_reused(tmp_path: Path) -> None:
+    """Check missing or inconclusive stored results are always re-checked."""
+    entity_dir = _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path, use_index=False)
+    example_a = entity_dir / "examples" / "valid" / "a.json"
+    example_b = entity_dir / "examples" / "valid" / "b.json"
+    previous = {
+        "files": [
+            {"file": str(example_a), "status": INVALID_STATUS},
+            {"file": str(example_b), "status": "request_error"},
+        ]
+    }
+
+    run = IncrementalRun([], registry, previous)
+
+    assert run.reusable_result(example_a)["status"] == INVALID_STATUS
+    assert run.reusable_result(example_b) is None
+    assert run.reusable_result(entity_dir / "examples" / "valid" / "new.json") is None
+    assert run.stats()["reused"] == 1
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_git_changed_paths_reports_modified_and_untracked_files(tmp_path: Path) -> None:
+    """Check the git change set covers working-tree edits and new files."""
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.org", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    (tmp_path / "kept.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "edited.json").write_text("{}", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+    (tmp_path / "edited.json").write_text('{"a": 1}', encoding="utf-8")
+    (tmp_path / "new.json").write_text("{}", encoding="utf-8")
+
+    assert git_changed_paths(tmp_path, "HEAD") == {
+        (tmp_path / "edited.json").resolve(),
+        (tmp_path / "new.json").resolve(),
+    }
+    with pytest.raises(RuntimeError):
+        git_changed_paths(tmp_path, "no-such-revision")
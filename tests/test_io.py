@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from fega_tools.io import sniff_json_object_keys
+
+WRAPPER_KEYS = frozenset({"data", "schema"})
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ({"schema": {"$ref": "x"}, "data": {"a": 1}}, True),
+        ({"data": {"text": 'braces } ] and "quotes"', "items": [{"b": [1, 2]}]}, "schema": {}}, True),
+        ({"data": {"schema": {}}}, False),
+        ([{"data": {}, "schema": {}}], False),
+        ("just a string", False),
+    ],
+)
+def test_sniff_reads_only_top_level_keys(tmp_path: Path, content: object, expected: bool) -> None:
+    """Check nested keys, strings and arrays do not confuse the key scan."""
+    path = tmp_path / "document.json"
+    path.write_text(json.dumps(content), encoding="utf-8")
+
+    assert sniff_json_object_keys(path, WRAPPER_KEYS) is expected
+
+
+def test_sniff_continues_past_the_prefix_and_defers_malformed_files(tmp_path: Path) -> None:
+    """Check large leading values are skipped and broken JSON is left to the parser."""
+    large = tmp_path / "large.json"
+    large.write_text(
+        json.dumps({"data": {"values": list(range(50_000))}, "other": True}),
+        encoding="utf-8",
+    )
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"data": {"a": }', encoding="utf-8")
+
+    assert sniff_json_object_keys(large, WRAPPER_KEYS, prefix_bytes=1024) is False
+    assert sniff_json_object_keys(broken, WRAPPER_KEYS) is True
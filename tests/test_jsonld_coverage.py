@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from fega_tools import jsonld_coverage
 from fega_tools.jsonld_coverage import (
     collect_schema_property_paths,
     validate_jsonld_coverage,
@@ -192,6 +195,41 @@ def test_known_external_frame_keys_are_allowed(tmp_path: Path) -> None:
     assert result["unknown_frame_keys"] == []
 
 
+def test_worker_pool_summary_matches_serial_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check --workers output is identical, including chunked probe errors."""
+    repo = tmp_path
+    properties = {f"term{index}": {"type": "string"} for index in range(7)}
+    context_terms = {f"term{index}": f"https://example.org/term{index}" for index in range(7)}
+    context_terms.update({"term2": "@id", "term5": None})
+    _write_entity(
+        repo,
+        "large",
+        {"type": "object", "properties": properties},
+        context_terms,
+        {"@type": "ega:large", "term0": {}, "extraKey": {}},
+    )
+    _write_entity(
+        repo,
+        "small",
+        {"type": "object", "properties": {"label": {"type": "string"}}},
+        {"label": "https://example.org/label"},
+        {"@type": "ega:small", "label": {}},
+    )
+    (repo / "schemas" / "entities" / "small" / "frame.jsonld").unlink()
+    monkeypatch.setattr(jsonld_coverage, "TERM_PROBE_CHUNK_SIZE", 2)
+
+    root = repo / "schemas" / "entities"
+    serial = validate_jsonld_coverage(root, None, repo_root=repo)
+    pooled = validate_jsonld_coverage(root, None, repo_root=repo, workers=2)
+
+    assert json.dumps(pooled, indent=2) == json.dumps(serial, indent=2)
+    assert len(serial["files"][0]["context_errors"]) == 2
+    assert serial["files"][1]["frame_errors"]
+
+
 def test_reverse_context_terms_expand_as_relationships() -> None:
     """Reverse properties must be probed with node values, not literals."""
     context = {
@@ -215,3 +253,43 @@ def test_keyword_alias_cannot_cover_a_schema_property() -> None:
     ) == [
         "Term 'id' aliases JSON-LD keyword '@id' and cannot represent a schema property"
     ]
+
+
+def test_batched_term_probe_matches_per_term_expansion() -> None:
+    """Check the single-node probe reports exactly what per-term expansion does."""
+    context = [
+        {"ex": "https://example.org/", "@vocab": "https://example.org/vocab/"},
+        {
+            "plain": "ex:plain",
+            "reference": {"@id": "ex:reference", "@type": "@id"},
+            "listed": {"@id": "ex:listed", "@container": "@list"},
+            "shared": {"@id": "ex:plain"},
+            "dropped": None,
+            "identifier": "@id",
+            "inverse": {"@reverse": "ex:plain"},
+            "scoped": {"@id": "ex:scoped", "@context": {"inner": "ex:inner"}},
+        },
+    ]
+    terms = {
+        "plain",
+        "reference",
+        "listed",
+        "shared",
+        "dropped",
+        "identifier",
+        "inverse",
+        "scoped",
+        "undeclared",
+    }
+
+    expected = validate_context_term_mappings(context, terms, batched=False)
+    assert validate_context_term_mappings(context, terms) == expected
+    assert expected == [
+        "Term 'dropped' does not expand to an absolute IRI",
+        "Term 'identifier' aliases JSON-LD keyword '@id' and cannot represent a schema property",
+    ]
+
+    broken = [{"ex": "https://example.org/", "bad": "relative", "good": "ex:good"}]
+    errors = validate_context_term_mappings(broken, {"bad", "good"})
+    assert errors == validate_context_term_mappings(broken, {"bad", "good"}, batched=False)
+    assert len(errors) == 2
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import sys
+import threading
 from pathlib import Path
+from typing import Any, Dict, List
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -9,7 +11,7 @@ SCRIPT_ROOT = REPO_ROOT / "scripts" / "py"
 if str(SCRIPT_ROOT) not in sys.path:
     sys.path.insert(0, str(SCRIPT_ROOT))
 
-from validate_jsonld_frames import _select_primary_entity
+from validate_jsonld_frames import _select_primary_entity, validate_jsonld_frames
 
 
 def test_primary_selection_matches_equivalent_compact_and_absolute_ids() -> None:
@@ -36,3 +38,55 @@ def test_primary_selection_matches_equivalent_compact_and_absolute_ids() -> None
         "@id": "ega:EGAD00000000001",
         "@type": "ega:dataset",
     }
+
+
+class _AlwaysValidClient:
+    """Stand-in Biovalidator client that accepts every request."""
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def assert_reachable(self) -> None:
+        pass
+
+    def validate(self, wrapper: Dict[str, Any]) -> List[Any]:
+        with self._lock:
+            self.requests.append(wrapper)
+        return []
+
+
+def test_worker_pool_summary_matches_serial_run() -> None:
+    """Check --workers shards files without changing per-file results."""
+    root = REPO_ROOT / "schemas" / "entities"
+    summaries = []
+    for workers in (1, 2):
+        client = _AlwaysValidClient()
+        summary = validate_jsonld_frames(
+            root, "cohort", client, repo_root=REPO_ROOT, workers=workers
+        )
+        assert len(client.requests) == 2 * summary["total_files"]
+        for key in ("timestamp", "context_materialization", "pyld_context_cache"):
+            summary.pop(key)
+        summaries.append(summary)
+
+    assert summaries[0]["passed"]
+    assert summaries[0] == summaries[1]
+
+
+def test_streaming_emits_each_result_and_keeps_the_batch_summary() -> None:
+    """Check --stream reports every file as it finishes and summarizes the same."""
+    root = REPO_ROOT / "schemas" / "entities"
+    batch = validate_jsonld_frames(root, "cohort", _AlwaysValidClient(), repo_root=REPO_ROOT)
+    emitted: List[Dict[str, Any]] = []
+    streamed = validate_jsonld_frames(
+        root,
+        "cohort",
+        _AlwaysValidClient(),
+        repo_root=REPO_ROOT,
+        stream=True,
+        on_result=emitted.append,
+    )
+
+    assert emitted == streamed["files"][0]["files"]
+    assert streamed["files"] == batch["files"]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from fega_tools.biovalidator import classify_response
+from fega_tools.jsonld_utils import GITHUB_RAW_PREFIX
+from fega_tools.local_validator import LocalValidator
+from fega_tools.validation_common import INVALID_STATUS, VALID_STATUS, load_wrapped_example
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENTITY_ID = GITHUB_RAW_PREFIX + "schemas/entities/sample/schema.json"
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _write_repo(repo: Path) -> None:
+    _write_json(
+        repo / "schemas" / "common" / "schema.json",
+        {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$id": GITHUB_RAW_PREFIX + "schemas/common/schema.json",
+            "$defs": {
+                "term": {
+                    "type": "object",
+                    "required": ["id"],
+                    "properties": {
+                        "id": {"type": "string", "graphRestriction": {"ontologies": ["obo:efo"]}}
+                    },
+                }
+            },
+        },
+    )
+    _write_json(
+        repo / "schemas" / "entities" / "sample" / "schema.json",
+        {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$id": ENTITY_ID,
+            "type": "object",
+            "required": ["label"],
+            "properties": {
+                "label": {"type": "string"},
+                "disease": {"$ref": "../../common/schema.json#/$defs/term"},
+            },
+        },
+    )
+
+
+def test_local_validator_matches_example_expectations() -> None:
+    """Check the cohort examples pass/fail locally as they do in Biovalidator."""
+    validator = LocalValidator(REPO_ROOT)
+    examples = REPO_ROOT / "schemas" / "entities" / "cohort" / "examples"
+
+    for category, expected in (("valid", VALID_STATUS), ("invalid", INVALID_STATUS)):
+        for path in sorted((examples / category).glob("*.json")):
+            response = validator.validate(load_wrapped_example(path))
+            assert classify_response(response) == expected, path.name
+
+    assert validator.stats()["compiled_schemas"] == 1
+
+
+def test_local_validator_reports_errors_and_defers_ontology_keywords(tmp_path: Path) -> None:
+    """Check errors use the Biovalidator shape and graphRestriction is only counted."""
+    _write_repo(tmp_path)
+    validator = LocalValidator(tmp_path)
+
+    valid = {"schema": {"$ref": ENTITY_ID}, "data": {"label": "x", "disease": {"id": "EFO:1"}}}
+    invalid = {"schema": {"$ref": ENTITY_ID}, "data": {"label": 1, "disease": {}}}
+
+    assert validator.validate(valid) == []
+    assert validator.validate(invalid) == [
+        {"dataPath": "/disease", "errors": ["'id' is a required property"]},
+        {"dataPath": "/label", "errors": ["1 is not of type 'string'"]},
+    ]
+    assert validator.stats()["deferred_checks"] == {"graphRestriction": 1}
+
+
+def test_local_validator_returns_unknown_schemas_as_errors(tmp_path: Path) -> None:
+    """Check unresolvable schemas surface per document instead of aborting a run."""
+    _write_repo(tmp_path)
+    validator = LocalValidator(tmp_path)
+
+    results = validator.validate_many(
+        [
+            {"schema": {"$ref": "https://example.org/missing.json"}, "data": {}},
+            {"schema": {"$ref": ENTITY_ID}, "data": {"label": "x"}},
+        ]
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] == []
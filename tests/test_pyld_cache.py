@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pyld import jsonld
+
+from fega_tools.jsonld_utils import freeze_json
+from fega_tools.pyld_cache import PyLDContextCache, stable_context_key
+
+CONTEXT = freeze_json(
+    [
+        {"ega": "https://identifiers.org/ega:", "dct": "http://purl.org/dc/terms/"},
+        {"title": "dct:title", "dataset": {"@id": "ega:dataset", "@type": "@id"}},
+    ]
+)
+
+
+def test_shared_options_leave_pyld_results_unchanged() -> None:
+    """Check PyLD calls give the same results with the cache's options."""
+    cache = PyLDContextCache()
+    document = {"@context": CONTEXT, "@id": "ega:EGAD1", "title": "A", "dataset": "ega:EGAD2"}
+
+    first = jsonld.expand(document, options=cache.options())
+    second = jsonld.to_rdf(document, options=cache.options(format="application/n-quads"))
+
+    assert first == jsonld.expand(document)
+    assert second == jsonld.to_rdf(document, options={"format": "application/n-quads"})
+    assert "contextResolver" not in cache.options()
+
+
+def test_node_identifier_expansion_is_memoized() -> None:
+    """Check compact and absolute ids expand alike and repeat lookups hit the memo."""
+    cache = PyLDContextCache()
+
+    compact = cache.expand_node_identifier("ega:EGAD1", CONTEXT)
+    absolute = cache.expand_node_identifier("https://identifiers.org/ega:EGAD1", CONTEXT)
+    again = cache.expand_node_identifier("ega:EGAD1", freeze_json(list(CONTEXT)))
+
+    assert compact == absolute == again == "https://identifiers.org/ega:EGAD1"
+    assert cache.expand_node_identifier("ega:x", {"ega": 1}) is None
+    stats = cache.stats()
+    assert (stats["node_id_expansion_misses"], stats["node_id_expansion_hits"]) == (3, 1)
+    assert stable_context_key(CONTEXT) == stable_context_key([dict(item) for item in CONTEXT])
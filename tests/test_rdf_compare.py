@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from pyld import jsonld
+
+from fega_tools.rdf_compare import RDFComparator, RDFDataset, compare_datasets
+
+CONTEXT = {"ex": "https://example.org/", "name": "ex:name", "part": {"@id": "ex:part"}}
+
+
+def _dataset(document: Dict[str, Any]) -> RDFDataset:
+    return RDFDataset(jsonld.to_rdf({"@context": CONTEXT, **document}))
+
+
+def _canonical_equal(left: RDFDataset, right: RDFDataset) -> bool:
+    return left.canonical() == right.canonical()
+
+
+def test_invariants_decide_without_canonicalization() -> None:
+    """Check ground graphs and uniquely described blank nodes need no URDNA2015."""
+    ground = _dataset({"@id": "ex:a", "name": "A"})
+    assert compare_datasets(ground, _dataset({"@id": "ex:a", "name": "A"})) == (True, "invariants")
+    assert compare_datasets(ground, _dataset({"@id": "ex:a", "name": "B"})) == (False, "invariants")
+
+    nested = _dataset({"@id": "ex:a", "part": [{"name": "x"}, {"name": "y"}]})
+    reordered = _dataset({"@id": "ex:a", "part": [{"name": "y"}, {"name": "x"}]})
+    changed = _dataset({"@id": "ex:a", "part": [{"name": "x"}, {"name": "z"}]})
+    assert compare_datasets(nested, reordered) == (True, "signatures")
+    assert compare_datasets(nested, changed) == (False, "signatures")
+    assert _canonical_equal(nested, reordered) and not _canonical_equal(nested, changed)
+
+
+def test_tied_blank_nodes_fall_back_to_urdna2015() -> None:
+    """Check blank nodes with identical neighbourhoods are compared canonically."""
+    # Both parts look the same at first degree; only their children differ.
+    left = _dataset(
+        {"@id": "ex:a", "part": [{"part": {"name": "x"}}, {"part": {"name": "y"}}]}
+    )
+    right = _dataset(
+        {"@id": "ex:a", "part": [{"part": {"name": "y"}}, {"part": {"name": "x"}}]}
+    )
+    comparator = RDFComparator()
+
+    assert compare_datasets(left, right) == (None, "signatures")
+    assert comparator.equivalent(left, right)
+    assert comparator.stats() == {
+        "decided_by_invariants": 0,
+        "decided_by_signatures": 0,
+        "decided_by_urdna2015": 1,
+    }
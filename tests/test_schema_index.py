@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+from fega_tools.jsonld_utils import build_id_to_path_map
+from fega_tools.schema_index import SchemaIndex
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _touch_later(path: Path, seconds: int = 10) -> None:
+    """Move a path's mtime forward so changes are visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def _write_entity(repo: Path, entity: str) -> Path:
+    entity_dir = repo / "schemas" / "entities" / entity
+    _write_json(entity_dir / "schema.json", {"$id": f"https://example.org/{entity}/schema.json"})
+    _write_json(entity_dir / "context.jsonld", {"@context": {}})
+    return entity_dir
+
+
+def test_index_matches_build_id_to_path_map(tmp_path: Path) -> None:
+    """Check a fresh and a reused snapshot give the same map as a full walk."""
+    expected = build_id_to_path_map(REPO_ROOT)
+
+    first = SchemaIndex(REPO_ROOT, tmp_path / "index.json")
+    assert first.load() == expected
+    assert first.full_rebuild
+
+    second = SchemaIndex(REPO_ROOT, tmp_path / "index.json")
+    assert second.load() == expected
+    assert second.stats()["reparsed_files"] == 0
+    assert second.stats()["rescanned_directories"] == 0
+
+
+def test_index_refreshes_only_changed_entries(tmp_path: Path) -> None:
+    """Check edited, added and removed files are picked up incrementally."""
+    cohort_dir = _write_entity(tmp_path, "cohort")
+    study_dir = _write_entity(tmp_path, "study")
+    SchemaIndex(tmp_path).load()
+
+    _write_json(cohort_dir / "schema.json", {"$id": "https://example.org/renamed/schema.json"})
+    _touch_later(cohort_dir / "schema.json")
+    dataset_dir = _write_entity(tmp_path, "dataset")
+    shutil.rmtree(study_dir)
+    _touch_later(tmp_path / "schemas" / "entities")
+
+    index = SchemaIndex(tmp_path)
+    id_map = index.load()
+
+    assert id_map == build_id_to_path_map(tmp_path)
+    assert "https://example.org/renamed/schema.json" in id_map
+    assert "https://example.org/cohort/schema.json" not in id_map
+    assert id_map["https://example.org/dataset/schema.json"] == dataset_dir / "schema.json"
+    assert "https://example.org/study/schema.json" not in id_map
+    stats = index.stats()
+    assert not stats["full_rebuild"]
+    assert stats["reparsed_files"] == 3  # edited cohort schema, new dataset schema + context
+    assert stats["reused_files"] == 1  # unchanged cohort context
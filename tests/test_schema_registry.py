@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from fega_tools.jsonld_coverage import collect_schema_property_paths
+from fega_tools.jsonld_utils import build_id_to_path_map, materialize_context
+from fega_tools.schema_registry import SchemaRegistry
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENTITY_ID = "https://example.org/schemas/entities/sample/schema.json"
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _write_repo(repo: Path) -> Path:
+    _write_json(
+        repo / "schemas" / "common" / "schema.json",
+        {"$defs": {"label": {"properties": {"text": {"type": "string"}}}}},
+    )
+    _write_json(repo / "schemas" / "common" / "context.jsonld", {"@context": {"ex": "https://example.org/"}})
+    entity_dir = repo / "schemas" / "entities" / "sample"
+    _write_json(
+        entity_dir / "schema.json",
+        {
+            "$id": ENTITY_ID,
+            "@context": "./context.jsonld",
+            "properties": {
+                "label": {"$ref": "../../common/schema.json#/$defs/label"},
+                "alias": {"$ref": "../../common/schema.json#/$defs/label"},
+            },
+        },
+    )
+    _write_json(
+        entity_dir / "context.jsonld",
+        {"@context": ["../../common/context.jsonld", {"label": "ex:label"}]},
+    )
+    return entity_dir
+
+
+def test_registry_maps_the_same_ids_as_build_id_to_path_map() -> None:
+    """Check the registry can stand in for the plain $id -> path map."""
+    registry = SchemaRegistry.from_repo(REPO_ROOT, use_index=False)
+
+    assert dict(registry) == build_id_to_path_map(REPO_ROOT)
+
+
+def test_registry_parses_each_file_once_and_caches_fragments(tmp_path: Path) -> None:
+    """Check schema traversal and context materialization reuse parsed files."""
+    entity_dir = _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path)
+    schema_path = entity_dir / "schema.json"
+
+    for _ in range(2):
+        paths = collect_schema_property_paths(
+            registry.load_json(schema_path), schema_path, registry, tmp_path
+        )
+        context = materialize_context("./context.jsonld", schema_path, registry)
+
+    assert paths == collect_schema_property_paths(
+        registry.load_json(schema_path), schema_path, build_id_to_path_map(tmp_path), tmp_path
+    )
+    assert context == [{"ex": "https://example.org/"}, {"label": "ex:label"}]
+    assert registry.parsed_files == 4
+    stats = registry.stats()
+    assert stats["fragment_misses"] == 1
+    assert stats["fragment_hits"] == 3
+    assert registry.resolve("../../common/schema.json#/$defs/label", schema_path) == {
+        "properties": {"text": {"type": "string"}}
+    }
+
+
+def test_context_materialization_is_memoized_and_read_only(tmp_path: Path) -> None:
+    """Check shared contexts are built once, recorded in the DAG and frozen."""
+    entity_dir = _write_repo(tmp_path)
+    registry = SchemaRegistry.from_repo(tmp_path)
+    common = (tmp_path / "schemas" / "common" / "context.jsonld").resolve()
+    entity_context = (entity_dir / "context.jsonld").resolve()
+
+    first = materialize_context("./context.jsonld", entity_dir / "schema.json", registry)
+    second = materialize_context(["./context.jsonld"], entity_dir / "example.json", registry)
+    assert first == second == [{"ex": "https://example.org/"}, {"label": "ex:label"}]
+
+    stats = registry.contexts.stats()
+    assert (stats["misses"], stats["hits"]) == (2, 1)
+    assert registry.contexts.import_graph() == {str(common): [], str(entity_context): [str(common)]}
+    assert registry.contexts.dependents(common) == {entity_context}
+
+    with pytest.raises(TypeError):
+        first[0]["ex"] = "https://example.com/"
+    editable = copy.deepcopy(first)
+    editable[0]["ex"] = "https://example.com/"
+    assert second[0]["ex"] == "https://example.org/"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_ROOT = REPO_ROOT / "scripts" / "py"
+if str(SCRIPT_ROOT) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_ROOT))
+
+import requests
+import validate_examples
+from fega_tools.local_validator import LocalValidator
+
+
+def test_concurrent_validation_keeps_input_order(tmp_path: Path) -> None:
+    """Results from a thread pool must follow the input order, not completion order."""
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"example-{index}.json"
+        path.write_text(
+            json.dumps({"schema": {"$ref": "schema.json"}, "data": {"index": index}}),
+            encoding="utf-8",
+        )
+        paths.append(path)
+
+    class FakeClient:
+        url = "http://validator.test"
+
+        def validate(self, document):
+            # Earlier files answer later, so completion order is reversed.
+            time.sleep(0.01 * (6 - document["data"]["index"]))
+            return [] if document["data"]["index"] % 2 == 0 else [{"errors": ["bad"]}]
+
+    results = validate_examples.validate_files(paths, FakeClient(), jobs=4)
+
+    assert [result["file"] for result in results] == [str(path) for path in paths]
+    assert [result["status"] for result in results] == [
+        "validation_passed",
+        "validation_failed",
+    ] * 3
+    timing = validate_examples.summarize_timing(results, 4, 0.5)
+    assert timing["requests"] == 6
+    assert timing["jobs"] == 4
+
+
+def test_local_schema_errors_are_script_errors(tmp_path: Path) -> None:
+    """Local engine schema failures keep their message instead of a response error."""
+    path = tmp_path / "example.json"
+    path.write_text(
+        json.dumps({"schema": {"$ref": "https://example.org/missing.json"}, "data": {}}),
+        encoding="utf-8",
+    )
+
+    result = validate_examples.validate_file(path, LocalValidator(tmp_path))
+
+    assert result["status"] == "script_error"
+    assert result["errors"] == [
+        "Schema 'https://example.org/missing.json' is not available in the local checkout"
+    ]
+
+
+def test_undecodable_responses_are_malformed(tmp_path: Path) -> None:
+    """A JSON decode failure from the HTTP client is not a request error."""
+    path = tmp_path / "example.json"
+    path.write_text(json.dumps({"schema": {"$ref": "schema.json"}, "data": {}}), encoding="utf-8")
+
+    class FakeClient:
+        url = "http://validator.test"
+
+        def validate(self, document):
+            raise requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+
+    result = validate_examples.validate_file(path, FakeClient())
+
+    assert result["status"] == "unknown_response"
+    assert result["errors"][0].startswith("Malformed validator response: ")
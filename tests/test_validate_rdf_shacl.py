@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import json
+import logging
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 import pytest
+from rdflib import Graph
+
+from fega_tools.jsonld_utils import freeze_json, replace_context
+from fega_tools.rdf_utils import (
+    RDF_STORES,
+    RdfStore,
+    ShaclValidator,
+    available_rdf_stores,
+    extract_violations_from_graph,
+    jsonld_to_rdf_graph,
+    shape_messages,
+    validate_against_shacl,
+)
+from fega_tools.validation_common import SCRIPT_ERROR_STATUS
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -11,7 +28,7 @@ SCRIPT_ROOT = REPO_ROOT / "scripts" / "py"
 if str(SCRIPT_ROOT) not in sys.path:
     sys.path.insert(0, str(SCRIPT_ROOT))
 
-from validate_rdf_shacl import root_has_required_type
+from validate_rdf_shacl import root_has_required_type, validate_file_shacl, validate_files_shacl
 
 
 CONTEXT = {
@@ -46,6 +63,199 @@ def test_nested_type_does_not_satisfy_root_requirement() -> None:
     assert not root_has_required_type(document, "http://www.w3.org/ns/dcat#Dataset")
 
 
+def test_graph_is_built_from_shared_document_without_copying() -> None:
+    """Check a read-only document converts directly once its context is replaced."""
+    document = freeze_json(
+        {"@context": "./context.jsonld", "@id": "http://example.org/dataset/1", "@type": "dcat:Dataset"}
+    )
+
+    data = replace_context(document, CONTEXT)
+    graph = jsonld_to_rdf_graph(data)
+
+    assert len(graph) == 1
+    assert document["@context"] == "./context.jsonld"
+    assert data["@type"] is document["@type"]
+
+
 def test_invalid_jsonld_context_is_reported() -> None:
     with pytest.raises(ValueError, match="Failed to expand JSON-LD"):
         root_has_required_type({"@context": "not a valid context reference"}, "dcat:Dataset")
+
+
+SHAPES_TTL = """
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix ex: <http://example.org/> .
+ex:ThingShape a sh:NodeShape ;
+    sh:targetClass ex:Thing ;
+    sh:property [ sh:path ex:label ; sh:minCount 1 ] .
+"""
+
+DATA_TTL = """
+@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+ex:Special rdfs:subClassOf ex:Thing .
+ex:labelled a ex:Special ; ex:label "a" .
+ex:unlabelled a ex:Special .
+"""
+
+
+def test_prepared_shapes_match_per_call_validation() -> None:
+    """Check a reused ShaclValidator reports what pyshacl reports per call."""
+    shapes = Graph().parse(data=SHAPES_TTL, format="turtle")
+    validator = ShaclValidator(shapes)
+
+    for _ in range(2):
+        per_call = validate_against_shacl(Graph().parse(data=DATA_TTL, format="turtle"), shapes)
+        prepared = validate_against_shacl(Graph().parse(data=DATA_TTL, format="turtle"), validator, inplace=True)
+        assert prepared[2] == per_call[2]
+        # RDFS inference makes ex:unlabelled a target of the ex:Thing shape.
+        assert per_call[0] is False
+
+    assert validator.stats()["validations"] == 2
+
+
+def test_pyshacl_internals_used_by_shacl_validator_are_available() -> None:
+    """Fail loudly if a pyshacl upgrade drops the internals ShaclValidator swaps in."""
+    from pyshacl import Validator
+    from pyshacl.monkey import apply_patches  # noqa: F401
+    from pyshacl.shapes_graph import ShapesGraph
+    from pyshacl.validator import assign_baked_in  # noqa: F401
+
+    data = Graph().parse(data=DATA_TTL, format="turtle")
+    validator = Validator(data, shacl_graph=Graph().parse(data=SHAPES_TTL, format="turtle"))
+    assert isinstance(getattr(validator, "shacl_graph", None), ShapesGraph), (
+        "pyshacl.Validator no longer exposes shacl_graph; ShaclValidator needs pyshacl==0.31.0"
+    )
+
+    # The swapped-in shapes are the ones evaluated: without shapes, nothing fails.
+    validator.shacl_graph = ShapesGraph(Graph(), False, logging.getLogger("pyshacl-validate"))
+    assert validator.run()[0] is True
+
+def test_batched_validation_matches_per_graph_validation() -> None:
+    """Check batched graphs get their own results, even when they share nodes."""
+    shapes = Graph().parse(data=SHAPES_TTL, format="turtle")
+    documents = [
+        '@prefix ex: <http://example.org/> . ex:a a ex:Thing ; ex:label "a" .',
+        "@prefix ex: <http://example.org/> . ex:b a ex:Thing .",
+        # Describes ex:a again: merged with the first graph it would conform.
+        "@prefix ex: <http://example.org/> . ex:a a ex:Thing .",
+        "@prefix ex: <http://example.org/> . ex:c a ex:Thing ; ex:seeAlso ex:a .",
+    ]
+    graphs = [Graph().parse(data=document, format="turtle") for document in documents]
+    validator = ShaclValidator(shapes)
+
+    reports = validator.validate_batch(graphs, batch_size=10)
+
+    assert [report["conforms"] for report in reports] == [True, False, False, False]
+    for graph, report in zip(graphs, reports):
+        assert report == validate_against_shacl(graph, shapes)[2]
+    # The last graph refers to ex:a, which both other batches describe.
+    assert (validator.stats()["validations"], validator.stats()["batched_graphs"]) == (3, 4)
+
+
+def _write_examples(directory: Path, labels: List[Optional[str]]) -> List[Path]:
+    """Write one wrapped ex:Thing example per label (None: no ex:label)."""
+    paths: List[Path] = []
+    for index, label in enumerate(labels):
+        data = {"@context": {"ex": "http://example.org/"}, "@id": f"ex:n{index}", "@type": "ex:Thing"}
+        if label is not None:
+            data["ex:label"] = label
+        path = directory / f"example_{index}.json"
+        path.write_text(json.dumps({"data": data, "schema": {}}), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_files_are_validated_one_batch_at_a_time(tmp_path: Path) -> None:
+    """Check batched file validation keeps per-file results and their order."""
+    paths = _write_examples(tmp_path, ["a", None, "c", None, "e"])
+    validator = ShaclValidator(Graph().parse(data=SHAPES_TTL, format="turtle"))
+
+    results = validate_files_shacl(paths, validator, {}, batch_size=2)
+
+    assert [result["file"] for result in results] == [str(path) for path in paths]
+    assert [result["conforms"] for result in results] == [True, False, True, False, True]
+    # Five files in batches of two: three pyshacl runs.
+    assert validator.stats()["validations"] == 3
+
+def test_file_validation_accepts_a_plain_shapes_graph(tmp_path: Path) -> None:
+    """Check a shapes Graph, whose rdflib store is no RdfStore, validates like a ShaclValidator."""
+    paths = _write_examples(tmp_path, ["a", None])
+    shapes = Graph().parse(data=SHAPES_TTL, format="turtle")
+    validator = ShaclValidator(shapes, store=RdfStore())
+
+    for path in paths:
+        per_call = validate_file_shacl(path, shapes, {})
+        assert per_call["status"] != SCRIPT_ERROR_STATUS
+        assert per_call["conforms"] == validate_file_shacl(path, validator, {})["conforms"]
+
+def test_shapes_are_pruned_to_the_types_of_the_data() -> None:
+    """Check only shapes targeting a (super)class of the data's types are evaluated."""
+    shapes = Graph().parse(data=SHAPES_TTL, format="turtle")
+    validator = ShaclValidator(shapes)
+    untargeted = Graph().parse(data="@prefix ex: <http://example.org/> . ex:x a ex:Other .", format="turtle")
+
+    assert validator.applicable_shapes(untargeted).shapes == []
+    assert len(validator.applicable_shapes(Graph().parse(data=DATA_TTL, format="turtle")).shapes) == 1
+    assert validate_against_shacl(untargeted, validator) == validate_against_shacl(untargeted, shapes)
+    assert validator.stats()["skipped_validations"] == 1
+
+
+def test_violations_fall_back_to_shape_messages() -> None:
+    """Check results without sh:resultMessage take the message of their source shape."""
+    results = Graph().parse(
+        data="""
+        @prefix sh: <http://www.w3.org/ns/shacl#> .
+        @prefix ex: <http://example.org/> .
+        ex:r1 a sh:ValidationResult ; sh:focusNode ex:a ; sh:sourceShape ex:Shape ;
+            sh:sourceConstraintComponent sh:MinCountConstraintComponent .
+        ex:r2 a sh:ValidationResult ; sh:focusNode ex:b ; sh:sourceShape ex:Shape ;
+            sh:resultMessage "Own message" .
+        """,
+        format="turtle",
+    )
+    shapes = Graph().parse(
+        data='@prefix sh: <http://www.w3.org/ns/shacl#> . <http://example.org/Shape> sh:message "Shape message" .',
+        format="turtle",
+    )
+
+    violations = sorted(
+        extract_violations_from_graph(results, shape_messages(shapes)), key=lambda v: v["focusNode"]
+    )
+
+    assert violations[0] == {
+        "focusNode": "http://example.org/a",
+        "sourceShape": "http://example.org/Shape",
+        "message": "Shape message",
+        "constraint_type": "MinCountConstraintComponent",
+    }
+    assert violations[1]["message"] == "Own message"
+    # Without the shapes' messages only the results graph itself is searched.
+    by_focus = {violation["focusNode"]: violation for violation in extract_violations_from_graph(results)}
+    assert "message" not in by_focus["http://example.org/a"]
+
+
+@pytest.mark.parametrize("backend", available_rdf_stores())
+def test_rdf_store_backends_match_in_memory_validation(backend: str, tmp_path: Path) -> None:
+    """Check data graphs on every installed RDF store validate like in-memory ones."""
+    shapes = Graph().parse(data=SHAPES_TTL, format="turtle")
+    store = RdfStore(backend, tmp_path)
+    validator = ShaclValidator(shapes, store=store)
+    expected = validate_against_shacl(Graph().parse(data=DATA_TTL, format="turtle"), shapes)[2]
+
+    data_graph = store.graph().parse(data=DATA_TTL, format="turtle")
+    assert validate_against_shacl(data_graph, validator, inplace=True)[2] == expected
+    assert validator.validate_batch([Graph().parse(data=DATA_TTL, format="turtle")])[0] == expected
+
+    document = {"@context": CONTEXT, "@id": "http://example.org/dataset/1", "@type": "dcat:Dataset"}
+    assert len(jsonld_to_rdf_graph(document, store=store)) == 1
+    assert store.stats() == {"backend": backend, "graphs": 3}
+
+
+def test_unknown_or_missing_rdf_store_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown RDF store"):
+        RdfStore("sqlite")
+    missing = [backend for backend in RDF_STORES if backend not in available_rdf_stores()]
+    for backend in missing:
+        with pytest.raises(ValueError, match="pip install"):
+            RdfStore(backend)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from fega_tools.jsonld_utils import build_id_to_path_map
+from fega_tools.validation_cache import (
+    ValidationCache,
+    add_cache_arguments,
+    cache_from_args,
+    schema_dependency_paths,
+)
+
+ENTITY_ID = "https://example.org/schemas/entities/sample/schema.json"
+
+
+def _write_json(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+def _write_repo(repo: Path) -> Path:
+    common = repo / "schemas" / "common" / "schema.json"
+    _write_json(common, {"$defs": {"label": {"type": "string"}}})
+    _write_json(
+        repo / "schemas" / "entities" / "sample" / "schema.json",
+        {
+            "$id": ENTITY_ID,
+            "properties": {"label": {"$ref": "../../common/schema.json#/$defs/label"}},
+        },
+    )
+    return common
+
+
+def _wrapper(label: str) -> dict:
+    return {"schema": {"$ref": ENTITY_ID}, "data": {"label": label}}
+
+
+def test_schema_dependencies_follow_relative_refs(tmp_path: Path) -> None:
+    """Check the entity schema and its referenced common schema are both tracked."""
+    common = _write_repo(tmp_path)
+
+    paths, unresolved = schema_dependency_paths(ENTITY_ID, build_id_to_path_map(tmp_path))
+
+    assert common.resolve() in paths
+    assert len(paths) == 2
+    assert unresolved == []
+
+
+def test_cache_key_changes_with_referenced_schema(tmp_path: Path) -> None:
+    """Check a stored result is reused until a transitively referenced schema changes."""
+    common = _write_repo(tmp_path)
+    cache_dir = tmp_path / "cache"
+    cache = ValidationCache(cache_dir, build_id_to_path_map(tmp_path))
+
+    key = cache.key_for(_wrapper("a"), "http://validator.test")
+    assert cache.get(key) is None
+    cache.put(key, "validation_failed", [{"dataPath": "/label", "errors": ["bad"]}])
+    assert cache.get(key) == {
+        "status": "validation_failed",
+        "errors": [{"dataPath": "/label", "errors": ["bad"]}],
+    }
+    assert cache.key_for(_wrapper("b"), "http://validator.test") != key
+
+    _write_json(common, {"$defs": {"label": {"type": "integer"}}})
+    fresh_cache = ValidationCache(cache_dir, build_id_to_path_map(tmp_path))
+    assert fresh_cache.key_for(_wrapper("a"), "http://validator.test") != key
+
+
+def test_cache_skips_unmapped_schemas_and_request_errors(tmp_path: Path) -> None:
+    """Check remote schemas and non-definitive outcomes are never cached."""
+    _write_repo(tmp_path)
+    cache = ValidationCache(tmp_path / "cache", build_id_to_path_map(tmp_path))
+
+    remote = {"schema": {"$ref": "https://elsewhere.test/schema.json"}, "data": {}}
+    assert cache.key_for(remote, "http://validator.test") is None
+
+    key = cache.key_for(_wrapper("a"), "http://validator.test")
+    cache.put(key, "request_error", ["timeout"])
+    assert cache.get(key) is None
+
+
+def test_prune_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Check eviction keeps the most recently read entries."""
+    _write_repo(tmp_path)
+    cache = ValidationCache(
+        tmp_path / "cache",
+        build_id_to_path_map(tmp_path),
+        max_entries=2,
+    )
+    keys = [cache.key_for(_wrapper(label), "v") for label in "abc"]
+    for age, key in enumerate(keys):
+        cache.put(key, "validation_passed", [])
+        entry = cache._entry_path(key)
+        os.utime(entry, (1000 + age, 1000 + age))
+
+    cache.get(keys[0])  # refresh the oldest entry
+
+    assert cache.prune() == 1
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_cache_is_opt_in_and_salted(tmp_path: Path) -> None:
+    """Check caching needs --cache-dir and --cache-salt changes every key."""
+    _write_repo(tmp_path)
+    id_to_path_map = build_id_to_path_map(tmp_path)
+    parser = argparse.ArgumentParser()
+    add_cache_arguments(parser)
+    cache_dir = str(tmp_path / "cache")
+
+    assert cache_from_args(parser.parse_args([]), id_to_path_map) is None
+    assert cache_from_args(parser.parse_args(["--cache-dir", cache_dir, "--no-cache"]), id_to_path_map) is None
+    unsalted = cache_from_args(parser.parse_args(["--cache-dir", cache_dir]), id_to_path_map)
+    salted = cache_from_args(parser.parse_args(["--cache-dir", cache_dir, "--cache-salt", "2.1"]), id_to_path_map)
+    assert unsalted is not None and salted is not None
+    assert unsalted.key_for(_wrapper("a"), "v") != salted.key_for(_wrapper("a"), "v")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import argparse
 import json
+import os
+
+import pytest
 
 from fega_tools.validation_common import (
     BASIC_COUNT_KEYS,
+    DocumentCache,
     add_counts,
     coverage_gaps_for_entity_category,
     empty_counts,
     find_entity_dirs,
     find_example_coverage_gaps,
     load_wrapped_example,
+    non_negative_int,
+    positive_float,
+    positive_int,
 )
 
 
@@ -52,3 +60,59 @@ def test_find_entity_dirs_and_load_wrapped_example(tmp_path) -> None:
     assert find_entity_dirs(tmp_path, None) == [entity]
     assert find_entity_dirs(tmp_path, "dataset", require_schema=True) == [entity]
     assert load_wrapped_example(example)["data"] == {"@type": "x"}
+
+
+def test_document_cache_parses_once_until_the_file_changes(tmp_path) -> None:
+    """Check cached documents are shared, read-only and refreshed on edits."""
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text(json.dumps({"data": {"n": 1}, "schema": {}}), encoding="utf-8")
+    second.write_text(json.dumps({"data": {"n": 2}, "schema": {}}), encoding="utf-8")
+    cache = DocumentCache(max_bytes=first.stat().st_size + second.stat().st_size)
+
+    document = cache.load(first)
+    assert cache.load(first) is document
+    with pytest.raises(TypeError):
+        document["data"]["n"] = 3
+
+    first.write_text(json.dumps({"data": {"n": 10}, "schema": {}}), encoding="utf-8")
+    os.utime(first, ns=(0, 0))
+    assert cache.load(first)["data"]["n"] == 10
+    cache.load(second)
+    assert cache.stats() == {
+        "cached_documents": 1,
+        "cached_bytes": second.stat().st_size,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }
+
+
+def test_document_cache_can_match_touched_files_by_content(tmp_path) -> None:
+    """Check verify_content reuses the parse when only the mtime changed."""
+    path = tmp_path / "example.json"
+    path.write_text("{}", encoding="utf-8")
+    cache = DocumentCache(verify_content=True)
+
+    document = cache.load(path)
+    os.utime(path, ns=(0, 0))
+
+    assert cache.load(path) is document
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_positive_int_rejects_zero_and_negative_values() -> None:
+    assert positive_int("3") == 3
+    for value in ("0", "-2"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+
+def test_non_negative_int_and_positive_float_reject_out_of_range_values() -> None:
+    assert non_negative_int("0") == 0
+    assert positive_float("0.5") == 0.5
+    with pytest.raises(argparse.ArgumentTypeError):
+        non_negative_int("-1")
+    for value in ("0", "-1.5", "nan"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_float(value)